@@ -22,6 +22,7 @@ logger = structlog.get_logger(__name__)
 BASE_URL = "https://data.sec.gov"
 ARCHIVES_URL = "https://www.sec.gov/Archives/edgar/data"
 TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+EDGAR_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=10)
 
 
 class EdgarClient:
@@ -38,6 +39,21 @@ class EdgarClient:
         self.cache = cache
         self._semaphore = asyncio.Semaphore(10)  # 10 req/s rate limit
         self._ticker_map: dict[str, str] | None = None
+        self._http: httpx.AsyncClient | None = None
+
+    def _client(self) -> httpx.AsyncClient:
+        """Return the client's pooled HTTP session, opening it on first use."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                headers=self._headers(), timeout=30.0, limits=EDGAR_LIMITS
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP session, if one was opened."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     def _headers(self) -> dict[str, str]:
         """Return HTTP headers required by SEC EDGAR."""
@@ -56,12 +72,9 @@ class EdgarClient:
         with exponential backoff on HTTP errors and connection failures.
         """
         async with self._semaphore:
-            async with httpx.AsyncClient(
-                headers=self._headers(), timeout=30.0
-            ) as client:
-                resp = await client.get(url)
-                resp.raise_for_status()
-                return resp
+            resp = await self._client().get(url)
+            resp.raise_for_status()
+            return resp
 
     async def ticker_to_cik(self, ticker: str) -> str:
         """Resolve ticker symbol to zero-padded 10-digit CIK.
@@ -13,6 +13,7 @@ from zaza.cache.store import FileCache
 logger = structlog.get_logger(__name__)
 
 FRED_BASE = "https://api.stlouisfed.org/fred"
+FRED_LIMITS = httpx.Limits(max_connections=8, max_keepalive_connections=8)
 
 
 class FredClient:
@@ -21,6 +22,19 @@ class FredClient:
     def __init__(self, api_key: str, cache: FileCache) -> None:
         self.api_key = api_key
         self.cache = cache
+        self._http: httpx.AsyncClient | None = None
+
+    def _client(self) -> httpx.AsyncClient:
+        """Return the client's pooled HTTP session, opening it on first use."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(timeout=15.0, limits=FRED_LIMITS)
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP session, if one was opened."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def get_series(
         self, series_id: str, start_date: str | None = None, end_date: str | None = None
@@ -45,10 +59,9 @@ class FredClient:
             params["observation_end"] = end_date
 
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                resp = await client.get(f"{FRED_BASE}/series/observations", params=params)
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await self._client().get(f"{FRED_BASE}/series/observations", params=params)
+            resp.raise_for_status()
+            data = resp.json()
             observations = data.get("observations", [])
             self.cache.set(cache_key, "economic_calendar", observations)
             return observations
@@ -67,19 +80,18 @@ class FredClient:
         end_date = today + dt.timedelta(days=days_ahead)
 
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                resp = await client.get(
-                    f"{FRED_BASE}/releases/dates",
-                    params={
-                        "api_key": self.api_key,
-                        "file_type": "json",
-                        "include_release_dates_with_no_data": "false",
-                        "realtime_start": today.isoformat(),
-                        "realtime_end": end_date.isoformat(),
-                    },
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await self._client().get(
+                f"{FRED_BASE}/releases/dates",
+                params={
+                    "api_key": self.api_key,
+                    "file_type": "json",
+                    "include_release_dates_with_no_data": "false",
+                    "realtime_start": today.isoformat(),
+                    "realtime_end": end_date.isoformat(),
+                },
+            )
+            resp.raise_for_status()
+            data = resp.json()
             all_releases = data.get("release_dates", [])
             # Deduplicate: keep only the earliest date per release_id
             seen: dict[str, dict[str, Any]] = {}
@@ -0,0 +1,25 @@
+"""Process-wide shared API clients.
+
+Tool modules use these accessors instead of building their own ``FileCache``
+and ``YFinanceClient`` in each ``register()``, so every tool shares one cache
+handle and one client.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from zaza.api.yfinance_client import YFinanceClient
+from zaza.cache.store import FileCache
+
+
+@lru_cache(maxsize=1)
+def get_cache() -> FileCache:
+    """Return the shared FileCache for the default cache directory."""
+    return FileCache()
+
+
+@lru_cache(maxsize=1)
+def get_yf() -> YFinanceClient:
+    """Return the shared YFinanceClient backed by :func:`get_cache`."""
+    return YFinanceClient(get_cache())
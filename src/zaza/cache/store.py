@@ -2,7 +2,9 @@
 
 import json
 import re
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 
 import structlog
@@ -11,13 +13,24 @@ from zaza.config import CACHE_DIR, CACHE_TTL
 
 logger = structlog.get_logger(__name__)
 
+# Entries kept in the in-process tier in front of the cache files
+_MEMORY_ENTRIES = 128
+
 
 class FileCache:
-    """SQLite-free file-based cache storing JSON responses with TTL."""
+    """SQLite-free file-based cache storing JSON responses with TTL.
+
+    Entries read back from disk are also kept in a small in-process LRU, keyed
+    by file name, so repeated lookups of a hot key skip the file read. Writes
+    evict the memory copy, keeping the files the source of truth.
+    """
 
     def __init__(self, cache_dir: Path = CACHE_DIR) -> None:
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # file name -> (cached_at, category, text)
+        self._memory: OrderedDict[str, tuple[float, str, str]] = OrderedDict()
+        self._memory_lock = threading.Lock()
 
     @staticmethod
     def make_key(endpoint: str, **params: object) -> str:
@@ -34,19 +47,53 @@ class FileCache:
     def _path(self, key: str) -> Path:
         return self.cache_dir / f"{key}.json"
 
+    def _raw_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.raw"
+
+    def _memory_get(self, name: str, category: str) -> str | None:
+        """Return the in-memory text for a cache file if present and fresh."""
+        with self._memory_lock:
+            entry = self._memory.get(name)
+            if entry is None:
+                return None
+            cached_at, _, text = entry
+            if time.time() - cached_at > CACHE_TTL.get(category, 3600):
+                del self._memory[name]
+                return None
+            self._memory.move_to_end(name)
+            return text
+
+    def _memory_put(self, name: str, cached_at: float, category: str, text: str) -> None:
+        with self._memory_lock:
+            self._memory[name] = (cached_at, category, text)
+            self._memory.move_to_end(name)
+            if len(self._memory) > _MEMORY_ENTRIES:
+                self._memory.popitem(last=False)
+
+    def _memory_drop(self, *names: str) -> None:
+        with self._memory_lock:
+            for name in names:
+                self._memory.pop(name, None)
+
     def get(self, key: str, category: str) -> dict | list | None:
         """Return cached data if TTL is valid, None otherwise."""
         path = self._path(key)
+        text = self._memory_get(path.name, category)
+        if text is not None:
+            logger.debug("cache_hit", key=key, category=category, tier="memory")
+            return json.loads(text)["data"]
         if not path.exists():
             logger.debug("cache_miss", key=key, reason="not_found")
             return None
         try:
-            raw = json.loads(path.read_text())
+            text = path.read_text()
+            raw = json.loads(text)
             ttl = CACHE_TTL.get(category, 3600)
             if time.time() - raw["cached_at"] > ttl:
                 path.unlink(missing_ok=True)
                 logger.debug("cache_miss", key=key, reason="expired")
                 return None
+            self._memory_put(path.name, raw["cached_at"], category, text)
             logger.debug("cache_hit", key=key, category=category)
             return raw["data"]
         except (json.JSONDecodeError, KeyError, OSError):
@@ -58,27 +105,81 @@ class FileCache:
         """Write data to cache."""
         path = self._path(key)
         payload = {"cached_at": time.time(), "category": category, "data": data}
+        self._memory_drop(path.name)
         try:
             path.write_text(json.dumps(payload, default=str))
             logger.debug("cache_set", key=key, category=category)
         except OSError:
             logger.warning("cache_write_failed", key=key)
 
+    def get_raw(self, key: str, category: str) -> str | None:
+        """Return a cached pre-serialized payload if TTL is valid, None otherwise.
+
+        Raw entries are a one-line JSON header followed by the payload text, so
+        a hit hands back the stored string without decoding or re-encoding it.
+        """
+        path = self._raw_path(key)
+        payload = self._memory_get(path.name, category)
+        if payload is not None:
+            logger.debug("cache_hit", key=key, category=category, tier="memory")
+            return payload
+        if not path.exists():
+            logger.debug("cache_miss", key=key, reason="not_found")
+            return None
+        try:
+            header_line, _, payload = path.read_text().partition("\n")
+            header = json.loads(header_line)
+            ttl = CACHE_TTL.get(category, 3600)
+            if time.time() - header["cached_at"] > ttl:
+                path.unlink(missing_ok=True)
+                logger.debug("cache_miss", key=key, reason="expired")
+                return None
+            self._memory_put(path.name, header["cached_at"], category, payload)
+            logger.debug("cache_hit", key=key, category=category)
+            return payload
+        except (json.JSONDecodeError, KeyError, OSError):
+            path.unlink(missing_ok=True)
+            logger.warning("cache_corrupt", key=key)
+            return None
+
+    def set_raw(self, key: str, category: str, payload: str) -> None:
+        """Write an already-serialized payload to cache."""
+        path = self._raw_path(key)
+        header = json.dumps({"cached_at": time.time(), "category": category})
+        self._memory_drop(path.name)
+        try:
+            path.write_text(f"{header}\n{payload}")
+            logger.debug("cache_set", key=key, category=category)
+        except OSError:
+            logger.warning("cache_write_failed", key=key)
+
     def invalidate(self, key: str) -> None:
         """Remove a specific cache entry."""
-        path = self._path(key)
-        path.unlink(missing_ok=True)
+        self._memory_drop(self._path(key).name, self._raw_path(key).name)
+        self._path(key).unlink(missing_ok=True)
+        self._raw_path(key).unlink(missing_ok=True)
 
     def clear(self, category: str | None = None) -> int:
         """Clear all cache or a specific category. Returns count of removed files."""
         count = 0
-        for path in self.cache_dir.glob("*.json"):
+        with self._memory_lock:
+            if category is None:
+                self._memory.clear()
+            else:
+                for name in [n for n, e in self._memory.items() if e[1] == category]:
+                    del self._memory[name]
+        paths = [*self.cache_dir.glob("*.json"), *self.cache_dir.glob("*.raw")]
+        for path in paths:
             if category is None:
                 path.unlink(missing_ok=True)
                 count += 1
             else:
                 try:
-                    raw = json.loads(path.read_text())
+                    if path.suffix == ".raw":
+                        with path.open() as f:
+                            raw = json.loads(f.readline())
+                    else:
+                        raw = json.loads(path.read_text())
                     if raw.get("category") == category:
                         path.unlink(missing_ok=True)
                         count += 1
@@ -120,3 +120,19 @@ if ZAZA_MCP_TRANSPORT not in _VALID_TRANSPORTS:
     )
 if not (1 <= ZAZA_MCP_PORT <= 65535):
     raise ValueError(f"ZAZA_MCP_PORT must be in range 1-65535, got {ZAZA_MCP_PORT}")
+
+# Blocking yfinance calls run on the default executor via asyncio.to_thread.
+# They are network-bound, so the pool is sized well above the CPU-based default.
+_ZAZA_IO_THREADS_RAW = os.getenv("ZAZA_IO_THREADS", "32")
+try:
+    ZAZA_IO_THREADS = int(_ZAZA_IO_THREADS_RAW)
+except ValueError:
+    raise ValueError(
+        f"ZAZA_IO_THREADS must be a valid integer, got {_ZAZA_IO_THREADS_RAW!r}"
+    ) from None
+if ZAZA_IO_THREADS < 1:
+    raise ValueError(f"ZAZA_IO_THREADS must be at least 1, got {ZAZA_IO_THREADS}")
+
+# Set ZAZA_WARMUP=1 to import the heavy model libraries (statsmodels, arch, scipy)
+# in the background at startup instead of on the first quantitative tool call.
+ZAZA_WARMUP = os.getenv("ZAZA_WARMUP", "0") == "1"
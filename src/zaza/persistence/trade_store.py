@@ -29,7 +29,7 @@ _LIMIT_ORDER_FIELDS = (
 )
 
 # CR-02: Allowlist regex for plan_id to prevent path traversal
-_PLAN_ID_RE = re.compile(r"^[A-Za-z0-9_\-]{1,64}$")
+_PLAN_ID_RE = re.compile(r"[A-Za-z0-9_\-]{1,64}")
 
 
 def _safe_parse_xml(xml_string: str) -> ET.Element:
@@ -75,7 +75,7 @@ class TradeXmlStore:
         Raises:
             ValueError: If the plan_id contains invalid characters.
         """
-        if not _PLAN_ID_RE.match(plan_id):
+        if not _PLAN_ID_RE.fullmatch(plan_id):
             raise ValueError(f"Invalid plan_id format: {plan_id!r}")
 
     # ------------------------------------------------------------------
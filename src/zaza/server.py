@@ -6,16 +6,20 @@ Registers all 71 financial research tools organized across 12 domains.
 
 from __future__ import annotations
 
+import asyncio
 import importlib
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import structlog
 
 from zaza.config import (
+    ZAZA_IO_THREADS,
     ZAZA_MCP_HOST,
     ZAZA_MCP_PORT,
     ZAZA_MCP_TRANSPORT,
+    ZAZA_WARMUP,
     has_fred_key,
     has_reddit_credentials,
 )
@@ -38,7 +42,9 @@ structlog.configure(
         structlog.processors.format_exc_info,
         structlog.dev.ConsoleRenderer(),
     ],
-    wrapper_class=structlog.stdlib.BoundLogger,
+    # Filter below INFO in the bound logger itself so debug calls (e.g. per cache
+    # lookup) return before any processor or renderer runs.
+    wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
     context_class=dict,
     logger_factory=structlog.PrintLoggerFactory(file=sys.stderr),
     cache_logger_on_first_use=True,
@@ -101,6 +107,39 @@ def register_all_tools(mcp: object) -> int:
     return registered
 
 
+# Model libraries imported lazily by zaza.utils.models on first use
+WARMUP_MODULES: tuple[str, ...] = ("statsmodels.tsa.arima.model", "arch", "scipy.stats")
+
+
+def warm_up_model_imports() -> int:
+    """Import the lazily loaded model libraries ahead of the first tool call.
+
+    Missing libraries are logged and skipped; the tools that need them
+    report the import error when called.
+
+    Returns:
+        The number of modules imported.
+    """
+    imported = 0
+    for module_path in WARMUP_MODULES:
+        try:
+            importlib.import_module(module_path)
+            imported += 1
+        except ImportError as e:
+            logger.warning("warmup_import_failed", module=module_path, error=str(e))
+    logger.info("warmup_complete", modules_imported=imported)
+    return imported
+
+
+def _log_warmup_failure(future: asyncio.Future[int]) -> None:
+    """Done-callback for the background warm-up: log any unexpected failure."""
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        logger.error("warmup_failed", error=str(exc), exc_info=exc)
+
+
 def log_optional_clients() -> None:
     """Log which optional API clients are available.
 
@@ -155,6 +194,14 @@ async def main() -> None:
         return
 
     logger.info("zaza_server_starting", transport=ZAZA_MCP_TRANSPORT)
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=ZAZA_IO_THREADS, thread_name_prefix="zaza-io")
+    )
+    if ZAZA_WARMUP:
+        # Runs alongside the server; an early tool call simply waits on the import lock
+        warmup = loop.run_in_executor(None, warm_up_model_imports)
+        warmup.add_done_callback(_log_warmup_failure)
     log_optional_clients()
     mcp = _create_server()
 
@@ -170,6 +217,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    import asyncio
-
     asyncio.run(main())
@@ -10,14 +10,12 @@ Provides:
 
 from __future__ import annotations
 
-import json
-import re
-
 import structlog
 from mcp.server.fastmcp import FastMCP
 
 from zaza.config import PREDICTIONS_DIR
-from zaza.utils.predictions import _load_prediction_files
+from zaza.utils.jsonio import dumps, error_json
+from zaza.utils.predictions import TICKER_RE, _load_prediction_files
 
 logger = structlog.get_logger(__name__)
 
@@ -54,20 +52,14 @@ def register(mcp: FastMCP) -> None:
                            If None, returns the most recent prediction for this ticker.
             original_only: If True, filter out revision entries (is_revision=True).
         """
-        if not re.match(r"^[A-Z]{1,10}$", ticker.upper()):
-            return json.dumps(
-                {"status": "error", "error": f"Invalid ticker format: {ticker}"},
-                default=str,
-            )
+        if not TICKER_RE.fullmatch(ticker.upper()):
+            return error_json(f"Invalid ticker format: {ticker}", status=True)
         ticker = ticker.upper()
 
         try:
             entries = _load_prediction_files(PREDICTIONS_DIR, ticker=ticker)
             if not entries:
-                return json.dumps(
-                    {"status": "error", "error": f"No predictions found for {ticker}"},
-                    default=str,
-                )
+                return error_json(f"No predictions found for {ticker}", status=True)
 
             # Filter out revisions when original_only is requested
             if original_only:
@@ -76,10 +68,7 @@ def register(mcp: FastMCP) -> None:
                     if not data.get("is_revision", False)
                 ]
                 if not entries:
-                    return json.dumps(
-                        {"status": "error", "error": f"No original predictions found for {ticker}"},
-                        default=str,
-                    )
+                    return error_json(f"No original predictions found for {ticker}", status=True)
 
             if prediction_date:
                 # Filter by specific date
@@ -88,12 +77,9 @@ def register(mcp: FastMCP) -> None:
                     if data.get("prediction_date") == prediction_date
                 ]
                 if not matched:
-                    return json.dumps(
-                        {
-                            "status": "error",
-                            "error": f"No prediction found for {ticker} on {prediction_date}",
-                        },
-                        default=str,
+                    return error_json(
+                        f"No prediction found for {ticker} on {prediction_date}",
+                        status=True,
                     )
                 # Sort by (prediction_date, revision_number) descending
                 matched.sort(key=_sort_key, reverse=True)
@@ -103,13 +89,12 @@ def register(mcp: FastMCP) -> None:
                 entries.sort(key=_sort_key, reverse=True)
                 _, prediction_data = entries[0]
 
-            return json.dumps(
+            return dumps(
                 {"status": "ok", "data": prediction_data},
-                default=str,
             )
         except Exception as e:
             logger.warning("get_prediction_error", error=str(e))
-            return json.dumps({"status": "error", "error": str(e)}, default=str)
+            return error_json(str(e), status=True)
 
     @mcp.tool()
     async def get_prediction_chain(
@@ -126,20 +111,14 @@ def register(mcp: FastMCP) -> None:
             prediction_date: Optional ISO date to get a specific prediction's chain.
                            If None, returns the chain for the most recent original.
         """
-        if not re.match(r"^[A-Z]{1,10}$", ticker.upper()):
-            return json.dumps(
-                {"status": "error", "error": f"Invalid ticker format: {ticker}"},
-                default=str,
-            )
+        if not TICKER_RE.fullmatch(ticker.upper()):
+            return error_json(f"Invalid ticker format: {ticker}", status=True)
         ticker = ticker.upper()
 
         try:
             entries = _load_prediction_files(PREDICTIONS_DIR, ticker=ticker)
             if not entries:
-                return json.dumps(
-                    {"status": "error", "error": f"No predictions found for {ticker}"},
-                    default=str,
-                )
+                return error_json(f"No predictions found for {ticker}", status=True)
 
             # Find originals (not revisions)
             originals = [
@@ -148,10 +127,7 @@ def register(mcp: FastMCP) -> None:
             ]
 
             if not originals:
-                return json.dumps(
-                    {"status": "error", "error": f"No original predictions found for {ticker}"},
-                    default=str,
-                )
+                return error_json(f"No original predictions found for {ticker}", status=True)
 
             # Select the target original
             if prediction_date:
@@ -160,12 +136,9 @@ def register(mcp: FastMCP) -> None:
                     if data.get("prediction_date") == prediction_date
                 ]
                 if not target_originals:
-                    return json.dumps(
-                        {
-                            "status": "error",
-                            "error": f"No original prediction found for {ticker} on {prediction_date}",
-                        },
-                        default=str,
+                    return error_json(
+                        f"No original prediction found for {ticker} on {prediction_date}",
+                        status=True,
                     )
                 # Use the first match (should be unique per date)
                 original_fp, original_data = target_originals[0]
@@ -204,10 +177,9 @@ def register(mcp: FastMCP) -> None:
                     }
                 )
 
-            return json.dumps(
+            return dumps(
                 {"status": "ok", "ticker": ticker, "chain": chain},
-                default=str,
             )
         except Exception as e:
             logger.warning("get_prediction_chain_error", error=str(e))
-            return json.dumps({"status": "error", "error": str(e)}, default=str)
+            return error_json(str(e), status=True)
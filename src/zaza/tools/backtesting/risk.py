@@ -1,21 +1,20 @@
 """Risk metrics tool -- Sharpe, Sortino, max drawdown, beta, alpha, VaR/CVaR.
 
-Uses compute_return_stats, compute_var, compute_cvar from utils/models.py.
+Uses compute_return_stats and compute_var_cvar from utils/models.py.
 """
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 import numpy as np
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache, get_yf
 from zaza.utils.indicators import ohlcv_to_dataframe
-from zaza.utils.models import compute_cvar, compute_return_stats, compute_var
+from zaza.utils.jsonio import dumps, error_json
+from zaza.utils.models import compute_return_stats, compute_var_cvar
 
 logger = structlog.get_logger(__name__)
 
@@ -55,8 +54,7 @@ def _compute_risk_metrics(
         )
 
     # VaR and CVaR
-    var_data = compute_var(returns, confidence=0.95)
-    cvar_val = compute_cvar(returns, confidence=0.95)
+    var_data, cvar_val = compute_var_cvar(returns, confidences=(0.95,))[0.95]
 
     return {
         "sharpe_ratio": sharpe,
@@ -75,8 +73,8 @@ def _compute_risk_metrics(
 
 def register(mcp: FastMCP) -> None:
     """Register the risk metrics tool."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    cache = get_cache()
+    yf = get_yf()
 
     @mcp.tool()
     async def get_risk_metrics(
@@ -100,21 +98,15 @@ def register(mcp: FastMCP) -> None:
             )
             cached = cache.get(cache_key, "risk_metrics")
             if cached is not None:
-                return json.dumps(cached, default=str)
+                return dumps(cached)
 
             ticker_history = yf.get_history(ticker, period=period)
             if not ticker_history:
-                return json.dumps(
-                    {"error": f"No historical data for {ticker}"},
-                    default=str,
-                )
+                return error_json(f"No historical data for {ticker}")
 
             benchmark_history = yf.get_history(benchmark, period=period)
             if not benchmark_history:
-                return json.dumps(
-                    {"error": f"No historical data for benchmark {benchmark}"},
-                    default=str,
-                )
+                return error_json(f"No historical data for benchmark {benchmark}")
 
             ticker_df = ohlcv_to_dataframe(ticker_history)
             benchmark_df = ohlcv_to_dataframe(benchmark_history)
@@ -123,10 +115,7 @@ def register(mcp: FastMCP) -> None:
             benchmark_returns = benchmark_df["Close"].pct_change().dropna().values
 
             if len(ticker_returns) < 10:
-                return json.dumps(
-                    {"error": "Insufficient data to compute risk metrics"},
-                    default=str,
-                )
+                return error_json("Insufficient data to compute risk metrics")
 
             metrics = _compute_risk_metrics(ticker_returns, benchmark_returns)
             result = {
@@ -138,8 +127,8 @@ def register(mcp: FastMCP) -> None:
             }
 
             cache.set(cache_key, "risk_metrics", result)
-            return json.dumps(result, default=str)
+            return dumps(result)
 
         except Exception as e:
             logger.warning("risk_metrics_error", ticker=ticker, error=str(e))
-            return json.dumps({"error": str(e)}, default=str)
+            return error_json(str(e))
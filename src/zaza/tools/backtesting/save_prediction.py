@@ -8,7 +8,6 @@ PREDICTIONS_DIR.
 from __future__ import annotations
 
 import json
-import re
 from datetime import date, timedelta
 from pathlib import Path
 
@@ -17,7 +16,7 @@ import structlog
 from mcp.server.fastmcp import FastMCP
 
 from zaza.config import PREDICTIONS_DIR
-from zaza.utils.predictions import _atomic_write
+from zaza.utils.predictions import TICKER_RE, _atomic_write
 
 logger = structlog.get_logger(__name__)
 
@@ -56,7 +55,7 @@ def register(mcp: FastMCP) -> None:
         try:
             # --- Validate ticker ---
             normalized_ticker = ticker.upper()
-            if not re.match(r"^[A-Z]{1,10}$", normalized_ticker, re.ASCII):
+            if not TICKER_RE.fullmatch(normalized_ticker):
                 return json.dumps(
                     {
                         "status": "error",
@@ -17,7 +17,7 @@ import structlog
 from mcp.server.fastmcp import FastMCP
 
 from zaza.config import PREDICTIONS_DIR
-from zaza.utils.predictions import _atomic_write
+from zaza.utils.predictions import TICKER_RE, _atomic_write
 
 logger = structlog.get_logger(__name__)
 
@@ -34,12 +34,12 @@ _REQUIRED_KEYS = frozenset(
 # Matches original prediction filenames: TICKER_DATE_Nd.json
 # Must NOT match revision filenames (which have _rN suffix).
 _PARENT_FILENAME_RE = re.compile(
-    r"^([A-Z]{1,10})_(\d{4}-\d{2}-\d{2})_(\d+)d\.json$"
+    r"([A-Z]{1,10})_(\d{4}-\d{2}-\d{2})_(\d+)d\.json"
 )
 
 # Matches revision filenames: TICKER_DATE_Nd_rN.json
 _REVISION_FILENAME_RE = re.compile(
-    r"^([A-Z]{1,10})_(\d{4}-\d{2}-\d{2})_(\d+)d_r(\d+)\.json$"
+    r"([A-Z]{1,10})_(\d{4}-\d{2}-\d{2})_(\d+)d_r(\d+)\.json"
 )
 
 
@@ -71,7 +71,7 @@ def register(mcp: FastMCP) -> None:
         try:
             # --- Validate ticker ---
             normalized_ticker = ticker.upper()
-            if not re.match(r"^[A-Z]{1,10}$", normalized_ticker, re.ASCII):
+            if not TICKER_RE.fullmatch(normalized_ticker):
                 return json.dumps(
                     {
                         "status": "error",
@@ -91,7 +91,7 @@ def register(mcp: FastMCP) -> None:
                 )
 
             # Reject revision filenames as parent (no chaining)
-            if _REVISION_FILENAME_RE.match(parent_prediction):
+            if _REVISION_FILENAME_RE.fullmatch(parent_prediction):
                 return json.dumps(
                     {
                         "status": "error",
@@ -103,7 +103,7 @@ def register(mcp: FastMCP) -> None:
                     default=str,
                 )
 
-            parent_match = _PARENT_FILENAME_RE.match(parent_prediction)
+            parent_match = _PARENT_FILENAME_RE.fullmatch(parent_prediction)
             if not parent_match:
                 return json.dumps(
                     {
@@ -187,7 +187,7 @@ def register(mcp: FastMCP) -> None:
             existing_revisions: list[int] = []
             for f in predictions_dir.iterdir():
                 if f.name.startswith(prefix) and f.name.endswith(".json"):
-                    rev_match = _REVISION_FILENAME_RE.match(f.name)
+                    rev_match = _REVISION_FILENAME_RE.fullmatch(f.name)
                     if rev_match:
                         existing_revisions.append(int(rev_match.group(4)))
 
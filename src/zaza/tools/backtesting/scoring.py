@@ -7,12 +7,11 @@ range_accuracy. Never cached (always fresh).
 
 from __future__ import annotations
 
-import json
-
 import structlog
 from mcp.server.fastmcp import FastMCP
 
 from zaza.config import PREDICTIONS_DIR
+from zaza.utils.jsonio import dumps, error_json
 from zaza.utils.predictions import score_predictions
 
 logger = structlog.get_logger(__name__)
@@ -41,7 +40,7 @@ def register(mcp: FastMCP) -> None:
                 ticker=ticker,
                 predictions_dir=PREDICTIONS_DIR,
             )
-            return json.dumps(result, default=str)
+            return dumps(result)
         except Exception as e:
             logger.warning("prediction_score_error", error=str(e))
-            return json.dumps({"error": str(e)}, default=str)
+            return error_json(str(e))
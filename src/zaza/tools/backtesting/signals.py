@@ -6,7 +6,6 @@ No look-ahead bias: only data available at signal date is used.
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 import numpy as np
@@ -15,9 +14,9 @@ import structlog
 import ta
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache, get_yf
 from zaza.utils.indicators import ohlcv_to_dataframe
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
@@ -159,8 +158,8 @@ def _compute_forward_returns(
 
 def register(mcp: FastMCP) -> None:
     """Register the signal backtest tool."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    cache = get_cache()
+    yf = get_yf()
 
     @mcp.tool()
     async def get_signal_backtest(
@@ -183,25 +182,19 @@ def register(mcp: FastMCP) -> None:
         """
         try:
             if signal not in SUPPORTED_SIGNALS:
-                return json.dumps(
-                    {"error": f"Unsupported signal '{signal}'. Supported: {SUPPORTED_SIGNALS}"},
-                    default=str,
-                )
+                return error_json(f"Unsupported signal '{signal}'. Supported: {SUPPORTED_SIGNALS}")
 
             cache_key = cache.make_key(
                 "signal_backtest", ticker=ticker, signal=signal, years=lookback_years
             )
             cached = cache.get(cache_key, "backtest_results")
             if cached is not None:
-                return json.dumps(cached, default=str)
+                return dumps(cached)
 
             period = f"{lookback_years}y"
             history = yf.get_history(ticker, period=period)
             if not history:
-                return json.dumps(
-                    {"error": f"No historical data for {ticker}"},
-                    default=str,
-                )
+                return error_json(f"No historical data for {ticker}")
 
             df = ohlcv_to_dataframe(history)
             signal_indices = _detect_signals(df, signal)
@@ -216,8 +209,8 @@ def register(mcp: FastMCP) -> None:
             }
 
             cache.set(cache_key, "backtest_results", result)
-            return json.dumps(result, default=str)
+            return dumps(result)
 
         except Exception as e:
             logger.warning("signal_backtest_error", ticker=ticker, error=str(e))
-            return json.dumps({"error": str(e)}, default=str)
+            return error_json(str(e))
@@ -5,7 +5,6 @@ Computes total trades, win rate, avg P&L, max drawdown, Sharpe, vs buy-and-hold.
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 import numpy as np
@@ -13,10 +12,10 @@ import pandas as pd
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache, get_yf
 from zaza.tools.backtesting.signals import SUPPORTED_SIGNALS, _detect_signals
 from zaza.utils.indicators import ohlcv_to_dataframe
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
@@ -151,8 +150,8 @@ def _compute_simulation_stats(
 
 def register(mcp: FastMCP) -> None:
     """Register the strategy simulation tool."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    cache = get_cache()
+    yf = get_yf()
 
     @mcp.tool()
     async def get_strategy_simulation(
@@ -183,12 +182,9 @@ def register(mcp: FastMCP) -> None:
                 ("exit_signal", exit_signal),
             ]:
                 if sig_val not in SUPPORTED_SIGNALS:
-                    return json.dumps(
-                        {
-                            "error": f"Unsupported {sig_name} '{sig_val}'. "
-                            f"Supported: {SUPPORTED_SIGNALS}"
-                        },
-                        default=str,
+                    return error_json(
+                        f"Unsupported {sig_name} '{sig_val}'. "
+                        f"Supported: {SUPPORTED_SIGNALS}"
                     )
 
             cache_key = cache.make_key(
@@ -201,14 +197,11 @@ def register(mcp: FastMCP) -> None:
             )
             cached = cache.get(cache_key, "backtest_results")
             if cached is not None:
-                return json.dumps(cached, default=str)
+                return dumps(cached)
 
             history = yf.get_history(ticker, period="5y")
             if not history:
-                return json.dumps(
-                    {"error": f"No historical data for {ticker}"},
-                    default=str,
-                )
+                return error_json(f"No historical data for {ticker}")
 
             df = ohlcv_to_dataframe(history)
 
@@ -237,8 +230,8 @@ def register(mcp: FastMCP) -> None:
             }
 
             cache.set(cache_key, "backtest_results", result)
-            return json.dumps(result, default=str)
+            return dumps(result)
 
         except Exception as e:
             logger.warning("strategy_simulation_error", ticker=ticker, error=str(e))
-            return json.dumps({"error": str(e)}, default=str)
+            return error_json(str(e))
@@ -2,22 +2,21 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache, get_yf
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
 
 def register(mcp: FastMCP) -> None:
     """Register buyback data tool."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    cache = get_cache()
+    yf = get_yf()
 
     @mcp.tool()
     async def get_buyback_data(ticker: str) -> str:
@@ -32,14 +31,12 @@ def register(mcp: FastMCP) -> None:
         cache_key = cache.make_key("buyback_data", ticker=ticker)
         cached = cache.get(cache_key, "buyback_data")
         if cached is not None:
-            return json.dumps(cached, default=str)
+            return dumps(cached)
 
         try:
             quote = yf.get_quote(ticker)
             if not quote or "regularMarketPrice" not in quote:
-                return json.dumps(
-                    {"status": "error", "error": f"No quote data for {ticker}"}
-                )
+                return error_json(f"No quote data for {ticker}", status=True)
 
             market_cap = quote.get("marketCap", 0)
             shares_outstanding = quote.get("sharesOutstanding", 0)
@@ -50,9 +47,7 @@ def register(mcp: FastMCP) -> None:
             cash_flow = financials.get("cash_flow", [])
 
             if not cash_flow and not shares_outstanding:
-                return json.dumps(
-                    {"status": "error", "error": f"No buyback data available for {ticker}"}
-                )
+                return error_json(f"No buyback data available for {ticker}", status=True)
 
             # Extract repurchase data from cash flow statements
             buyback_periods: list[dict[str, Any]] = []
@@ -104,7 +99,7 @@ def register(mcp: FastMCP) -> None:
                 },
             }
             cache.set(cache_key, "buyback_data", result)
-            return json.dumps(result, default=str)
+            return dumps(result)
         except Exception as e:
             logger.warning("buyback_data_error", ticker=ticker, error=str(e))
-            return json.dumps({"status": "error", "error": str(e)})
+            return error_json(str(e), status=True)
@@ -2,22 +2,21 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache, get_yf
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
 
 def register(mcp: FastMCP) -> None:
     """Register earnings calendar tool."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    cache = get_cache()
+    yf = get_yf()
 
     @mcp.tool()
     async def get_earnings_calendar(ticker: str) -> str:
@@ -29,16 +28,14 @@ def register(mcp: FastMCP) -> None:
         cache_key = cache.make_key("earnings_cal_tool", ticker=ticker)
         cached = cache.get(cache_key, "earnings_calendar")
         if cached is not None:
-            return json.dumps(cached, default=str)
+            return dumps(cached)
 
         try:
             earnings_data = yf.get_earnings(ticker)
             calendar = earnings_data.get("calendar", {})
 
             if not calendar:
-                return json.dumps(
-                    {"status": "error", "error": f"No earnings calendar data for {ticker}"}
-                )
+                return error_json(f"No earnings calendar data for {ticker}", status=True)
 
             # Extract earnings date (may be string or list)
             earnings_date = calendar.get("Earnings Date", "")
@@ -66,7 +63,7 @@ def register(mcp: FastMCP) -> None:
                 },
             }
             cache.set(cache_key, "earnings_calendar", result)
-            return json.dumps(result, default=str)
+            return dumps(result)
         except Exception as e:
             logger.warning("earnings_calendar_error", ticker=ticker, error=str(e))
-            return json.dumps({"status": "error", "error": str(e)})
+            return error_json(str(e), status=True)
@@ -2,15 +2,14 @@
 
 from __future__ import annotations
 
-import json
 from datetime import datetime, timezone
 from typing import Any
 
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache, get_yf
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
@@ -27,8 +26,8 @@ def _timestamp_to_date(ts: int | float | None) -> str | None:
 
 def register(mcp: FastMCP) -> None:
     """Register event calendar tool."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    cache = get_cache()
+    yf = get_yf()
 
     @mcp.tool()
     async def get_event_calendar(ticker: str) -> str:
@@ -40,7 +39,7 @@ def register(mcp: FastMCP) -> None:
         cache_key = cache.make_key("event_cal", ticker=ticker)
         cached = cache.get(cache_key, "event_calendar")
         if cached is not None:
-            return json.dumps(cached, default=str)
+            return dumps(cached)
 
         try:
             quote = yf.get_quote(ticker)
@@ -106,7 +105,7 @@ def register(mcp: FastMCP) -> None:
                 },
             }
             cache.set(cache_key, "event_calendar", result)
-            return json.dumps(result, default=str)
+            return dumps(result)
         except Exception as e:
             logger.warning("event_calendar_error", ticker=ticker, error=str(e))
-            return json.dumps({"status": "error", "error": str(e)})
+            return error_json(str(e), status=True)
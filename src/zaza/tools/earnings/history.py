@@ -2,22 +2,21 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache, get_yf
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
 
 def register(mcp: FastMCP) -> None:
     """Register earnings history tool."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    cache = get_cache()
+    yf = get_yf()
 
     @mcp.tool()
     async def get_earnings_history(ticker: str, limit: int = 8) -> str:
@@ -30,16 +29,14 @@ def register(mcp: FastMCP) -> None:
         cache_key = cache.make_key("earnings_hist_tool", ticker=ticker, limit=limit)
         cached = cache.get(cache_key, "earnings_history")
         if cached is not None:
-            return json.dumps(cached, default=str)
+            return dumps(cached)
 
         try:
             earnings_data = yf.get_earnings(ticker)
             history = earnings_data.get("earnings_history", [])
 
             if not history:
-                return json.dumps(
-                    {"status": "error", "error": f"No earnings history for {ticker}"}
-                )
+                return error_json(f"No earnings history for {ticker}", status=True)
 
             quarters = []
             for entry in history[:limit]:
@@ -82,7 +79,7 @@ def register(mcp: FastMCP) -> None:
                 },
             }
             cache.set(cache_key, "earnings_history", result)
-            return json.dumps(result, default=str)
+            return dumps(result)
         except Exception as e:
             logger.warning("earnings_history_error", ticker=ticker, error=str(e))
-            return json.dumps({"status": "error", "error": str(e)})
+            return error_json(str(e), status=True)
@@ -6,14 +6,15 @@ Tools:
 
 from __future__ import annotations
 
-import json
+import asyncio
 from typing import Any
 
 import structlog
 from mcp.server.fastmcp import FastMCP
 
+from zaza.api.shared import get_yf
 from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.utils.jsonio import dumps
 
 logger = structlog.get_logger(__name__)
 
@@ -23,7 +24,7 @@ def _make_analyst_estimates(yf: YFinanceClient, ticker: str) -> str:
     try:
         data = yf.get_quote(ticker)
         if not data:
-            return json.dumps({"error": f"No data found for ticker {ticker}"})
+            return dumps({"error": f"No data found for ticker {ticker}"})
 
         result: dict[str, Any] = {
             "ticker": ticker,
@@ -40,16 +41,15 @@ def _make_analyst_estimates(yf: YFinanceClient, ticker: str) -> str:
             },
             "analyst_count": data.get("numberOfAnalystOpinions"),
         }
-        return json.dumps(result, default=str)
+        return dumps(result)
     except Exception as e:
         logger.error("analyst_estimates_error", ticker=ticker, error=str(e))
-        return json.dumps({"error": f"Failed to get analyst estimates for {ticker}: {e}"})
+        return dumps({"error": f"Failed to get analyst estimates for {ticker}: {e}"})
 
 
 def register(mcp: FastMCP) -> None:
     """Register analyst estimates tool with the MCP server."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    yf = get_yf()
 
     @mcp.tool()
     async def get_analyst_estimates(ticker: str) -> str:
@@ -57,4 +57,4 @@ def register(mcp: FastMCP) -> None:
 
         Returns mean/median/high/low price targets, recommendation key, and analyst count.
         """
-        return _make_analyst_estimates(yf, ticker)
+        return await asyncio.to_thread(_make_analyst_estimates, yf, ticker)
@@ -6,14 +6,15 @@ Tools:
 
 from __future__ import annotations
 
-import json
+import asyncio
 from typing import Any
 
 import structlog
 from mcp.server.fastmcp import FastMCP
 
+from zaza.api.shared import get_yf
 from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.utils.jsonio import dumps
 
 logger = structlog.get_logger(__name__)
 
@@ -23,7 +24,7 @@ def _make_company_facts(yf: YFinanceClient, ticker: str) -> str:
     try:
         data = yf.get_quote(ticker)
         if not data:
-            return json.dumps({"error": f"No data found for ticker {ticker}"})
+            return dumps({"error": f"No data found for ticker {ticker}"})
         result: dict[str, Any] = {
             "ticker": ticker,
             "name": data.get("shortName"),
@@ -36,18 +37,17 @@ def _make_company_facts(yf: YFinanceClient, ticker: str) -> str:
             "market_cap": data.get("marketCap"),
             "currency": data.get("currency"),
         }
-        return json.dumps(result, default=str)
+        return dumps(result)
     except Exception as e:
         logger.error("company_facts_error", ticker=ticker, error=str(e))
-        return json.dumps({"error": f"Failed to get company facts for {ticker}: {e}"})
+        return dumps({"error": f"Failed to get company facts for {ticker}: {e}"})
 
 
 def register(mcp: FastMCP) -> None:
     """Register company facts tool with the MCP server."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    yf = get_yf()
 
     @mcp.tool()
     async def get_company_facts(ticker: str) -> str:
         """Get company profile: sector, industry, employees, exchange, website, description."""
-        return _make_company_facts(yf, ticker)
+        return await asyncio.to_thread(_make_company_facts, yf, ticker)
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import re
 from typing import Any
 
@@ -11,15 +10,25 @@ from bs4 import BeautifulSoup
 from mcp.server.fastmcp import FastMCP
 
 from zaza.api.edgar_client import EdgarClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache
+from zaza.utils.jsonio import dumps
 
 logger = structlog.get_logger(__name__)
 
+# Tags that mark a document as HTML/XHTML. Older filings are SGML-wrapped plain
+# text (<DOCUMENT>, <TYPE>, <PAGE>, ...), which needs no markup parsing at all.
+_HTML_MARKERS = ("<html", "<!doctype html", "<?xml", "<body", "<div", "<table", "<p>", "<p ")
+
+# Item section headers, e.g. "Item 1.", "Item 1A.", "Item 7.".
+_ITEM_PATTERN = re.compile(
+    r"^(Item\s+\d+[A-Za-z]?\.?\s*.*)$",
+    re.MULTILINE | re.IGNORECASE,
+)
+
 
 def register(mcp: FastMCP) -> None:
     """Register SEC filings tools with the MCP server."""
-    cache = FileCache()
-    edgar = EdgarClient(cache)
+    edgar = EdgarClient(get_cache())
 
     @mcp.tool()
     async def get_filings(
@@ -43,11 +52,11 @@ def register(mcp: FastMCP) -> None:
 
             recent = submissions.get("recentFilings", {})
             if not recent:
-                return json.dumps({
+                return dumps({
                     "status": "ok",
                     "ticker": ticker.upper(),
                     "data": {"filings": []},
-                }, default=str)
+                })
 
             accession_numbers = recent.get("accessionNumber", [])
             filing_dates = recent.get("filingDate", [])
@@ -70,15 +79,15 @@ def register(mcp: FastMCP) -> None:
                 if len(filings) >= limit:
                     break
 
-            return json.dumps({
+            return dumps({
                 "status": "ok",
                 "ticker": ticker.upper(),
                 "data": {"filings": filings},
-            }, default=str)
+            })
 
         except Exception as e:
             logger.warning("get_filings_error", ticker=ticker, error=str(e))
-            return json.dumps({"error": str(e)}, default=str)
+            return dumps({"error": str(e)})
 
     @mcp.tool()
     async def get_filing_items(
@@ -123,9 +132,9 @@ def register(mcp: FastMCP) -> None:
                         break
 
                 if resolved is None:
-                    return json.dumps({
+                    return dumps({
                         "error": f"No {filing_type} filing found for {ticker.upper()}"
-                    }, default=str)
+                    })
 
                 accession_number = resolved
                 logger.info(
@@ -137,9 +146,9 @@ def register(mcp: FastMCP) -> None:
             # Fetch filing content
             content = await edgar.get_filing_content(cik, accession_number)
             if not content:
-                return json.dumps({
+                return dumps({
                     "error": f"Filing content not available for {accession_number}"
-                }, default=str)
+                })
 
             # Parse HTML and extract sections
             parsed_items = _parse_filing_items(content)
@@ -152,47 +161,44 @@ def register(mcp: FastMCP) -> None:
                     if any(req in item["item"].lower() for req in items_lower)
                 ]
 
-            return json.dumps({
+            return dumps({
                 "status": "ok",
                 "ticker": ticker.upper(),
                 "accession_number": accession_number,
                 "filing_type": filing_type,
                 "data": {"items": parsed_items},
-            }, default=str)
+            })
 
         except Exception as e:
             logger.warning("get_filing_items_error", ticker=ticker, error=str(e))
-            return json.dumps({"error": str(e)}, default=str)
+            return dumps({"error": str(e)})
 
 
 def _parse_filing_items(html_content: str) -> list[dict[str, str]]:
     """Parse an SEC filing HTML document and extract Item sections.
 
     Looks for headings matching the pattern "Item X" or "Item X." and
-    extracts the text content between consecutive item headers.
+    extracts the text content between consecutive item headers. Plain-text
+    (SGML/TXT) filings skip the HTML parser and go straight to the regex.
 
     Args:
-        html_content: Raw HTML content of the filing.
+        html_content: Raw HTML (or plain-text) content of the filing.
 
     Returns:
         List of dicts with 'item' (header) and 'content' (text) keys.
     """
-    soup = BeautifulSoup(html_content, "lxml")
-
-    # Remove script and style elements
-    for element in soup(["script", "style"]):
-        element.decompose()
+    if _is_html(html_content):
+        soup = BeautifulSoup(html_content, "lxml")
 
-    text = soup.get_text(separator="\n")
+        # Remove script and style elements
+        for element in soup(["script", "style"]):
+            element.decompose()
 
-    # Find Item sections using regex
-    # Matches patterns like "Item 1.", "Item 1A.", "Item 7.", etc.
-    item_pattern = re.compile(
-        r"^(Item\s+\d+[A-Za-z]?\.?\s*.*)$",
-        re.MULTILINE | re.IGNORECASE,
-    )
+        text = soup.get_text(separator="\n")
+    else:
+        text = html_content
 
-    matches = list(item_pattern.finditer(text))
+    matches = _find_item_headers(text)
     if not matches:
         # Fallback: return entire text as single item
         clean_text = text.strip()
@@ -214,3 +220,33 @@ def _parse_filing_items(html_content: str) -> list[dict[str, str]]:
         items.append({"item": header, "content": content})
 
     return items
+
+
+def _is_html(content: str) -> bool:
+    """Return True if the first 1 KB of a filing contains HTML markup."""
+    head = content[:1024].lower()
+    return any(marker in head for marker in _HTML_MARKERS)
+
+
+def _find_item_headers(text: str) -> list[re.Match[str]]:
+    """Find Item header lines, running the regex only where a line starts with "item".
+
+    Candidate line starts are located with ``str.find`` on a lowercased copy of
+    the text, so the regex never scans the body text between headers.
+    """
+    # The leading newline makes index i in `lower` the start of a line at text[i].
+    lower = "\n" + text.lower()
+    if len(lower) != len(text) + 1:
+        # A few non-ASCII characters change length when lowercased, which would
+        # misalign offsets; fall back to a full regex scan.
+        return list(_ITEM_PATTERN.finditer(text))
+
+    matches: list[re.Match[str]] = []
+    pos = lower.find("\nitem")
+    while pos != -1:
+        match = _ITEM_PATTERN.match(text, pos)
+        if match:
+            matches.append(match)
+            pos = match.end()
+        pos = lower.find("\nitem", pos + 1)
+    return matches
@@ -6,14 +6,15 @@ Tools:
 
 from __future__ import annotations
 
-import json
+import asyncio
 from typing import Any
 
 import structlog
 from mcp.server.fastmcp import FastMCP
 
+from zaza.api.shared import get_yf
 from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.utils.jsonio import dumps
 
 logger = structlog.get_logger(__name__)
 
@@ -27,18 +28,17 @@ def _make_insider_trades(yf: YFinanceClient, ticker: str) -> str:
             "transaction_count": len(transactions),
             "transactions": transactions,
         }
-        return json.dumps(result, default=str)
+        return dumps(result)
     except Exception as e:
         logger.error("insider_trades_error", ticker=ticker, error=str(e))
-        return json.dumps({"error": f"Failed to get insider trades for {ticker}: {e}"})
+        return dumps({"error": f"Failed to get insider trades for {ticker}: {e}"})
 
 
 def register(mcp: FastMCP) -> None:
     """Register insider trades tool with the MCP server."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    yf = get_yf()
 
     @mcp.tool()
     async def get_insider_trades(ticker: str) -> str:
         """Get recent insider transactions for a stock."""
-        return _make_insider_trades(yf, ticker)
+        return await asyncio.to_thread(_make_insider_trades, yf, ticker)
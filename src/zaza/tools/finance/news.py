@@ -6,14 +6,15 @@ Tools:
 
 from __future__ import annotations
 
-import json
+import asyncio
 from typing import Any
 
 import structlog
 from mcp.server.fastmcp import FastMCP
 
+from zaza.api.shared import get_yf
 from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.utils.jsonio import dumps
 
 logger = structlog.get_logger(__name__)
 
@@ -27,18 +28,17 @@ def _make_company_news(yf: YFinanceClient, ticker: str) -> str:
             "article_count": len(articles),
             "articles": articles,
         }
-        return json.dumps(result, default=str)
+        return dumps(result)
     except Exception as e:
         logger.error("company_news_error", ticker=ticker, error=str(e))
-        return json.dumps({"error": f"Failed to get news for {ticker}: {e}"})
+        return dumps({"error": f"Failed to get news for {ticker}: {e}"})
 
 
 def register(mcp: FastMCP) -> None:
     """Register company news tool with the MCP server."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    yf = get_yf()
 
     @mcp.tool()
     async def get_company_news(ticker: str) -> str:
         """Get recent news articles for a stock."""
-        return _make_company_news(yf, ticker)
+        return await asyncio.to_thread(_make_company_news, yf, ticker)
@@ -7,14 +7,15 @@ Tools:
 
 from __future__ import annotations
 
-import json
-from typing import Any
+import asyncio
+from typing import Any, Literal, get_args
 
 import structlog
 from mcp.server.fastmcp import FastMCP
 
+from zaza.api.shared import get_yf
 from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.utils.jsonio import dumps
 
 logger = structlog.get_logger(__name__)
 
@@ -24,7 +25,7 @@ def _make_price_snapshot(yf: YFinanceClient, ticker: str) -> str:
     try:
         data = yf.get_quote(ticker)
         if not data:
-            return json.dumps({"error": f"No data found for ticker {ticker}"})
+            return dumps({"error": f"No data found for ticker {ticker}"})
         result: dict[str, Any] = {
             "ticker": ticker,
             "name": data.get("shortName"),
@@ -40,10 +41,25 @@ def _make_price_snapshot(yf: YFinanceClient, ticker: str) -> str:
             "open": data.get("regularMarketOpen"),
             "previous_close": data.get("regularMarketPreviousClose"),
         }
-        return json.dumps(result, default=str)
+        return dumps(result)
     except Exception as e:
         logger.error("price_snapshot_error", ticker=ticker, error=str(e))
-        return json.dumps({"error": f"Failed to get price snapshot for {ticker}: {e}"})
+        return dumps({"error": f"Failed to get price snapshot for {ticker}: {e}"})
+
+
+PriceFormat = Literal["rows", "columns"]
+_PRICE_FORMATS: tuple[str, ...] = get_args(PriceFormat)
+
+
+def _records_to_columns(records: list[dict[str, Any]]) -> dict[str, list[Any]]:
+    """Pivot row records into a column-name -> values mapping.
+
+    Field names appear once instead of once per row, which keeps long
+    histories compact when serialized. Columns are the union of all row
+    keys in first-seen order; rows lacking a field contribute None.
+    """
+    columns = dict.fromkeys(col for r in records for col in r)
+    return {col: [r.get(col) for r in records] for col in columns}
 
 
 def _make_prices(
@@ -52,32 +68,46 @@ def _make_prices(
     start_date: str | None = None,
     end_date: str | None = None,
     period: str = "6mo",
+    output_format: PriceFormat = "rows",
 ) -> str:
-    """Build OHLCV prices JSON from a YFinanceClient instance."""
+    """Build OHLCV prices JSON from a YFinanceClient instance.
+
+    ``output_format="rows"`` returns a list of per-day records;
+    ``output_format="columns"`` returns one list per OHLCV field under ``columns``.
+    """
+    if output_format not in _PRICE_FORMATS:
+        return dumps({
+            "error": (
+                f"Invalid output_format '{output_format}'. "
+                f"Must be one of {list(_PRICE_FORMATS)}"
+            )
+        })
     try:
         records = yf.get_history(
             ticker, period=period, start=start_date, end=end_date,
         )
         if not records:
-            return json.dumps({"error": f"No price history found for {ticker}"})
+            return dumps({"error": f"No price history found for {ticker}"})
         result: dict[str, Any] = {
             "ticker": ticker,
             "period": period,
             "start_date": start_date,
             "end_date": end_date,
             "record_count": len(records),
-            "records": records,
         }
-        return json.dumps(result, default=str)
+        if output_format == "columns":
+            result["columns"] = _records_to_columns(records)
+        else:
+            result["records"] = records
+        return dumps(result)
     except Exception as e:
         logger.error("prices_error", ticker=ticker, error=str(e))
-        return json.dumps({"error": f"Failed to get prices for {ticker}: {e}"})
+        return dumps({"error": f"Failed to get prices for {ticker}: {e}"})
 
 
 def register(mcp: FastMCP) -> None:
     """Register price tools with the MCP server."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    yf = get_yf()
 
     @mcp.tool()
     async def get_price_snapshot(ticker: str) -> str:
@@ -85,7 +115,7 @@ def register(mcp: FastMCP) -> None:
 
         Returns price, change_pct, volume, market_cap, 52-week high/low, day high/low.
         """
-        return _make_price_snapshot(yf, ticker)
+        return await asyncio.to_thread(_make_price_snapshot, yf, ticker)
 
     @mcp.tool()
     async def get_prices(
@@ -93,6 +123,7 @@ def register(mcp: FastMCP) -> None:
         start_date: str | None = None,
         end_date: str | None = None,
         period: str = "6mo",
+        output_format: PriceFormat = "rows",
     ) -> str:
         """Get historical OHLCV price data for a stock.
 
@@ -101,5 +132,11 @@ def register(mcp: FastMCP) -> None:
             start_date: Start date (YYYY-MM-DD). Overrides period if both start and end provided.
             end_date: End date (YYYY-MM-DD). Overrides period if both start and end provided.
             period: Time period (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max).
+            output_format: 'rows' for per-day records (default) or 'columns' for
+                one list per OHLCV field, which is much smaller for long periods.
         """
-        return _make_prices(yf, ticker, start_date=start_date, end_date=end_date, period=period)
+        return await asyncio.to_thread(
+            _make_prices, yf, ticker,
+            start_date=start_date, end_date=end_date, period=period,
+            output_format=output_format,
+        )
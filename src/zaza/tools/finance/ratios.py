@@ -7,14 +7,16 @@ Tools:
 
 from __future__ import annotations
 
-import json
+import asyncio
+from itertools import zip_longest
 from typing import Any
 
 import structlog
 from mcp.server.fastmcp import FastMCP
 
+from zaza.api.shared import get_yf
 from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.utils.jsonio import dumps
 
 logger = structlog.get_logger(__name__)
 
@@ -36,7 +38,7 @@ def _make_key_ratios_snapshot(yf: YFinanceClient, ticker: str) -> str:
     try:
         data = yf.get_quote(ticker)
         if not data:
-            return json.dumps({"error": f"No data found for ticker {ticker}"})
+            return dumps({"error": f"No data found for ticker {ticker}"})
 
         result: dict[str, Any] = {
             "ticker": ticker,
@@ -69,10 +71,10 @@ def _make_key_ratios_snapshot(yf: YFinanceClient, ticker: str) -> str:
                 "quick_ratio": data.get("quickRatio"),
             },
         }
-        return json.dumps(result, default=str)
+        return dumps(result)
     except Exception as e:
         logger.error("key_ratios_snapshot_error", ticker=ticker, error=str(e))
-        return json.dumps({"error": f"Failed to get ratios for {ticker}: {e}"})
+        return dumps({"error": f"Failed to get ratios for {ticker}: {e}"})
 
 
 def _make_key_ratios(
@@ -86,10 +88,17 @@ def _make_key_ratios(
         cashflow_records = data.get("cash_flow", [])
 
         if not income_records:
-            return json.dumps({"error": f"No financial data available for {ticker}"})
+            return dumps({"error": f"No financial data available for {ticker}"})
 
+        # Balance sheet and cash flow rows are aligned to income periods; a
+        # missing row becomes {} so its lookups yield None via _safe_divide.
+        income_records = income_records[:limit]
+        n = len(income_records)
         ratios_list: list[dict[str, Any]] = []
-        for i, income in enumerate(income_records[:limit]):
+        empty: dict[str, Any] = {}
+        for income, bs, cf in zip_longest(
+            income_records, balance_records[:n], cashflow_records[:n], fillvalue=empty,
+        ):
             revenue = income.get("Total Revenue") or income.get("TotalRevenue")
             gross_profit = income.get("Gross Profit") or income.get("GrossProfit")
             operating_income = (
@@ -99,66 +108,42 @@ def _make_key_ratios(
             )
             net_income = income.get("Net Income") or income.get("NetIncome")
 
+            equity = bs.get("Stockholders Equity") or bs.get("StockholdersEquity")
+            total_assets = bs.get("Total Assets") or bs.get("TotalAssets")
+            total_debt = bs.get("Total Debt") or bs.get("TotalDebt")
+            current_assets = bs.get("Current Assets") or bs.get("CurrentAssets")
+            current_liabilities = (
+                bs.get("Current Liabilities") or bs.get("CurrentLiabilities")
+            )
+            fcf = cf.get("Free Cash Flow") or cf.get("FreeCashFlow")
+
             ratio_entry: dict[str, Any] = {
                 "date": income.get("index") or income.get("Date"),
                 "gross_margin": _safe_divide(gross_profit, revenue),
                 "operating_margin": _safe_divide(operating_income, revenue),
                 "net_margin": _safe_divide(net_income, revenue),
+                "return_on_equity": _safe_divide(net_income, equity),
+                "return_on_assets": _safe_divide(net_income, total_assets),
+                "debt_to_equity": _safe_divide(total_debt, equity),
+                "current_ratio": _safe_divide(current_assets, current_liabilities),
+                "fcf_margin": _safe_divide(fcf, revenue),
             }
-
-            # Add balance sheet ratios if available for same period
-            if i < len(balance_records):
-                bs = balance_records[i]
-                equity = (
-                    bs.get("Stockholders Equity")
-                    or bs.get("StockholdersEquity")
-                )
-                total_assets = bs.get("Total Assets") or bs.get("TotalAssets")
-                total_debt = bs.get("Total Debt") or bs.get("TotalDebt")
-                current_assets = (
-                    bs.get("Current Assets") or bs.get("CurrentAssets")
-                )
-                current_liabilities = (
-                    bs.get("Current Liabilities") or bs.get("CurrentLiabilities")
-                )
-
-                ratio_entry["return_on_equity"] = _safe_divide(net_income, equity)
-                ratio_entry["return_on_assets"] = _safe_divide(net_income, total_assets)
-                ratio_entry["debt_to_equity"] = _safe_divide(total_debt, equity)
-                ratio_entry["current_ratio"] = _safe_divide(
-                    current_assets, current_liabilities,
-                )
-            else:
-                ratio_entry["return_on_equity"] = None
-                ratio_entry["return_on_assets"] = None
-                ratio_entry["debt_to_equity"] = None
-                ratio_entry["current_ratio"] = None
-
-            # Add FCF margin if available
-            if i < len(cashflow_records):
-                cf = cashflow_records[i]
-                fcf = cf.get("Free Cash Flow") or cf.get("FreeCashFlow")
-                ratio_entry["fcf_margin"] = _safe_divide(fcf, revenue)
-            else:
-                ratio_entry["fcf_margin"] = None
-
             ratios_list.append(ratio_entry)
 
-        return json.dumps({
+        return dumps({
             "ticker": ticker,
             "period": period,
             "ratio_count": len(ratios_list),
             "ratios": ratios_list,
-        }, default=str)
+        })
     except Exception as e:
         logger.error("key_ratios_error", ticker=ticker, error=str(e))
-        return json.dumps({"error": f"Failed to compute ratios for {ticker}: {e}"})
+        return dumps({"error": f"Failed to compute ratios for {ticker}: {e}"})
 
 
 def register(mcp: FastMCP) -> None:
     """Register financial ratio tools with the MCP server."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    yf = get_yf()
 
     @mcp.tool()
     async def get_key_ratios_snapshot(ticker: str) -> str:
@@ -166,7 +151,7 @@ def register(mcp: FastMCP) -> None:
 
         Returns P/E, EV/EBITDA, ROE, margins, dividend yield, and leverage ratios.
         """
-        return _make_key_ratios_snapshot(yf, ticker)
+        return await asyncio.to_thread(_make_key_ratios_snapshot, yf, ticker)
 
     @mcp.tool()
     async def get_key_ratios(
@@ -182,4 +167,4 @@ def register(mcp: FastMCP) -> None:
             period: 'annual' or 'quarterly'.
             limit: Maximum number of periods to return (default 5).
         """
-        return _make_key_ratios(yf, ticker, period, limit)
+        return await asyncio.to_thread(_make_key_ratios, yf, ticker, period, limit)
@@ -6,26 +6,28 @@ Tools:
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 import structlog
 from mcp.server.fastmcp import FastMCP
 
 from zaza.api.edgar_client import EdgarClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache
+from zaza.utils.jsonio import dumps
 
 logger = structlog.get_logger(__name__)
 
-# XBRL concepts that commonly contain segmented revenue data
-_REVENUE_CONCEPTS = [
+# XBRL concepts that commonly contain segmented revenue data. Kept as an
+# ordered tuple: six keyed lookups into the us-gaap map are far cheaper than
+# scanning its hundreds of concepts, and the order fixes the output order.
+_REVENUE_CONCEPTS = (
     "Revenues",
     "RevenueFromContractWithCustomerExcludingAssessedTax",
     "RevenueFromContractWithCustomerIncludingAssessedTax",
     "SalesRevenueNet",
     "SalesRevenueServicesNet",
     "SalesRevenueGoodsNet",
-]
+)
 
 
 def _extract_segments(facts: dict[str, Any]) -> list[dict[str, Any]]:
@@ -42,23 +44,21 @@ def _extract_segments(facts: dict[str, Any]) -> list[dict[str, Any]]:
         if not concept:
             continue
 
-        units = concept.get("units", {})
-        usd_entries = units.get("USD", [])
-
-        for entry in usd_entries:
-            segment = entry.get("segment")
-            if segment:
-                segments.append({
-                    "concept": concept_name,
-                    "segment": segment,
-                    "value": entry.get("val"),
-                    "end_date": entry.get("end"),
-                    "fiscal_year": entry.get("fy"),
-                    "fiscal_period": entry.get("fp"),
-                    "form": entry.get("form"),
-                    "filed": entry.get("filed"),
-                    "frame": entry.get("frame"),
-                })
+        segments.extend(
+            {
+                "concept": concept_name,
+                "segment": segment,
+                "value": entry.get("val"),
+                "end_date": entry.get("end"),
+                "fiscal_year": entry.get("fy"),
+                "fiscal_period": entry.get("fp"),
+                "form": entry.get("form"),
+                "filed": entry.get("filed"),
+                "frame": entry.get("frame"),
+            }
+            for entry in concept.get("units", {}).get("USD", [])
+            if (segment := entry.get("segment"))
+        )
 
     return segments
 
@@ -70,36 +70,35 @@ async def _make_segmented_revenues(edgar: EdgarClient, ticker: str) -> str:
         facts = await edgar.get_company_facts(cik)
 
         if not facts:
-            return json.dumps({"error": f"No EDGAR data found for {ticker}"})
+            return dumps({"error": f"No EDGAR data found for {ticker}"})
 
         segments = _extract_segments(facts)
 
         if not segments:
-            return json.dumps({
+            return dumps({
                 "ticker": ticker,
                 "entity_name": facts.get("entityName"),
                 "segments": [],
                 "message": "No segmented revenue data found in XBRL filings",
             })
 
-        return json.dumps({
+        return dumps({
             "ticker": ticker,
             "entity_name": facts.get("entityName"),
             "segment_count": len(segments),
             "segments": segments,
-        }, default=str)
+        })
     except ValueError as e:
         # ticker_to_cik raises ValueError for unknown tickers
-        return json.dumps({"error": str(e)})
+        return dumps({"error": str(e)})
     except Exception as e:
         logger.error("segmented_revenues_error", ticker=ticker, error=str(e))
-        return json.dumps({"error": f"Failed to get segmented revenues for {ticker}: {e}"})
+        return dumps({"error": f"Failed to get segmented revenues for {ticker}: {e}"})
 
 
 def register(mcp: FastMCP) -> None:
     """Register segmented revenues tool with the MCP server."""
-    cache = FileCache()
-    edgar = EdgarClient(cache)
+    edgar = EdgarClient(get_cache())
 
     @mcp.tool()
     async def get_segmented_revenues(ticker: str) -> str:
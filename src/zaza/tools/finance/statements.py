@@ -9,208 +9,291 @@ Tools:
 
 from __future__ import annotations
 
-import json
-from typing import Any
+import asyncio
+import time
+from itertools import islice
+from typing import Any, Literal, get_args
 
 import structlog
 from mcp.server.fastmcp import FastMCP
 
+from zaza.api.shared import get_yf
 from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
 
-def _safe_get(record: dict[str, Any], *keys: str) -> Any:
-    """Try multiple key names, returning the first found value or None."""
-    for key in keys:
-        if key in record:
-            return record[key]
-    return None
-
-
-def _extract_income(records: list[dict[str, Any]], limit: int) -> list[dict[str, Any]]:
-    """Extract standardized income statement fields from raw records."""
-    statements: list[dict[str, Any]] = []
-    for record in records[:limit]:
-        statements.append({
-            "date": _safe_get(record, "index", "Date"),
-            "total_revenue": _safe_get(record, "Total Revenue", "TotalRevenue"),
-            "gross_profit": _safe_get(record, "Gross Profit", "GrossProfit"),
-            "operating_income": _safe_get(
-                record, "Operating Income", "OperatingIncome",
-                "EBIT", "Ebit",
-            ),
-            "net_income": _safe_get(record, "Net Income", "NetIncome"),
-            "basic_eps": _safe_get(record, "Basic EPS", "BasicEPS", "Diluted EPS"),
-            "ebitda": _safe_get(record, "EBITDA", "Ebitda"),
-            "research_development": _safe_get(
-                record, "Research Development", "ResearchDevelopment",
-                "Research And Development",
-            ),
-        })
-    return statements
-
-
-def _extract_balance(records: list[dict[str, Any]], limit: int) -> list[dict[str, Any]]:
-    """Extract standardized balance sheet fields from raw records."""
-    statements: list[dict[str, Any]] = []
-    for record in records[:limit]:
-        statements.append({
-            "date": _safe_get(record, "index", "Date"),
-            "total_assets": _safe_get(record, "Total Assets", "TotalAssets"),
-            "total_liabilities": _safe_get(
-                record,
-                "Total Liabilities Net Minority Interest",
-                "TotalLiabilitiesNetMinorityInterest",
-                "Total Liab",
-            ),
-            "stockholders_equity": _safe_get(
-                record, "Stockholders Equity", "StockholdersEquity",
-                "Total Stockholders Equity",
-            ),
-            "total_debt": _safe_get(record, "Total Debt", "TotalDebt"),
-            "cash_and_equivalents": _safe_get(
-                record,
-                "Cash And Cash Equivalents",
-                "CashAndCashEquivalents",
-                "Cash",
-            ),
-            "net_debt": _safe_get(record, "Net Debt", "NetDebt"),
-            "current_assets": _safe_get(record, "Current Assets", "CurrentAssets"),
-            "current_liabilities": _safe_get(
-                record, "Current Liabilities", "CurrentLiabilities",
-            ),
-        })
-    return statements
-
-
-def _extract_cashflow(records: list[dict[str, Any]], limit: int) -> list[dict[str, Any]]:
-    """Extract standardized cash flow fields from raw records."""
-    statements: list[dict[str, Any]] = []
-    for record in records[:limit]:
-        statements.append({
-            "date": _safe_get(record, "index", "Date"),
-            "operating_cash_flow": _safe_get(
-                record, "Operating Cash Flow", "OperatingCashFlow",
-                "Total Cash From Operating Activities",
-            ),
-            "capital_expenditure": _safe_get(
-                record, "Capital Expenditure", "CapitalExpenditure",
-            ),
-            "free_cash_flow": _safe_get(record, "Free Cash Flow", "FreeCashFlow"),
-            "investing_cash_flow": _safe_get(
-                record, "Investing Cash Flow", "InvestingCashFlow",
-                "Total Cashflows From Investing Activities",
-            ),
-            "financing_cash_flow": _safe_get(
-                record, "Financing Cash Flow", "FinancingCashFlow",
-                "Total Cash From Financing Activities",
-            ),
-        })
-    return statements
+StatementFormat = Literal["rows", "columns"]
+_STATEMENT_FORMATS: tuple[str, ...] = get_args(StatementFormat)
+
+# (output field, source column aliases in priority order) for each statement.
+_INCOME_FIELDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("date", ("index", "Date")),
+    ("total_revenue", ("Total Revenue", "TotalRevenue")),
+    ("gross_profit", ("Gross Profit", "GrossProfit")),
+    ("operating_income", ("Operating Income", "OperatingIncome", "EBIT", "Ebit")),
+    ("net_income", ("Net Income", "NetIncome")),
+    ("basic_eps", ("Basic EPS", "BasicEPS", "Diluted EPS")),
+    ("ebitda", ("EBITDA", "Ebitda")),
+    (
+        "research_development",
+        ("Research Development", "ResearchDevelopment", "Research And Development"),
+    ),
+)
+
+_BALANCE_FIELDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("date", ("index", "Date")),
+    ("total_assets", ("Total Assets", "TotalAssets")),
+    (
+        "total_liabilities",
+        (
+            "Total Liabilities Net Minority Interest",
+            "TotalLiabilitiesNetMinorityInterest",
+            "Total Liab",
+        ),
+    ),
+    (
+        "stockholders_equity",
+        ("Stockholders Equity", "StockholdersEquity", "Total Stockholders Equity"),
+    ),
+    ("total_debt", ("Total Debt", "TotalDebt")),
+    (
+        "cash_and_equivalents",
+        ("Cash And Cash Equivalents", "CashAndCashEquivalents", "Cash"),
+    ),
+    ("net_debt", ("Net Debt", "NetDebt")),
+    ("current_assets", ("Current Assets", "CurrentAssets")),
+    ("current_liabilities", ("Current Liabilities", "CurrentLiabilities")),
+)
+
+_CASHFLOW_FIELDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("date", ("index", "Date")),
+    (
+        "operating_cash_flow",
+        (
+            "Operating Cash Flow",
+            "OperatingCashFlow",
+            "Total Cash From Operating Activities",
+        ),
+    ),
+    ("capital_expenditure", ("Capital Expenditure", "CapitalExpenditure")),
+    ("free_cash_flow", ("Free Cash Flow", "FreeCashFlow")),
+    (
+        "investing_cash_flow",
+        (
+            "Investing Cash Flow",
+            "InvestingCashFlow",
+            "Total Cashflows From Investing Activities",
+        ),
+    ),
+    (
+        "financing_cash_flow",
+        (
+            "Financing Cash Flow",
+            "FinancingCashFlow",
+            "Total Cash From Financing Activities",
+        ),
+    ),
+)
+
+
+def _extract(
+    records: list[dict[str, Any]],
+    fields: tuple[tuple[str, tuple[str, ...]], ...],
+    limit: int,
+) -> list[dict[str, Any]]:
+    """Map raw records to standardized fields, taking the first alias present."""
+    return [
+        {name: next((r[k] for k in keys if k in r), None) for name, keys in fields}
+        for r in islice(records, max(limit, 0))
+    ]
+
+
+def _extract_columns(
+    records: list[dict[str, Any]],
+    fields: tuple[tuple[str, tuple[str, ...]], ...],
+    limit: int,
+) -> dict[str, list[Any]]:
+    """Columnar form of :func:`_extract`: one list of values per standardized field."""
+    head = records[:max(limit, 0)]  # walked once per field, so keep a real list
+    return {
+        name: [next((r[k] for k in keys if k in r), None) for r in head]
+        for name, keys in fields
+    }
+
+
+def _format_statements(
+    records: list[dict[str, Any]],
+    fields: tuple[tuple[str, tuple[str, ...]], ...],
+    limit: int,
+    output_format: StatementFormat,
+) -> list[dict[str, Any]] | dict[str, list[Any]]:
+    """Extract a statement as per-period rows or per-field columns."""
+    if output_format == "columns":
+        return _extract_columns(records, fields, limit)
+    return _extract(records, fields, limit)
+
+
+def _invalid_format_error(output_format: str) -> str:
+    return error_json(
+        f"Invalid output_format '{output_format}'. Must be one of {list(_STATEMENT_FORMATS)}"
+    )
+
+
+# (raw financials key, output key, field table) for the combined statements view.
+_ALL_STATEMENTS: tuple[tuple[str, str, tuple[tuple[str, tuple[str, ...]], ...]], ...] = (
+    ("income_statement", "income_statements", _INCOME_FIELDS),
+    ("balance_sheet", "balance_sheets", _BALANCE_FIELDS),
+    ("cash_flow", "cash_flow_statements", _CASHFLOW_FIELDS),
+)
+
+
+def _extract_all(
+    data: dict[str, Any], limit: int, output_format: StatementFormat = "rows",
+) -> dict[str, list[dict[str, Any]] | dict[str, list[Any]]]:
+    """Extract all three statements from a get_financials() result in one pass."""
+    return {
+        out_key: _format_statements(data.get(raw_key) or [], fields, limit, output_format)
+        for raw_key, out_key, fields in _ALL_STATEMENTS
+    }
+
+
+# Short-lived in-process memo of get_financials() results, so the statement
+# tools called back-to-back for one ticker share a single fetch and parse.
+_FINANCIALS_TTL = 300.0
+_FINANCIALS_MAX_ENTRIES = 64
+_financials_memo: dict[tuple[int, str, str], tuple[float, YFinanceClient, dict[str, Any]]] = {}
+
+
+def _get_financials(yf: YFinanceClient, ticker: str, period: str) -> dict[str, Any]:
+    """Return ``yf.get_financials(ticker, period)``, memoized for a few minutes."""
+    key = (id(yf), ticker, period)
+    now = time.monotonic()
+    entry = _financials_memo.get(key)
+    if entry is not None and entry[1] is yf and now - entry[0] < _FINANCIALS_TTL:
+        return entry[2]
+    data = yf.get_financials(ticker, period=period)
+    if data:
+        if len(_financials_memo) >= _FINANCIALS_MAX_ENTRIES:
+            _financials_memo.pop(next(iter(_financials_memo)), None)
+        _financials_memo[key] = (now, yf, data)
+    return data
 
 
 def _make_income_statements(
-    yf: YFinanceClient, ticker: str, period: str, limit: int,
+    yf: YFinanceClient,
+    ticker: str,
+    period: str,
+    limit: int,
+    output_format: StatementFormat = "rows",
 ) -> str:
     """Build income statements JSON from a YFinanceClient instance."""
+    if output_format not in _STATEMENT_FORMATS:
+        return _invalid_format_error(output_format)
     try:
-        data = yf.get_financials(ticker, period=period)
+        data = _get_financials(yf, ticker, period)
         records = data.get("income_statement", [])
         if not records:
-            return json.dumps({"error": f"No income statement data for {ticker}"})
-        statements = _extract_income(records, limit)
-        return json.dumps({
+            return error_json(f"No income statement data for {ticker}")
+        return dumps({
             "ticker": ticker,
             "period": period,
-            "statement_count": len(statements),
-            "statements": statements,
-        }, default=str)
+            "statement_count": min(len(records), max(limit, 0)),
+            "statements": _format_statements(records, _INCOME_FIELDS, limit, output_format),
+        })
     except Exception as e:
         logger.error("income_statements_error", ticker=ticker, error=str(e))
-        return json.dumps({"error": f"Failed to get income statements for {ticker}: {e}"})
+        return error_json(f"Failed to get income statements for {ticker}: {e}")
 
 
 def _make_balance_sheets(
-    yf: YFinanceClient, ticker: str, period: str, limit: int,
+    yf: YFinanceClient,
+    ticker: str,
+    period: str,
+    limit: int,
+    output_format: StatementFormat = "rows",
 ) -> str:
     """Build balance sheets JSON from a YFinanceClient instance."""
+    if output_format not in _STATEMENT_FORMATS:
+        return _invalid_format_error(output_format)
     try:
-        data = yf.get_financials(ticker, period=period)
+        data = _get_financials(yf, ticker, period)
         records = data.get("balance_sheet", [])
         if not records:
-            return json.dumps({"error": f"No balance sheet data for {ticker}"})
-        statements = _extract_balance(records, limit)
-        return json.dumps({
+            return error_json(f"No balance sheet data for {ticker}")
+        return dumps({
             "ticker": ticker,
             "period": period,
-            "statement_count": len(statements),
-            "statements": statements,
-        }, default=str)
+            "statement_count": min(len(records), max(limit, 0)),
+            "statements": _format_statements(records, _BALANCE_FIELDS, limit, output_format),
+        })
     except Exception as e:
         logger.error("balance_sheets_error", ticker=ticker, error=str(e))
-        return json.dumps({"error": f"Failed to get balance sheets for {ticker}: {e}"})
+        return error_json(f"Failed to get balance sheets for {ticker}: {e}")
 
 
 def _make_cash_flow_statements(
-    yf: YFinanceClient, ticker: str, period: str, limit: int,
+    yf: YFinanceClient,
+    ticker: str,
+    period: str,
+    limit: int,
+    output_format: StatementFormat = "rows",
 ) -> str:
     """Build cash flow statements JSON from a YFinanceClient instance."""
+    if output_format not in _STATEMENT_FORMATS:
+        return _invalid_format_error(output_format)
     try:
-        data = yf.get_financials(ticker, period=period)
+        data = _get_financials(yf, ticker, period)
         records = data.get("cash_flow", [])
         if not records:
-            return json.dumps({"error": f"No cash flow data for {ticker}"})
-        statements = _extract_cashflow(records, limit)
-        return json.dumps({
+            return error_json(f"No cash flow data for {ticker}")
+        return dumps({
             "ticker": ticker,
             "period": period,
-            "statement_count": len(statements),
-            "statements": statements,
-        }, default=str)
+            "statement_count": min(len(records), max(limit, 0)),
+            "statements": _format_statements(records, _CASHFLOW_FIELDS, limit, output_format),
+        })
     except Exception as e:
         logger.error("cash_flow_error", ticker=ticker, error=str(e))
-        return json.dumps({"error": f"Failed to get cash flow for {ticker}: {e}"})
+        return error_json(f"Failed to get cash flow for {ticker}: {e}")
 
 
 def _make_all_financial_statements(
-    yf: YFinanceClient, ticker: str, period: str, limit: int,
+    yf: YFinanceClient,
+    ticker: str,
+    period: str,
+    limit: int,
+    output_format: StatementFormat = "rows",
 ) -> str:
     """Build combined financial statements JSON from a YFinanceClient instance."""
+    if output_format not in _STATEMENT_FORMATS:
+        return _invalid_format_error(output_format)
     try:
-        data = yf.get_financials(ticker, period=period)
-        income_records = data.get("income_statement", [])
-        balance_records = data.get("balance_sheet", [])
-        cashflow_records = data.get("cash_flow", [])
-
-        if not income_records and not balance_records and not cashflow_records:
-            return json.dumps({"error": f"No financial data available for {ticker}"})
+        data = _get_financials(yf, ticker, period)
+        if not any(data.get(raw_key) for raw_key, _, _ in _ALL_STATEMENTS):
+            return error_json(f"No financial data available for {ticker}")
 
-        income_stmts = _extract_income(income_records, limit)
-        balance_stmts = _extract_balance(balance_records, limit)
-        cashflow_stmts = _extract_cashflow(cashflow_records, limit)
-
-        return json.dumps({
+        return dumps({
             "ticker": ticker,
             "period": period,
-            "income_statements": income_stmts,
-            "balance_sheets": balance_stmts,
-            "cash_flow_statements": cashflow_stmts,
-        }, default=str)
+            **_extract_all(data, limit, output_format),
+        })
     except Exception as e:
         logger.error("all_statements_error", ticker=ticker, error=str(e))
-        return json.dumps({"error": f"Failed to get financial statements for {ticker}: {e}"})
+        return error_json(f"Failed to get financial statements for {ticker}: {e}")
 
 
 def register(mcp: FastMCP) -> None:
     """Register financial statement tools with the MCP server."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    yf = get_yf()
 
     @mcp.tool()
     async def get_income_statements(
-        ticker: str, period: str = "annual", limit: int = 5,
+        ticker: str,
+        period: str = "annual",
+        limit: int = 5,
+        output_format: StatementFormat = "rows",
     ) -> str:
         """Get income statements for a company.
 
@@ -220,12 +303,19 @@ def register(mcp: FastMCP) -> None:
             ticker: Stock ticker symbol.
             period: 'annual' or 'quarterly'.
             limit: Maximum number of periods to return (default 5).
+            output_format: 'rows' for one record per period (default) or
+                'columns' for one list per field.
         """
-        return _make_income_statements(yf, ticker, period, limit)
+        return await asyncio.to_thread(
+            _make_income_statements, yf, ticker, period, limit, output_format,
+        )
 
     @mcp.tool()
     async def get_balance_sheets(
-        ticker: str, period: str = "annual", limit: int = 5,
+        ticker: str,
+        period: str = "annual",
+        limit: int = 5,
+        output_format: StatementFormat = "rows",
     ) -> str:
         """Get balance sheets for a company.
 
@@ -235,12 +325,19 @@ def register(mcp: FastMCP) -> None:
             ticker: Stock ticker symbol.
             period: 'annual' or 'quarterly'.
             limit: Maximum number of periods to return (default 5).
+            output_format: 'rows' for one record per period (default) or
+                'columns' for one list per field.
         """
-        return _make_balance_sheets(yf, ticker, period, limit)
+        return await asyncio.to_thread(
+            _make_balance_sheets, yf, ticker, period, limit, output_format,
+        )
 
     @mcp.tool()
     async def get_cash_flow_statements(
-        ticker: str, period: str = "annual", limit: int = 5,
+        ticker: str,
+        period: str = "annual",
+        limit: int = 5,
+        output_format: StatementFormat = "rows",
     ) -> str:
         """Get cash flow statements for a company.
 
@@ -250,12 +347,19 @@ def register(mcp: FastMCP) -> None:
             ticker: Stock ticker symbol.
             period: 'annual' or 'quarterly'.
             limit: Maximum number of periods to return (default 5).
+            output_format: 'rows' for one record per period (default) or
+                'columns' for one list per field.
         """
-        return _make_cash_flow_statements(yf, ticker, period, limit)
+        return await asyncio.to_thread(
+            _make_cash_flow_statements, yf, ticker, period, limit, output_format,
+        )
 
     @mcp.tool()
     async def get_all_financial_statements(
-        ticker: str, period: str = "annual", limit: int = 5,
+        ticker: str,
+        period: str = "annual",
+        limit: int = 5,
+        output_format: StatementFormat = "rows",
     ) -> str:
         """Get all financial statements (income, balance sheet, cash flow) in one call.
 
@@ -263,5 +367,9 @@ def register(mcp: FastMCP) -> None:
             ticker: Stock ticker symbol.
             period: 'annual' or 'quarterly'.
             limit: Maximum number of periods to return (default 5).
+            output_format: 'rows' for one record per period (default) or
+                'columns' for one list per field.
         """
-        return _make_all_financial_statements(yf, ticker, period, limit)
+        return await asyncio.to_thread(
+            _make_all_financial_statements, yf, ticker, period, limit, output_format,
+        )
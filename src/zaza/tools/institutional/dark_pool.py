@@ -2,15 +2,14 @@
 
 from __future__ import annotations
 
-import json
+import statistics
 from typing import Any
 
-import numpy as np
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache, get_yf
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
@@ -18,10 +17,24 @@ logger = structlog.get_logger(__name__)
 TYPICAL_OFF_EXCHANGE_PCT = 0.35
 
 
+def _volume_stats(volumes: list[float]) -> dict[str, int]:
+    """Summarize a month of daily volumes.
+
+    The series is ~21 values, where builtins beat the per-call dispatch
+    overhead of building a NumPy array and running four reductions on it.
+    """
+    return {
+        "avg_volume_1mo": int(statistics.fmean(volumes)),
+        "max_volume_1mo": int(max(volumes)),
+        "min_volume_1mo": int(min(volumes)),
+        "volume_std": int(statistics.pstdev(volumes)),
+    }
+
+
 def register(mcp: FastMCP) -> None:
     """Register dark pool activity tool."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    cache = get_cache()
+    yf = get_yf()
 
     @mcp.tool()
     async def get_dark_pool_activity(ticker: str) -> str:
@@ -35,30 +48,26 @@ def register(mcp: FastMCP) -> None:
             ticker: Stock ticker symbol (e.g., 'AAPL').
         """
         cache_key = cache.make_key("dark_pool", ticker=ticker)
-        cached = cache.get(cache_key, "dark_pool")
+        cached = cache.get_raw(cache_key, "dark_pool")
         if cached is not None:
-            return json.dumps(cached, default=str)
+            return cached
 
         try:
             quote = yf.get_quote(ticker)
             if not quote or "regularMarketPrice" not in quote:
-                return json.dumps(
-                    {"status": "error", "error": f"No data available for {ticker}"}
-                )
+                return error_json(f"No data available for {ticker}", status=True)
 
             current_volume = float(quote.get("regularMarketVolume", 0) or 0)
             avg_volume = float(quote.get("averageVolume", 0) or 0)
             avg_volume_10d = float(quote.get("averageVolume10days", 0) or 0)
 
             if avg_volume == 0 and current_volume == 0:
-                return json.dumps(
-                    {"status": "error", "error": f"No volume data for {ticker}"}
-                )
+                return error_json(f"No volume data for {ticker}", status=True)
 
             # Get recent history for volume analysis
             history = yf.get_history(ticker, period="1mo")
             volumes = [
-                r.get("Volume", 0) for r in history if r.get("Volume") is not None
+                float(v) for r in history if (v := r.get("Volume")) is not None
             ]
 
             # Volume-based heuristics for off-exchange estimation
@@ -85,15 +94,7 @@ def register(mcp: FastMCP) -> None:
             estimated_off_exchange = min(max(off_exchange_adj, 0.15), 0.60)
 
             # Volume statistics
-            vol_stats: dict[str, Any] = {}
-            if volumes:
-                vol_array = np.array(volumes, dtype=float)
-                vol_stats = {
-                    "avg_volume_1mo": int(np.mean(vol_array)),
-                    "max_volume_1mo": int(np.max(vol_array)),
-                    "min_volume_1mo": int(np.min(vol_array)),
-                    "volume_std": int(np.std(vol_array)),
-                }
+            vol_stats = _volume_stats(volumes) if volumes else {}
 
             result: dict[str, Any] = {
                 "status": "ok",
@@ -111,8 +112,9 @@ def register(mcp: FastMCP) -> None:
                     ),
                 },
             }
-            cache.set(cache_key, "dark_pool", result)
-            return json.dumps(result, default=str)
+            payload = dumps(result)
+            cache.set_raw(cache_key, "dark_pool", payload)
+            return payload
         except Exception as e:
             logger.warning("dark_pool_error", ticker=ticker, error=str(e))
-            return json.dumps({"status": "error", "error": str(e)})
+            return error_json(str(e), status=True)
@@ -2,15 +2,14 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 from typing import Any
 
-import numpy as np
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache, get_yf
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
@@ -30,25 +29,57 @@ SECTOR_ETF_MAP: dict[str, str] = {
     "Communication Services": "XLC",
 }
 
+# Lookup keyed by normalized sector name so case/whitespace variants from
+# yfinance still route to the right ETF instead of the SPY fallback.
+_SECTOR_ETF_BY_NORMALIZED: dict[str, str] = {
+    k.strip().lower(): v for k, v in SECTOR_ETF_MAP.items()
+}
+
+
+def _sector_etf(sector: str | None) -> str:
+    """Return the sector ETF for a yfinance sector name, defaulting to SPY."""
+    return _SECTOR_ETF_BY_NORMALIZED.get((sector or "").strip().lower(), "SPY")
+
 
 def _analyze_flow(history: list[dict[str, Any]]) -> dict[str, Any]:
     """Analyze volume and price trends as a proxy for fund flows."""
     if not history or len(history) < 2:
         return {"flow_signal": "insufficient_data", "trend": "unknown"}
 
-    closes = [r.get("Close", 0) for r in history if r.get("Close")]
-    volumes = [r.get("Volume", 0) for r in history if r.get("Volume")]
-
-    if not closes or not volumes:
+    # Single walk: first/last valid close, and volume sums for each half of the window.
+    mid = len(history) // 2
+    first_close: float | None = None
+    last_close: float | None = None
+    early_vol_sum = recent_vol_sum = 0.0
+    early_count = recent_count = 0
+    for i, r in enumerate(history):
+        close = r.get("Close")
+        if close:
+            if first_close is None:
+                first_close = close
+            last_close = close
+        volume = r.get("Volume")
+        if volume:
+            if i < mid:
+                early_vol_sum += volume
+                early_count += 1
+            else:
+                recent_vol_sum += volume
+                recent_count += 1
+
+    if first_close is None or last_close is None or not (early_count or recent_count):
         return {"flow_signal": "insufficient_data", "trend": "unknown"}
 
     # Price trend
-    price_change = (closes[-1] - closes[0]) / closes[0] * 100 if closes[0] > 0 else 0
+    price_change = (
+        (last_close - first_close) / first_close * 100 if first_close > 0 else 0
+    )
 
-    # Volume trend (compare recent vs earlier)
-    mid = len(volumes) // 2
-    recent_avg_vol = np.mean(volumes[mid:]) if mid > 0 else np.mean(volumes)
-    early_avg_vol = np.mean(volumes[:mid]) if mid > 0 else np.mean(volumes)
+    # Volume trend (compare recent vs earlier); a half with no volume data
+    # falls back to the whole-window average.
+    overall_avg_vol = (early_vol_sum + recent_vol_sum) / (early_count + recent_count)
+    recent_avg_vol = recent_vol_sum / recent_count if recent_count else overall_avg_vol
+    early_avg_vol = early_vol_sum / early_count if early_count else overall_avg_vol
     vol_change = (
         (recent_avg_vol - early_avg_vol) / early_avg_vol * 100
         if early_avg_vol > 0
@@ -80,8 +111,8 @@ def _analyze_flow(history: list[dict[str, Any]]) -> dict[str, Any]:
 
 def register(mcp: FastMCP) -> None:
     """Register fund flows tool."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    cache = get_cache()
+    yf = get_yf()
 
     @mcp.tool()
     async def get_fund_flows(ticker: str) -> str:
@@ -94,22 +125,22 @@ def register(mcp: FastMCP) -> None:
             ticker: Stock ticker symbol (e.g., 'AAPL').
         """
         cache_key = cache.make_key("fund_flows", ticker=ticker)
-        cached = cache.get(cache_key, "fund_flows")
+        cached = cache.get_raw(cache_key, "fund_flows")
         if cached is not None:
-            return json.dumps(cached, default=str)
+            return cached
 
         try:
             # Get the ticker's sector
-            quote = yf.get_quote(ticker)
+            quote = await asyncio.to_thread(yf.get_quote, ticker)
             sector = quote.get("sector", "")
-            sector_etf = SECTOR_ETF_MAP.get(sector, "SPY")  # Default to SPY
+            sector_etf = _sector_etf(sector)
 
-            # Get sector ETF history
-            etf_history = yf.get_history(sector_etf, period="1mo")
+            # Sector ETF and ticker histories are independent; fetch them concurrently
+            etf_history, ticker_history = await asyncio.gather(
+                asyncio.to_thread(yf.get_history, sector_etf, period="1mo"),
+                asyncio.to_thread(yf.get_history, ticker, period="1mo"),
+            )
             etf_flow = _analyze_flow(etf_history)
-
-            # Get ticker's own volume trends
-            ticker_history = yf.get_history(ticker, period="1mo")
             ticker_flow = _analyze_flow(ticker_history)
 
             result: dict[str, Any] = {
@@ -123,8 +154,9 @@ def register(mcp: FastMCP) -> None:
                     "flow_signal": ticker_flow.get("flow_signal", "unknown"),
                 },
             }
-            cache.set(cache_key, "fund_flows", result)
-            return json.dumps(result, default=str)
+            payload = dumps(result)
+            cache.set_raw(cache_key, "fund_flows", payload)
+            return payload
         except Exception as e:
             logger.warning("fund_flows_error", ticker=ticker, error=str(e))
-            return json.dumps({"status": "error", "error": str(e)})
+            return error_json(str(e), status=True)
@@ -2,22 +2,21 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache, get_yf
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
 
 def register(mcp: FastMCP) -> None:
     """Register institutional holdings tool."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    cache = get_cache()
+    yf = get_yf()
 
     @mcp.tool()
     async def get_institutional_holdings(ticker: str) -> str:
@@ -27,9 +26,9 @@ def register(mcp: FastMCP) -> None:
             ticker: Stock ticker symbol (e.g., 'AAPL').
         """
         cache_key = cache.make_key("inst_holdings_tool", ticker=ticker)
-        cached = cache.get(cache_key, "institutional_holdings")
+        cached = cache.get_raw(cache_key, "institutional_holdings")
         if cached is not None:
-            return json.dumps(cached, default=str)
+            return cached
 
         try:
             holders_data = yf.get_institutional_holders(ticker)
@@ -37,9 +36,7 @@ def register(mcp: FastMCP) -> None:
             major = holders_data.get("major_holders", [])
 
             if not holders:
-                return json.dumps(
-                    {"status": "error", "error": f"No institutional holder data for {ticker}"}
-                )
+                return error_json(f"No institutional holder data for {ticker}", status=True)
 
             # Get top 10 holders
             top_holders = holders[:10]
@@ -49,22 +46,20 @@ def register(mcp: FastMCP) -> None:
             insider_pct = None
             for row in major:
                 val = row.get("0", "")
-                desc = row.get("1", "")
-                if "institution" in desc.lower():
+                desc = str(row.get("1", "")).lower()
+                if "institution" in desc:
                     try:
                         institutional_pct = float(str(val).replace("%", ""))
                     except (ValueError, TypeError):
                         pass
-                elif "insider" in desc.lower():
+                elif "insider" in desc:
                     try:
                         insider_pct = float(str(val).replace("%", ""))
                     except (ValueError, TypeError):
                         pass
 
             # Compute total shares held by top holders
-            total_top_shares = sum(
-                h.get("Shares", 0) or 0 for h in top_holders
-            )
+            total_top_shares = sum(filter(None, (h.get("Shares") for h in top_holders)))
 
             result: dict[str, Any] = {
                 "status": "ok",
@@ -77,8 +72,9 @@ def register(mcp: FastMCP) -> None:
                     "holder_count": len(holders),
                 },
             }
-            cache.set(cache_key, "institutional_holdings", result)
-            return json.dumps(result, default=str)
+            payload = dumps(result)
+            cache.set_raw(cache_key, "institutional_holdings", payload)
+            return payload
         except Exception as e:
             logger.warning("institutional_holdings_error", ticker=ticker, error=str(e))
-            return json.dumps({"status": "error", "error": str(e)})
+            return error_json(str(e), status=True)
@@ -2,18 +2,33 @@
 
 from __future__ import annotations
 
-import json
+import math
+from bisect import bisect_right
 from typing import Any
 
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache, get_yf
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
 
+# Tier thresholds for each squeeze factor; a value earns one point per
+# threshold it meets or exceeds.
+_SHORT_PCT_FLOAT_TIERS = (0.05, 0.10, 0.20, 0.30)  # 0-4 points
+_SHORT_RATIO_TIERS = (2.0, 4.0, 7.0)  # 0-3 points
+_COVERAGE_DAYS_TIERS = (1.0, 3.0, 5.0)  # 0-3 points
+
+
+def _tier_points(value: float, tiers: tuple[float, ...]) -> int:
+    """Return the number of tier thresholds that ``value`` meets (NaN scores 0)."""
+    if math.isnan(value):
+        return 0
+    return bisect_right(tiers, value)
+
+
 def _compute_squeeze_score(
     short_pct_float: float, short_ratio: float, avg_volume: float, shares_short: float
 ) -> float:
@@ -24,43 +39,17 @@ def _compute_squeeze_score(
     - Short ratio / days to cover (higher = harder to cover)
     - Shares short relative to average volume
     """
-    score = 0.0
-
-    # Short % of float contribution (0-4 points)
-    if short_pct_float >= 0.30:
-        score += 4.0
-    elif short_pct_float >= 0.20:
-        score += 3.0
-    elif short_pct_float >= 0.10:
-        score += 2.0
-    elif short_pct_float >= 0.05:
-        score += 1.0
-
-    # Days to cover contribution (0-3 points)
-    if short_ratio >= 7:
-        score += 3.0
-    elif short_ratio >= 4:
-        score += 2.0
-    elif short_ratio >= 2:
-        score += 1.0
-
-    # Volume pressure contribution (0-3 points)
+    score = _tier_points(short_pct_float, _SHORT_PCT_FLOAT_TIERS)
+    score += _tier_points(short_ratio, _SHORT_RATIO_TIERS)
     if avg_volume > 0 and shares_short > 0:
-        coverage_days = shares_short / avg_volume
-        if coverage_days >= 5:
-            score += 3.0
-        elif coverage_days >= 3:
-            score += 2.0
-        elif coverage_days >= 1:
-            score += 1.0
-
-    return round(score, 1)
+        score += _tier_points(shares_short / avg_volume, _COVERAGE_DAYS_TIERS)
+    return round(float(score), 1)
 
 
 def register(mcp: FastMCP) -> None:
     """Register short interest tool."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    cache = get_cache()
+    yf = get_yf()
 
     @mcp.tool()
     async def get_short_interest(ticker: str) -> str:
@@ -73,16 +62,14 @@ def register(mcp: FastMCP) -> None:
             ticker: Stock ticker symbol (e.g., 'AAPL').
         """
         cache_key = cache.make_key("short_interest", ticker=ticker)
-        cached = cache.get(cache_key, "short_interest")
+        cached = cache.get_raw(cache_key, "short_interest")
         if cached is not None:
-            return json.dumps(cached, default=str)
+            return cached
 
         try:
             quote = yf.get_quote(ticker)
             if not quote or "regularMarketPrice" not in quote:
-                return json.dumps(
-                    {"status": "error", "error": f"No quote data available for {ticker}"}
-                )
+                return error_json(f"No quote data available for {ticker}", status=True)
 
             short_pct_float = float(quote.get("shortPercentOfFloat", 0) or 0)
             shares_short = float(quote.get("sharesShort", 0) or 0)
@@ -111,8 +98,9 @@ def register(mcp: FastMCP) -> None:
                     ),
                 },
             }
-            cache.set(cache_key, "short_interest", result)
-            return json.dumps(result, default=str)
+            payload = dumps(result)
+            cache.set_raw(cache_key, "short_interest", payload)
+            return payload
         except Exception as e:
             logger.warning("short_interest_error", ticker=ticker, error=str(e))
-            return json.dumps({"status": "error", "error": str(e)})
+            return error_json(str(e), status=True)
@@ -2,22 +2,24 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 import structlog
 from mcp.server.fastmcp import FastMCP
 
 from zaza.api.fred_client import FredClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache
 from zaza.config import get_fred_api_key, has_fred_key
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
 
 def register(mcp: FastMCP) -> None:
     """Register economic calendar tool."""
-    cache = FileCache()
+    cache = get_cache()
+    # One client per registration so its HTTP connection pool survives across calls
+    fred: FredClient | None = None
 
     @mcp.tool()
     async def get_economic_calendar(days_ahead: int = 14) -> str:
@@ -30,9 +32,9 @@ def register(mcp: FastMCP) -> None:
             days_ahead: Number of days to look ahead for events (default 14).
         """
         cache_key = cache.make_key("economic_calendar", days_ahead=days_ahead)
-        cached = cache.get(cache_key, "economic_calendar")
+        cached = cache.get_raw(cache_key, "economic_calendar")
         if cached is not None:
-            return json.dumps(cached, default=str)
+            return cached
 
         if not has_fred_key():
             result: dict[str, Any] = {
@@ -47,10 +49,12 @@ def register(mcp: FastMCP) -> None:
                     "events": [],
                 },
             }
-            return json.dumps(result, default=str)
+            return dumps(result)
 
+        nonlocal fred
         try:
-            fred = FredClient(api_key=get_fred_api_key(), cache=cache)
+            if fred is None:
+                fred = FredClient(api_key=get_fred_api_key(), cache=cache)
             releases = await fred.get_release_dates(days_ahead=days_ahead)
 
             events = []
@@ -69,8 +73,9 @@ def register(mcp: FastMCP) -> None:
                     "events": events,
                 },
             }
-            cache.set(cache_key, "economic_calendar", result)
-            return json.dumps(result, default=str)
+            payload = dumps(result)
+            cache.set_raw(cache_key, "economic_calendar", payload)
+            return payload
         except Exception as e:
             logger.warning("economic_calendar_error", error=str(e))
-            return json.dumps({"status": "error", "error": str(e)})
+            return error_json(str(e), status=True)
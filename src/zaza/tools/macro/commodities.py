@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 from typing import Any
 
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache, get_yf
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
@@ -23,42 +23,39 @@ COMMODITY_TICKERS = {
 
 
 def _compute_pct_change(history: list[dict[str, Any]], current: float) -> dict[str, float | None]:
-    """Compute 1-week and 1-month percentage changes from history."""
+    """Compute 1-week and 1-month percentage changes from history.
+
+    Each change is measured against the close ~5 (week) or ~22 (month)
+    trading days back, falling back to the oldest close on shorter series.
+    """
     result: dict[str, float | None] = {"1w_change_pct": None, "1m_change_pct": None}
     if not history or current is None:
         return result
 
-    closes = [r.get("Close") for r in history if r.get("Close") is not None]
+    closes = [c for r in history if (c := r.get("Close")) is not None]
     if not closes:
         return result
 
-    # 1-week change (last ~5 trading days)
-    if len(closes) >= 5:
-        week_ago = closes[-5]
-        if week_ago > 0:
-            result["1w_change_pct"] = round((current - week_ago) / week_ago * 100, 2)
-    elif len(closes) >= 1:
-        first = closes[0]
-        if first > 0:
-            result["1w_change_pct"] = round((current - first) / first * 100, 2)
-
-    # 1-month change (last ~22 trading days)
-    if len(closes) >= 22:
-        month_ago = closes[-22]
-        if month_ago > 0:
-            result["1m_change_pct"] = round((current - month_ago) / month_ago * 100, 2)
-    elif len(closes) >= 1:
-        first = closes[0]
-        if first > 0:
-            result["1m_change_pct"] = round((current - first) / first * 100, 2)
+    for key, lookback in (("1w_change_pct", 5), ("1m_change_pct", 22)):
+        ref = closes[-min(lookback, len(closes))]
+        if ref > 0:
+            result[key] = round((current - ref) / ref * 100, 2)
 
     return result
 
 
 def register(mcp: FastMCP) -> None:
     """Register commodity prices tool."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    cache = get_cache()
+    yf = get_yf()
+
+    async def _fetch(ticker: str) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        """Fetch a commodity quote and, if it has a price, its 1-month history."""
+        quote = await asyncio.to_thread(yf.get_quote, ticker)
+        if quote.get("regularMarketPrice") is None:
+            return quote, []
+        history = await asyncio.to_thread(yf.get_history, ticker, period="1mo")
+        return quote, history
 
     @mcp.tool()
     async def get_commodity_prices() -> str:
@@ -68,20 +65,21 @@ def register(mcp: FastMCP) -> None:
         along with 1-week and 1-month percentage changes.
         """
         cache_key = cache.make_key("commodities")
-        cached = cache.get(cache_key, "commodities")
+        cached = cache.get_raw(cache_key, "commodities")
         if cached is not None:
-            return json.dumps(cached, default=str)
+            return cached
 
         try:
             commodities: dict[str, dict[str, Any]] = {}
 
-            for label, ticker in COMMODITY_TICKERS.items():
-                quote = yf.get_quote(ticker)
+            fetched = await asyncio.gather(
+                *(_fetch(ticker) for ticker in COMMODITY_TICKERS.values())
+            )
+            for label, (quote, history) in zip(COMMODITY_TICKERS, fetched):
                 price = quote.get("regularMarketPrice")
                 if price is None:
                     continue
 
-                history = yf.get_history(ticker, period="1mo")
                 changes = _compute_pct_change(history, float(price))
 
                 commodities[label] = {
@@ -93,16 +91,15 @@ def register(mcp: FastMCP) -> None:
                 }
 
             if not commodities:
-                return json.dumps(
-                    {"status": "error", "error": "No commodity data available"}
-                )
+                return error_json("No commodity data available", status=True)
 
             result: dict[str, Any] = {
                 "status": "ok",
                 "data": commodities,
             }
-            cache.set(cache_key, "commodities", result)
-            return json.dumps(result, default=str)
+            payload = dumps(result)
+            cache.set_raw(cache_key, "commodities", payload)
+            return payload
         except Exception as e:
             logger.warning("commodity_prices_error", error=str(e))
-            return json.dumps({"status": "error", "error": str(e)})
+            return error_json(str(e), status=True)
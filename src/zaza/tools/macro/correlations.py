@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+from datetime import date
 from typing import Any
 
 import numpy as np
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache, get_yf
+from zaza.utils.history import closes_array, daily_log_returns
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
@@ -22,25 +24,70 @@ BENCHMARK_TICKERS = {
     "Gold": "GC=F",
 }
 
+# Relative variance floor below which a window is treated as constant
+_VAR_EPS = 1e-12
 
-def _compute_rolling_corr(
-    returns_a: np.ndarray, returns_b: np.ndarray, window: int
-) -> float | None:
-    """Compute rolling correlation over the last `window` days."""
-    if len(returns_a) < window or len(returns_b) < window:
-        return None
-    a = returns_a[-window:]
-    b = returns_b[-window:]
-    if np.std(a) == 0 or np.std(b) == 0:
+
+def _log_returns(history: list[dict[str, Any]]) -> np.ndarray | None:
+    """Daily log returns from OHLCV records, or None if under 30 closes."""
+    closes = closes_array(history)
+    if len(closes) < 30:
         return None
-    corr = float(np.corrcoef(a, b)[0, 1])
-    return round(corr, 4)
+    return daily_log_returns(closes)
+
+
+def _rolling_corrs(
+    returns_a: np.ndarray, returns_b: np.ndarray, windows: tuple[int, ...] = (30, 60, 90)
+) -> dict[str, float | None]:
+    """Compute trailing correlations for each window from one set of running sums.
+
+    Windows longer than the series, or with zero variance on either side,
+    yield None.
+    """
+    result: dict[str, float | None] = {f"{w}d": None for w in windows}
+    n = min(len(returns_a), len(returns_b), max(windows))
+    if n == 0:
+        return result
+    # Center on the tail mean to keep the sum-of-squares differences well conditioned
+    a = returns_a[-n:] - returns_a[-n:].mean()
+    b = returns_b[-n:] - returns_b[-n:].mean()
+    # Reverse so a window's sums are a prefix: index w-1 covers the last w days
+    sums = np.cumsum(np.stack((a, b, a * a, b * b, a * b))[:, ::-1], axis=1)
+    for w in windows:
+        if w > n:
+            continue
+        sum_a, sum_b, sum_a2, sum_b2, sum_ab = sums[:, w - 1]
+        var_a = sum_a2 - sum_a * sum_a / w
+        var_b = sum_b2 - sum_b * sum_b / w
+        if var_a <= _VAR_EPS * sum_a2 or var_b <= _VAR_EPS * sum_b2:
+            continue
+        corr = (sum_ab - sum_a * sum_b / w) / np.sqrt(var_a * var_b)
+        result[f"{w}d"] = round(float(np.clip(corr, -1.0, 1.0)), 4)
+    return result
 
 
 def register(mcp: FastMCP) -> None:
     """Register intermarket correlations tool."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    cache = get_cache()
+    yf = get_yf()
+    # Benchmark returns are identical for every target ticker, so compute them
+    # once per trading day and share them across requests.
+    bench_memo: dict[tuple[str, str], np.ndarray] = {}
+
+    async def _benchmark_returns(bench_ticker: str, day: str) -> np.ndarray | None:
+        """Memoized benchmark log returns for `day`; failed fetches are not stored."""
+        key = (bench_ticker, day)
+        returns = bench_memo.get(key)
+        if returns is not None:
+            return returns
+        history = await asyncio.to_thread(yf.get_history, bench_ticker, period="6mo")
+        returns = _log_returns(history) if history else None
+        if returns is not None:
+            if any(k[1] != day for k in bench_memo):
+                bench_memo.clear()
+            returns.flags.writeable = False
+            bench_memo[key] = returns
+        return returns
 
     @mcp.tool()
     async def get_intermarket_correlations(ticker: str) -> str:
@@ -53,57 +100,37 @@ def register(mcp: FastMCP) -> None:
             ticker: Stock ticker symbol (e.g., 'AAPL').
         """
         cache_key = cache.make_key("correlations", ticker=ticker)
-        cached = cache.get(cache_key, "correlations")
+        cached = cache.get_raw(cache_key, "correlations")
         if cached is not None:
-            return json.dumps(cached, default=str)
+            return cached
 
         try:
-            # Fetch target ticker history
-            target_history = yf.get_history(ticker, period="6mo")
-            if not target_history or len(target_history) < 30:
-                return json.dumps(
-                    {"status": "error", "error": f"Insufficient data for {ticker}"}
-                )
-
-            target_closes = np.array(
-                [r["Close"] for r in target_history if r.get("Close") is not None],
-                dtype=float,
+            # Fetch the target history and benchmark returns concurrently
+            day = date.today().isoformat()
+            target_history, *bench_series = await asyncio.gather(
+                asyncio.to_thread(yf.get_history, ticker, period="6mo"),
+                *(_benchmark_returns(t, day) for t in BENCHMARK_TICKERS.values()),
             )
-            if len(target_closes) < 30:
-                return json.dumps(
-                    {"status": "error", "error": f"Insufficient price data for {ticker}"}
-                )
+            if not target_history or len(target_history) < 30:
+                return error_json(f"Insufficient data for {ticker}", status=True)
 
-            target_returns = np.diff(np.log(target_closes))
+            target_returns = _log_returns(target_history)
+            if target_returns is None:
+                return error_json(f"Insufficient price data for {ticker}", status=True)
 
             correlations: dict[str, dict[str, float | None]] = {}
 
-            for label, bench_ticker in BENCHMARK_TICKERS.items():
-                bench_history = yf.get_history(bench_ticker, period="6mo")
-                if not bench_history:
+            for label, bench_returns in zip(BENCHMARK_TICKERS, bench_series):
+                if bench_returns is None:
                     correlations[label] = {"30d": None, "60d": None, "90d": None}
                     continue
 
-                bench_closes = np.array(
-                    [r["Close"] for r in bench_history if r.get("Close") is not None],
-                    dtype=float,
-                )
-                if len(bench_closes) < 30:
-                    correlations[label] = {"30d": None, "60d": None, "90d": None}
-                    continue
-
-                bench_returns = np.diff(np.log(bench_closes))
-
                 # Align lengths
                 min_len = min(len(target_returns), len(bench_returns))
                 t_ret = target_returns[-min_len:]
                 b_ret = bench_returns[-min_len:]
 
-                correlations[label] = {
-                    "30d": _compute_rolling_corr(t_ret, b_ret, 30),
-                    "60d": _compute_rolling_corr(t_ret, b_ret, 60),
-                    "90d": _compute_rolling_corr(t_ret, b_ret, 90),
-                }
+                correlations[label] = _rolling_corrs(t_ret, b_ret)
 
             result: dict[str, Any] = {
                 "status": "ok",
@@ -112,8 +139,9 @@ def register(mcp: FastMCP) -> None:
                     "correlations": correlations,
                 },
             }
-            cache.set(cache_key, "correlations", result)
-            return json.dumps(result, default=str)
+            payload = dumps(result)
+            cache.set_raw(cache_key, "correlations", payload)
+            return payload
         except Exception as e:
             logger.warning("correlations_error", ticker=ticker, error=str(e))
-            return json.dumps({"status": "error", "error": str(e)})
+            return error_json(str(e), status=True)
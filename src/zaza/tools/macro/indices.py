@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+from bisect import bisect_right
 from typing import Any
 
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache, get_yf
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
@@ -21,23 +22,20 @@ INDEX_TICKERS = {
     "US_Dollar": "DX-Y.NYB",
 }
 
+# VIX level bands: below 15 low, below 20 moderate, below 30 elevated, else high
+_VIX_THRESHOLDS = (15.0, 20.0, 30.0)
+_VIX_LABELS = ("low", "moderate", "elevated", "high")
+
 
 def _interpret_vix(vix_value: float) -> str:
     """Classify VIX level."""
-    if vix_value < 15:
-        return "low"
-    elif vix_value < 20:
-        return "moderate"
-    elif vix_value < 30:
-        return "elevated"
-    else:
-        return "high"
+    return _VIX_LABELS[bisect_right(_VIX_THRESHOLDS, vix_value)]
 
 
 def register(mcp: FastMCP) -> None:
     """Register market indices tool."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    cache = get_cache()
+    yf = get_yf()
 
     @mcp.tool()
     async def get_market_indices() -> str:
@@ -47,16 +45,18 @@ def register(mcp: FastMCP) -> None:
         Nasdaq, VIX, and US Dollar Index.
         """
         cache_key = cache.make_key("market_indices")
-        cached = cache.get(cache_key, "market_indices")
+        cached = cache.get_raw(cache_key, "market_indices")
         if cached is not None:
-            return json.dumps(cached, default=str)
+            return cached
 
         try:
             indices: dict[str, dict[str, Any]] = {}
             vix_value: float | None = None
 
-            for label, ticker in INDEX_TICKERS.items():
-                quote = yf.get_quote(ticker)
+            quotes = await asyncio.gather(
+                *(asyncio.to_thread(yf.get_quote, t) for t in INDEX_TICKERS.values())
+            )
+            for label, quote in zip(INDEX_TICKERS, quotes):
                 price = quote.get("regularMarketPrice")
                 prev_close = quote.get("regularMarketPreviousClose")
 
@@ -81,7 +81,7 @@ def register(mcp: FastMCP) -> None:
                     vix_value = float(price)
 
             if not indices:
-                return json.dumps({"status": "error", "error": "No market index data available"})
+                return error_json("No market index data available", status=True)
 
             vix_interp = _interpret_vix(vix_value) if vix_value is not None else "unknown"
 
@@ -92,8 +92,9 @@ def register(mcp: FastMCP) -> None:
                     "vix_interpretation": vix_interp,
                 },
             }
-            cache.set(cache_key, "market_indices", result)
-            return json.dumps(result, default=str)
+            payload = dumps(result)
+            cache.set_raw(cache_key, "market_indices", payload)
+            return payload
         except Exception as e:
             logger.warning("market_indices_error", error=str(e))
-            return json.dumps({"status": "error", "error": str(e)})
+            return error_json(str(e), status=True)
@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 from typing import Any
 
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache, get_yf
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
@@ -56,8 +56,8 @@ def _compute_trend(yields: dict[str, float]) -> str:
 
 def register(mcp: FastMCP) -> None:
     """Register treasury yields tool."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    cache = get_cache()
+    yf = get_yf()
 
     @mcp.tool()
     async def get_treasury_yields() -> str:
@@ -67,20 +67,22 @@ def register(mcp: FastMCP) -> None:
         along with curve shape (normal/flat/inverted) and trend assessment.
         """
         cache_key = cache.make_key("treasury_yields")
-        cached = cache.get(cache_key, "treasury_yields")
+        cached = cache.get_raw(cache_key, "treasury_yields")
         if cached is not None:
-            return json.dumps(cached, default=str)
+            return cached
 
         try:
             yields: dict[str, float] = {}
-            for label, ticker in TREASURY_TICKERS.items():
-                quote = yf.get_quote(ticker)
+            quotes = await asyncio.gather(
+                *(asyncio.to_thread(yf.get_quote, t) for t in TREASURY_TICKERS.values())
+            )
+            for label, quote in zip(TREASURY_TICKERS, quotes):
                 price = quote.get("regularMarketPrice")
                 if price is not None:
                     yields[label] = round(float(price), 3)
 
             if not yields:
-                return json.dumps({"status": "error", "error": "No treasury yield data available"})
+                return error_json("No treasury yield data available", status=True)
 
             curve_shape = _classify_curve(yields)
             trend = _compute_trend(yields)
@@ -103,8 +105,9 @@ def register(mcp: FastMCP) -> None:
                     "spreads": spreads,
                 },
             }
-            cache.set(cache_key, "treasury_yields", result)
-            return json.dumps(result, default=str)
+            payload = dumps(result)
+            cache.set_raw(cache_key, "treasury_yields", payload)
+            return payload
         except Exception as e:
             logger.warning("treasury_yields_error", error=str(e))
-            return json.dumps({"status": "error", "error": str(e)})
+            return error_json(str(e), status=True)
@@ -14,8 +14,7 @@ from __future__ import annotations
 
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache, get_yf
 from zaza.tools.options.chain import register as register_chain
 from zaza.tools.options.flow import register as register_flow
 from zaza.tools.options.levels import register as register_levels
@@ -24,8 +23,8 @@ from zaza.tools.options.volatility import register as register_volatility
 
 def register_options_tools(mcp: FastMCP) -> None:
     """Register all 7 options tools on the MCP server."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    cache = get_cache()
+    yf = get_yf()
 
     register_chain(mcp, yf, cache)
     register_volatility(mcp, yf, cache)
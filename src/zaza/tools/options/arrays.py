@@ -0,0 +1,41 @@
+"""Structure-of-arrays view of an options chain."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ChainArrays:
+    """Per-contract columns of an options chain, calls first and then puts.
+
+    Missing strikes and implied volatilities default to 0; missing or NaN
+    open interest counts as 0.
+    """
+
+    strike: np.ndarray
+    iv: np.ndarray
+    oi: np.ndarray
+    is_call: np.ndarray
+
+
+def chain_to_arrays(chain: dict[str, Any]) -> ChainArrays:
+    """Convert a {"calls": [...], "puts": [...]} chain into column arrays in one pass."""
+    calls = chain.get("calls", [])
+    puts = chain.get("puts", [])
+    columns = np.array(
+        [
+            (c.get("strike", 0), c.get("impliedVolatility", 0), c.get("openInterest", 0) or 0)
+            for c in [*calls, *puts]
+        ],
+        dtype=float,
+    ).reshape(-1, 3)
+    return ChainArrays(
+        strike=columns[:, 0],
+        iv=columns[:, 1],
+        oi=np.nan_to_num(columns[:, 2]),
+        is_call=np.arange(len(columns)) < len(calls),
+    )
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 import structlog
@@ -10,6 +9,7 @@ from mcp.server.fastmcp import FastMCP
 
 from zaza.api.yfinance_client import YFinanceClient
 from zaza.cache.store import FileCache
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
@@ -30,10 +30,10 @@ def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
                 "expirations": expirations,
                 "count": len(expirations),
             }
-            return json.dumps(result, default=str)
+            return dumps(result)
         except Exception as e:
             logger.warning("get_options_expirations_error", ticker=ticker, error=str(e))
-            return json.dumps({"error": f"Failed to get expirations for {ticker}: {e}"})
+            return error_json(f"Failed to get expirations for {ticker}: {e}")
 
     @mcp.tool()
     async def get_options_chain(ticker: str, expiration_date: str) -> str:
@@ -52,7 +52,7 @@ def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
                 "call_count": len(chain.get("calls", [])),
                 "put_count": len(chain.get("puts", [])),
             }
-            return json.dumps(result, default=str)
+            return dumps(result)
         except Exception as e:
             logger.warning("get_options_chain_error", ticker=ticker, error=str(e))
-            return json.dumps({"error": f"Failed to get options chain for {ticker}: {e}"})
+            return error_json(f"Failed to get options chain for {ticker}: {e}")
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-import json
+import heapq
+from operator import itemgetter
 from typing import Any
 
+import numpy as np
 import structlog
 from mcp.server.fastmcp import FastMCP
 
 from zaza.api.yfinance_client import YFinanceClient
 from zaza.cache.store import FileCache
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
@@ -20,34 +23,50 @@ MIN_VOLUME = 50
 
 
 def _find_unusual_activity(
-    contracts: list[dict[str, Any]], option_type: str
+    contracts: list[dict[str, Any]], option_type: str, expiration: str
 ) -> list[dict[str, Any]]:
     """Identify contracts with unusual volume relative to open interest."""
+    if not contracts:
+        return []
+    n = len(contracts)
+    volume = np.fromiter((c.get("volume", 0) or 0 for c in contracts), dtype=float, count=n)
+    oi = np.fromiter((c.get("openInterest", 0) or 0 for c in contracts), dtype=float, count=n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vol_oi_ratio = np.where(oi > 0, volume / oi, np.inf)
+    mask = (volume >= MIN_VOLUME) & (vol_oi_ratio >= UNUSUAL_VOL_OI_RATIO)
+
     unusual = []
-    for c in contracts:
-        volume = c.get("volume", 0) or 0
-        oi = c.get("openInterest", 0) or 0
-        if volume < MIN_VOLUME:
-            continue
-        vol_oi_ratio = volume / oi if oi > 0 else float("inf")
-        if vol_oi_ratio >= UNUSUAL_VOL_OI_RATIO:
-            strike = c.get("strike", 0)
-            last_price = c.get("lastPrice", 0)
-            notional = volume * last_price * 100  # each contract = 100 shares
-            unusual.append({
-                "type": option_type,
-                "strike": strike,
-                "volume": volume,
-                "openInterest": oi,
-                "vol_oi_ratio": round(vol_oi_ratio, 2),
-                "lastPrice": last_price,
-                "impliedVolatility": c.get("impliedVolatility", 0),
-                "notional": round(notional, 2),
-                "contractSymbol": c.get("contractSymbol", ""),
-            })
+    for i in np.flatnonzero(mask):
+        c = contracts[i]
+        volume_i = c.get("volume", 0) or 0
+        last_price = c.get("lastPrice", 0)
+        notional = volume_i * last_price * 100  # each contract = 100 shares
+        unusual.append({
+            "type": option_type,
+            "strike": c.get("strike", 0),
+            "volume": volume_i,
+            "openInterest": c.get("openInterest", 0) or 0,
+            "vol_oi_ratio": round(float(vol_oi_ratio[i]), 2),
+            "lastPrice": last_price,
+            "impliedVolatility": c.get("impliedVolatility", 0),
+            "notional": round(notional, 2),
+            "contractSymbol": c.get("contractSymbol", ""),
+            "expiration": expiration,
+        })
     return unusual
 
 
+def _volume_oi_totals(contracts: list[dict[str, Any]]) -> tuple[int, int]:
+    """Sum volume and open interest over contracts, counting missing/NaN as 0."""
+    if not contracts:
+        return 0, 0
+    values = np.array(
+        [(c.get("volume") or 0, c.get("openInterest") or 0) for c in contracts], dtype=float
+    )
+    volume, oi = np.nansum(values, axis=0)
+    return int(volume), int(oi)
+
+
 def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
     """Register options flow tools on the MCP server."""
 
@@ -63,7 +82,7 @@ def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
             ticker_upper = ticker.upper()
             expirations = yf.get_options_expirations(ticker_upper)
             if not expirations:
-                return json.dumps({
+                return dumps({
                     "ticker": ticker_upper,
                     "unusual_activity": [],
                     "total_unusual": 0,
@@ -74,31 +93,22 @@ def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
             all_unusual: list[dict[str, Any]] = []
             for exp in expirations[:3]:
                 chain = yf.get_options_chain(ticker_upper, exp)
-                calls = chain.get("calls", [])
-                puts = chain.get("puts", [])
-
-                call_unusual = _find_unusual_activity(calls, "call")
-                put_unusual = _find_unusual_activity(puts, "put")
-
-                for u in call_unusual + put_unusual:
-                    u["expiration"] = exp
+                all_unusual.extend(_find_unusual_activity(chain.get("calls", []), "call", exp))
+                all_unusual.extend(_find_unusual_activity(chain.get("puts", []), "put", exp))
 
-                all_unusual.extend(call_unusual)
-                all_unusual.extend(put_unusual)
-
-            # Sort by notional value descending
-            all_unusual.sort(key=lambda x: x.get("notional", 0), reverse=True)
+            # Top 20 by notional value, descending
+            top = heapq.nlargest(20, all_unusual, key=itemgetter("notional"))
 
             result: dict[str, Any] = {
                 "ticker": ticker_upper,
-                "unusual_activity": all_unusual[:20],  # top 20
+                "unusual_activity": top,
                 "total_unusual": len(all_unusual),
                 "expirations_scanned": expirations[:3],
             }
-            return json.dumps(result, default=str)
+            return dumps(result)
         except Exception as e:
             logger.warning("get_options_flow_error", ticker=ticker, error=str(e))
-            return json.dumps({"error": f"Failed to get options flow for {ticker}: {e}"})
+            return error_json(f"Failed to get options flow for {ticker}: {e}")
 
     @mcp.tool()
     async def get_put_call_ratio(ticker: str) -> str:
@@ -111,22 +121,16 @@ def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
             ticker_upper = ticker.upper()
             expirations = yf.get_options_expirations(ticker_upper)
             if not expirations:
-                return json.dumps({"error": f"No options data for {ticker}"})
-
-            total_call_vol = 0
-            total_put_vol = 0
-            total_call_oi = 0
-            total_put_oi = 0
+                return error_json(f"No options data for {ticker}")
 
             # Aggregate across nearest expirations
-            for exp in expirations[:3]:
-                chain = yf.get_options_chain(ticker_upper, exp)
-                for c in chain.get("calls", []):
-                    total_call_vol += c.get("volume", 0) or 0
-                    total_call_oi += c.get("openInterest", 0) or 0
-                for p in chain.get("puts", []):
-                    total_put_vol += p.get("volume", 0) or 0
-                    total_put_oi += p.get("openInterest", 0) or 0
+            chains = [yf.get_options_chain(ticker_upper, exp) for exp in expirations[:3]]
+            total_call_vol, total_call_oi = _volume_oi_totals(
+                [c for chain in chains for c in chain.get("calls", [])]
+            )
+            total_put_vol, total_put_oi = _volume_oi_totals(
+                [p for chain in chains for p in chain.get("puts", [])]
+            )
 
             pc_volume = total_put_vol / total_call_vol if total_call_vol > 0 else 0.0
             pc_oi = total_put_oi / total_call_oi if total_call_oi > 0 else 0.0
@@ -152,7 +156,7 @@ def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
                 "interpretation": interpretation,
                 "expirations_included": expirations[:3],
             }
-            return json.dumps(result, default=str)
+            return dumps(result)
         except Exception as e:
             logger.warning("get_put_call_ratio_error", ticker=ticker, error=str(e))
-            return json.dumps({"error": f"Failed to get put/call ratio for {ticker}: {e}"})
+            return error_json(f"Failed to get put/call ratio for {ticker}: {e}")
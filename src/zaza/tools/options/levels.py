@@ -2,107 +2,114 @@
 
 from __future__ import annotations
 
-import json
 import math
 from typing import Any
 
+import numpy as np
 import structlog
 from mcp.server.fastmcp import FastMCP
 
 from zaza.api.yfinance_client import YFinanceClient
 from zaza.cache.store import FileCache
+from zaza.tools.options.arrays import ChainArrays, chain_to_arrays
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
+# GEX assumes a fixed 30 days to expiry, so its derived constants are fixed too
+_T_GAMMA = 30 / 365
+_SQRT_T_GAMMA = math.sqrt(_T_GAMMA)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
 
-def _calculate_max_pain(
-    calls: list[dict[str, Any]], puts: list[dict[str, Any]]
-) -> float:
+
+def _calculate_max_pain(chain: ChainArrays) -> float:
     """Calculate the max pain strike price.
 
     Max pain is the strike price where total pain (intrinsic value owed)
     to option holders is minimized, i.e., where market makers pay the least.
+    Pain is piecewise linear in strike, so it is evaluated at every candidate
+    from running sums of OI and strike*OI over the sorted contracts.
     """
-    strikes = sorted(set(c["strike"] for c in calls) | set(p["strike"] for p in puts))
-    if not strikes:
+    strikes = np.unique(chain.strike)
+    if not strikes.size:
         return 0.0
-
-    min_pain = float("inf")
-    max_pain_strike = 0.0
-
-    for strike in strikes:
-        call_pain = sum(
-            max(0, strike - c["strike"]) * c.get("openInterest", 0) for c in calls
-        )
-        put_pain = sum(
-            max(0, p["strike"] - strike) * p.get("openInterest", 0) for p in puts
-        )
-        total_pain = call_pain + put_pain
-        if total_pain < min_pain:
-            min_pain = total_pain
-            max_pain_strike = strike
-
-    return max_pain_strike
-
-
-def _estimate_gamma(
-    strike: float,
-    spot: float,
-    iv: float,
-    oi: float,
-    is_call: bool,
-) -> float:
-    """Estimate option gamma using a simplified Black-Scholes approach.
-
-    Gamma = (N'(d1)) / (S * sigma * sqrt(T))
-    For simplicity, assumes T=30/365 days to expiry.
+    call_strikes, call_oi = chain.strike[chain.is_call], chain.oi[chain.is_call]
+    put_strikes, put_oi = chain.strike[~chain.is_call], chain.oi[~chain.is_call]
+
+    # Calls pay K - c for every call strike c below K
+    order = np.argsort(call_strikes, kind="stable")
+    cum_oi = np.concatenate(([0.0], np.cumsum(call_oi[order])))
+    cum_value = np.concatenate(([0.0], np.cumsum((call_strikes * call_oi)[order])))
+    below = np.searchsorted(call_strikes[order], strikes, side="left")
+    call_pain = strikes * cum_oi[below] - cum_value[below]
+
+    # Puts pay p - K for every put strike p above K
+    order = np.argsort(put_strikes, kind="stable")
+    cum_oi = np.concatenate(([0.0], np.cumsum(put_oi[order])))
+    cum_value = np.concatenate(([0.0], np.cumsum((put_strikes * put_oi)[order])))
+    at_or_below = np.searchsorted(put_strikes[order], strikes, side="right")
+    put_pain = (cum_value[-1] - cum_value[at_or_below]) - strikes * (
+        cum_oi[-1] - cum_oi[at_or_below]
+    )
+
+    return float(strikes[np.argmin(call_pain + put_pain)])
+
+
+def _gamma_exposure_by_strike(
+    chain: ChainArrays, spot: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Estimate net dealer gamma exposure per strike across a chain.
+
+    Uses a simplified Black-Scholes gamma, N'(d1) / (S * sigma * sqrt(T)),
+    assuming T=30/365 days to expiry. GEX = gamma * OI * 100 (contract
+    multiplier) * spot; calls add positive gamma and puts negative (for dealer
+    hedging). Contracts without IV, OI or a positive strike contribute 0.
+
+    Returns the sorted unique strikes and the net GEX at each.
     """
-    if iv <= 0 or spot <= 0 or oi <= 0:
-        return 0.0
+    unique_strikes, strike_idx = np.unique(chain.strike, return_inverse=True)
+    net_gex = np.zeros(unique_strikes.size)
+    if spot <= 0:
+        return unique_strikes, net_gex
 
-    T = 30 / 365  # approximate days to expiry
-    sigma = iv
-    sqrt_T = math.sqrt(T)
+    # Drop contracts that cannot contribute before any log/division
+    valid = (chain.iv > 0) & (chain.oi > 0) & (chain.strike > 0)
+    strikes, iv, oi = chain.strike[valid], chain.iv[valid], chain.oi[valid]
+    sign = np.where(chain.is_call[valid], 1.0, -1.0)
 
-    try:
-        d1 = (math.log(spot / strike) + 0.5 * sigma * sigma * T) / (sigma * sqrt_T)
-        # N'(d1) = standard normal PDF
-        n_prime_d1 = math.exp(-0.5 * d1 * d1) / math.sqrt(2 * math.pi)
-        gamma = n_prime_d1 / (spot * sigma * sqrt_T)
-    except (ValueError, ZeroDivisionError):
-        return 0.0
-
-    # GEX = gamma * OI * 100 (contract multiplier) * spot
-    # Calls add positive gamma, puts add negative gamma (for dealer hedging)
-    gex = gamma * oi * 100 * spot
-    return gex if is_call else -gex
+    iv_sqrt_t = iv * _SQRT_T_GAMMA
+    d1 = (np.log(spot / strikes) + 0.5 * iv * iv * _T_GAMMA) / iv_sqrt_t
+    # N'(d1) = standard normal PDF
+    n_prime_d1 = np.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+    gamma = n_prime_d1 / (spot * iv_sqrt_t)
+    np.add.at(net_gex, strike_idx[valid], sign * gamma * oi * 100 * spot)
+    return unique_strikes, net_gex
 
 
 def _get_oi_distribution(
-    calls: list[dict[str, Any]],
-    puts: list[dict[str, Any]],
+    chain: ChainArrays, contracts: list[dict[str, Any]]
 ) -> list[dict[str, Any]]:
-    """Build OI distribution by strike."""
-    strike_map: dict[float, dict[str, int]] = {}
-    for c in calls:
-        s = c.get("strike", 0)
-        if s not in strike_map:
-            strike_map[s] = {"call_oi": 0, "put_oi": 0}
-        strike_map[s]["call_oi"] += c.get("openInterest", 0) or 0
-    for p in puts:
-        s = p.get("strike", 0)
-        if s not in strike_map:
-            strike_map[s] = {"call_oi": 0, "put_oi": 0}
-        strike_map[s]["put_oi"] += p.get("openInterest", 0) or 0
-    dist = []
-    for strike in sorted(strike_map):
-        dist.append({
-            "strike": strike,
-            "call_oi": strike_map[strike]["call_oi"],
-            "put_oi": strike_map[strike]["put_oi"],
-            "total_oi": strike_map[strike]["call_oi"] + strike_map[strike]["put_oi"],
-        })
-    return dist
+    """Build OI distribution by strike.
+
+    ``contracts`` are the raw calls followed by puts that ``chain`` was built
+    from; each strike is reported as first given there rather than as a float.
+    """
+    unique_strikes, first_idx, strike_idx = np.unique(
+        chain.strike, return_index=True, return_inverse=True
+    )
+    call_oi = np.zeros(unique_strikes.size)
+    put_oi = np.zeros(unique_strikes.size)
+    np.add.at(call_oi, strike_idx[chain.is_call], chain.oi[chain.is_call])
+    np.add.at(put_oi, strike_idx[~chain.is_call], chain.oi[~chain.is_call])
+    return [
+        {
+            "strike": contracts[i].get("strike", 0),
+            "call_oi": int(c),
+            "put_oi": int(p),
+            "total_oi": int(c + p),
+        }
+        for i, c, p in zip(first_idx.tolist(), call_oi.tolist(), put_oi.tolist())
+    ]
 
 
 def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
@@ -124,7 +131,7 @@ def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
             if not expiration_date:
                 expirations = yf.get_options_expirations(ticker_upper)
                 if not expirations:
-                    return json.dumps({"error": f"No options expirations found for {ticker}"})
+                    return error_json(f"No options expirations found for {ticker}")
                 expiration_date = expirations[0]
 
             chain = yf.get_options_chain(ticker_upper, expiration_date)
@@ -132,9 +139,10 @@ def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
             puts = chain.get("puts", [])
 
             if not calls and not puts:
-                return json.dumps({"error": f"No options data for {ticker} at {expiration_date}"})
+                return error_json(f"No options data for {ticker} at {expiration_date}")
 
-            max_pain_strike = _calculate_max_pain(calls, puts)
+            arrays = chain_to_arrays(chain)
+            max_pain_strike = _calculate_max_pain(arrays)
 
             # Get current price
             quote = yf.get_quote(ticker_upper)
@@ -146,7 +154,7 @@ def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
             )
 
             # OI distribution
-            oi_dist = _get_oi_distribution(calls, puts)
+            oi_dist = _get_oi_distribution(arrays, [*calls, *puts])
 
             result: dict[str, Any] = {
                 "ticker": ticker_upper,
@@ -156,10 +164,10 @@ def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
                 "distance_pct": distance_pct,
                 "oi_distribution": oi_dist,
             }
-            return json.dumps(result, default=str)
+            return dumps(result)
         except Exception as e:
             logger.warning("get_max_pain_error", ticker=ticker, error=str(e))
-            return json.dumps({"error": f"Failed to calculate max pain for {ticker}: {e}"})
+            return error_json(f"Failed to calculate max pain for {ticker}: {e}")
 
     @mcp.tool()
     async def get_gamma_exposure(ticker: str, expiration_date: str | None = None) -> str:
@@ -180,7 +188,7 @@ def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
             if not expiration_date:
                 expirations = yf.get_options_expirations(ticker_upper)
                 if not expirations:
-                    return json.dumps({"error": f"No options expirations found for {ticker}"})
+                    return error_json(f"No options expirations found for {ticker}")
                 expiration_date = expirations[0]
 
             chain = yf.get_options_chain(ticker_upper, expiration_date)
@@ -188,50 +196,33 @@ def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
             puts = chain.get("puts", [])
 
             if not calls and not puts:
-                return json.dumps({"error": f"No options data for {ticker} at {expiration_date}"})
+                return error_json(f"No options data for {ticker} at {expiration_date}")
 
             # Get spot price
             quote = yf.get_quote(ticker_upper)
             spot = quote.get("regularMarketPrice", 0)
             if not spot:
-                return json.dumps({"error": f"Could not get price for {ticker}"})
+                return error_json(f"Could not get price for {ticker}")
 
             # Calculate GEX per strike
-            strike_gex: dict[float, float] = {}
-            for c in calls:
-                s = c.get("strike", 0)
-                iv = c.get("impliedVolatility", 0.3)
-                oi = c.get("openInterest", 0) or 0
-                gex = _estimate_gamma(s, spot, iv, oi, is_call=True)
-                strike_gex[s] = strike_gex.get(s, 0) + gex
-
-            for p in puts:
-                s = p.get("strike", 0)
-                iv = p.get("impliedVolatility", 0.3)
-                oi = p.get("openInterest", 0) or 0
-                gex = _estimate_gamma(s, spot, iv, oi, is_call=False)
-                strike_gex[s] = strike_gex.get(s, 0) + gex
-
-            sorted_strikes = sorted(strike_gex.keys())
+            strikes, strike_gex = _gamma_exposure_by_strike(chain_to_arrays(chain), spot)
             gex_by_strike = [
-                {"strike": s, "net_gex": round(strike_gex[s], 2)} for s in sorted_strikes
+                {"strike": s, "net_gex": g}
+                for s, g in zip(strikes.tolist(), np.round(strike_gex, 2).tolist())
             ]
 
             # Net GEX across all strikes
-            net_gex = round(sum(strike_gex.values()), 2)
+            net_gex = round(float(strike_gex.sum()), 2)
 
-            # Find GEX flip point (where sign changes)
-            gex_flip: float | None = None
-            for i in range(1, len(sorted_strikes)):
-                prev_gex = strike_gex[sorted_strikes[i - 1]]
-                curr_gex = strike_gex[sorted_strikes[i]]
-                if prev_gex * curr_gex < 0:  # sign change
-                    gex_flip = sorted_strikes[i]
-                    break
+            # Find GEX flip point (where sign changes); compare signs so tiny
+            # magnitudes cannot underflow the product to zero
+            signs = np.sign(strike_gex)
+            flips = np.flatnonzero(signs[:-1] * signs[1:] < 0)
+            gex_flip: float | None = float(strikes[flips[0] + 1]) if flips.size else None
 
             # Classify gamma zones
-            positive_gamma_zone = [s for s in sorted_strikes if strike_gex[s] > 0]
-            negative_gamma_zone = [s for s in sorted_strikes if strike_gex[s] < 0]
+            positive_gamma_zone = strikes[strike_gex > 0].tolist()
+            negative_gamma_zone = strikes[strike_gex < 0].tolist()
 
             result: dict[str, Any] = {
                 "ticker": ticker_upper,
@@ -243,7 +234,7 @@ def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
                 "positive_gamma_strikes": positive_gamma_zone,
                 "negative_gamma_strikes": negative_gamma_zone,
             }
-            return json.dumps(result, default=str)
+            return dumps(result)
         except Exception as e:
             logger.warning("get_gamma_exposure_error", ticker=ticker, error=str(e))
-            return json.dumps({"error": f"Failed to calculate GEX for {ticker}: {e}"})
+            return error_json(f"Failed to calculate GEX for {ticker}: {e}")
@@ -2,29 +2,33 @@
 
 from __future__ import annotations
 
-import json
-import statistics
 from typing import Any
 
+import numpy as np
 import structlog
 from mcp.server.fastmcp import FastMCP
 
 from zaza.api.yfinance_client import YFinanceClient
 from zaza.cache.store import FileCache
+from zaza.tools.options.arrays import chain_to_arrays
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
 
 def _compute_historical_vol(history: list[dict[str, Any]], window: int = 252) -> float:
     """Compute annualized historical volatility from daily close prices."""
-    closes = [h.get("Close", 0) for h in history if h.get("Close")]
+    closes = np.fromiter((c for h in history if (c := h.get("Close"))), dtype=np.float64)
     if len(closes) < 20:
         return 0.0
-    returns = [(closes[i] / closes[i - 1]) - 1 for i in range(1, len(closes))]
-    if not returns:
-        return 0.0
-    std = statistics.stdev(returns) if len(returns) > 1 else 0.0
-    return std * (252 ** 0.5)  # annualize
+    returns = closes[1:] / closes[:-1] - 1
+    return float(returns.std(ddof=1) * np.sqrt(252))  # annualize
+
+
+def _first_iv_at(strikes: np.ndarray, iv: np.ndarray, strike: float) -> float:
+    """IV of the first contract listed at `strike`, or 0 if there is none."""
+    matches = np.flatnonzero(strikes == strike)
+    return float(iv[matches[0]]) if matches.size else 0.0
 
 
 def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
@@ -45,12 +49,12 @@ def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
             cache_key = cache.make_key("implied_vol", ticker=ticker_upper)
             cached = cache.get(cache_key, "implied_vol")
             if cached is not None:
-                return json.dumps(cached, default=str)
+                return dumps(cached)
 
             # Get nearest expiration
             expirations = yf.get_options_expirations(ticker_upper)
             if not expirations:
-                return json.dumps({"error": f"No options expirations found for {ticker}"})
+                return error_json(f"No options expirations found for {ticker}")
 
             nearest_exp = expirations[0]
             chain = yf.get_options_chain(ticker_upper, nearest_exp)
@@ -58,30 +62,29 @@ def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
             puts = chain.get("puts", [])
 
             if not calls and not puts:
-                return json.dumps({"error": f"No options data found for {ticker}"})
+                return error_json(f"No options data found for {ticker}")
 
             # Get current price for ATM determination
             quote = yf.get_quote(ticker_upper)
             current_price = quote.get("regularMarketPrice", 0)
             if not current_price:
-                return json.dumps({"error": f"Could not get current price for {ticker}"})
+                return error_json(f"Could not get current price for {ticker}")
+
+            # One array pass over the chain, then split by side
+            arrays = chain_to_arrays(chain)
+            call_strikes, call_iv = arrays.strike[arrays.is_call], arrays.iv[arrays.is_call]
+            put_strikes, put_iv = arrays.strike[~arrays.is_call], arrays.iv[~arrays.is_call]
 
-            # Find ATM strike (closest to current price)
-            all_strikes = sorted(set(c.get("strike", 0) for c in calls))
-            if not all_strikes:
-                return json.dumps({"error": f"No strike data found for {ticker}"})
+            # Find ATM strike (closest to current price; lowest strike on ties)
+            if not call_strikes.size:
+                return error_json(f"No strike data found for {ticker}")
 
-            atm_strike = min(all_strikes, key=lambda s: abs(s - current_price))
+            distance = np.abs(call_strikes - current_price)
+            atm_strike = float(call_strikes[distance == distance.min()].min())
 
             # ATM IV: average of ATM call and put IV
-            atm_call_iv = next(
-                (c.get("impliedVolatility", 0) for c in calls if c.get("strike") == atm_strike),
-                0,
-            )
-            atm_put_iv = next(
-                (p.get("impliedVolatility", 0) for p in puts if p.get("strike") == atm_strike),
-                0,
-            )
+            atm_call_iv = _first_iv_at(call_strikes, call_iv, atm_strike)
+            atm_put_iv = _first_iv_at(put_strikes, put_iv, atm_strike)
             if atm_call_iv and atm_put_iv:
                 atm_iv = (atm_call_iv + atm_put_iv) / 2
             else:
@@ -96,19 +99,10 @@ def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
             iv_rank = min(max((atm_iv / hv) * 50, 0), 100) if hv > 0 else 50.0
 
             # IV skew: OTM put IV - OTM call IV
-            otm_puts = [p for p in puts if p.get("strike", 0) < current_price]
-            otm_calls = [c for c in calls if c.get("strike", 0) > current_price]
-
-            otm_put_iv_avg = (
-                statistics.mean(p.get("impliedVolatility", 0) for p in otm_puts)
-                if otm_puts
-                else 0
-            )
-            otm_call_iv_avg = (
-                statistics.mean(c.get("impliedVolatility", 0) for c in otm_calls)
-                if otm_calls
-                else 0
-            )
+            otm_put_iv = put_iv[put_strikes < current_price]
+            otm_call_iv = call_iv[call_strikes > current_price]
+            otm_put_iv_avg = float(otm_put_iv.mean()) if otm_put_iv.size else 0
+            otm_call_iv_avg = float(otm_call_iv.mean()) if otm_call_iv.size else 0
             iv_skew = otm_put_iv_avg - otm_call_iv_avg
 
             result: dict[str, Any] = {
@@ -124,7 +118,7 @@ def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
                 "otm_call_iv_avg": round(otm_call_iv_avg, 4),
             }
             cache.set(cache_key, "implied_vol", result)
-            return json.dumps(result, default=str)
+            return dumps(result)
         except Exception as e:
             logger.warning("get_implied_volatility_error", ticker=ticker, error=str(e))
-            return json.dumps({"error": f"Failed to get IV for {ticker}: {e}"})
+            return error_json(f"Failed to get IV for {ticker}: {e}")
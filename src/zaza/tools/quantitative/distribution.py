@@ -2,16 +2,16 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 import numpy as np
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
-from zaza.utils.models import compute_cvar, compute_return_stats, compute_var
+from zaza.api.shared import get_cache, get_yf
+from zaza.utils.history import closes_array
+from zaza.utils.jsonio import dumps, error_json
+from zaza.utils.models import compute_return_stats, compute_var_cvar
 
 logger = structlog.get_logger(__name__)
 
@@ -20,8 +20,8 @@ MIN_DATA_POINTS = 30
 
 def register(mcp: FastMCP) -> None:
     """Register return distribution tool."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    cache = get_cache()
+    yf = get_yf()
 
     @mcp.tool()
     async def get_return_distribution(ticker: str, period: str = "1y") -> str:
@@ -36,38 +36,28 @@ def register(mcp: FastMCP) -> None:
         )
         cached = cache.get(cache_key, "quant_models")
         if cached is not None:
-            return json.dumps(cached, default=str)
+            return dumps(cached)
 
         try:
             history = yf.get_history(ticker, period=period)
             if not history or len(history) < MIN_DATA_POINTS:
-                return json.dumps(
-                    {
-                        "status": "error",
-                        "error": (
-                            f"Insufficient data for {ticker}"
-                            f" (need >= {MIN_DATA_POINTS},"
-                            f" got {len(history) if history else 0})"
-                        ),
-                    }
+                return error_json(
+                    f"Insufficient data for {ticker}"
+                    f" (need >= {MIN_DATA_POINTS},"
+                    f" got {len(history) if history else 0})",
+                    status=True,
                 )
 
-            closes = np.array(
-                [r["Close"] for r in history if r.get("Close") is not None],
-                dtype=float,
-            )
+            closes = closes_array(history)
             if len(closes) < MIN_DATA_POINTS:
-                return json.dumps(
-                    {"status": "error", "error": "Insufficient valid price data"}
-                )
+                return error_json("Insufficient valid price data", status=True)
 
             returns = np.diff(closes) / closes[:-1]
 
             stats = compute_return_stats(returns)
-            var_95 = compute_var(returns, confidence=0.95)
-            var_99 = compute_var(returns, confidence=0.99)
-            cvar_95 = compute_cvar(returns, confidence=0.95)
-            cvar_99 = compute_cvar(returns, confidence=0.99)
+            risk = compute_var_cvar(returns, confidences=(0.95, 0.99))
+            var_95, cvar_95 = risk[0.95]
+            var_99, cvar_99 = risk[0.99]
 
             result: dict[str, Any] = {
                 "status": "ok",
@@ -89,7 +79,7 @@ def register(mcp: FastMCP) -> None:
                 },
             }
             cache.set(cache_key, "quant_models", result)
-            return json.dumps(result, default=str)
+            return dumps(result)
         except Exception as e:
             logger.warning("return_distribution_error", ticker=ticker, error=str(e))
-            return json.dumps({"status": "error", "error": str(e)})
+            return error_json(str(e), status=True)
@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
 from typing import Any
 
 import numpy as np
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache, get_yf
+from zaza.utils.history import closes_array, daily_log_returns
+from zaza.utils.jsonio import dumps, error_json
 from zaza.utils.models import fit_arima
 
 logger = structlog.get_logger(__name__)
@@ -20,8 +21,8 @@ MIN_DATA_POINTS = 60
 
 def register(mcp: FastMCP) -> None:
     """Register price forecast tool."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    cache = get_cache()
+    yf = get_yf()
 
     @mcp.tool()
     async def get_price_forecast(
@@ -39,60 +40,53 @@ def register(mcp: FastMCP) -> None:
         )
         cached = cache.get(cache_key, "quant_models")
         if cached is not None:
-            return json.dumps(cached, default=str)
+            return dumps(cached)
 
         try:
             history = yf.get_history(ticker, period="2y")
             if not history or len(history) < MIN_DATA_POINTS:
-                return json.dumps(
-                    {
-                        "status": "error",
-                        "error": (
-                            f"Insufficient data for {ticker}"
-                            f" (need >= {MIN_DATA_POINTS} data points,"
-                            f" got {len(history) if history else 0})"
-                        ),
-                    }
+                return error_json(
+                    f"Insufficient data for {ticker}"
+                    f" (need >= {MIN_DATA_POINTS} data points,"
+                    f" got {len(history) if history else 0})",
+                    status=True,
                 )
 
-            closes = np.array(
-                [r["Close"] for r in history if r.get("Close") is not None],
-                dtype=float,
-            )
+            closes = closes_array(history)
             if len(closes) < MIN_DATA_POINTS:
-                return json.dumps(
-                    {"status": "error", "error": "Insufficient valid price data"}
-                )
+                return error_json("Insufficient valid price data", status=True)
 
             # Compute log returns for ARIMA
-            log_returns = np.diff(np.log(closes))
-            arima_result = fit_arima(log_returns)
+            log_returns = daily_log_returns(closes)
+
+            # The fit (order search included) depends only on the returns, so
+            # it is shared by every horizon requested on the same price history
+            fit_key = cache.make_key(
+                "arima_fit",
+                returns=hashlib.blake2b(log_returns.tobytes(), digest_size=16).hexdigest(),
+            )
+            cached_fit = cache.get(fit_key, "quant_models")
+            if isinstance(cached_fit, dict):
+                arima_result = cached_fit
+            else:
+                arima_result = fit_arima(log_returns)
+                if arima_result.get("forecast"):
+                    cache.set(fit_key, "quant_models", arima_result)
 
             # Convert log return forecasts back to price levels
             last_price = float(closes[-1])
             forecast_returns = arima_result.get("forecast", [])[:horizon_days]
 
             if not forecast_returns:
-                return json.dumps(
-                    {"status": "error", "error": "ARIMA model failed to produce forecast"}
-                )
+                return error_json("ARIMA model failed to produce forecast", status=True)
 
-            forecast_prices = []
-            cumulative = 0.0
-            for ret in forecast_returns:
-                cumulative += ret
-                forecast_prices.append(round(last_price * np.exp(cumulative), 2))
+            forecast_prices = np.round(last_price * np.exp(np.cumsum(forecast_returns)), 2)
 
             # Simple confidence intervals based on historical volatility
             vol = float(np.std(log_returns))
-            upper = [
-                round(p * np.exp(1.96 * vol * np.sqrt(i + 1)), 2)
-                for i, p in enumerate(forecast_prices)
-            ]
-            lower = [
-                round(p * np.exp(-1.96 * vol * np.sqrt(i + 1)), 2)
-                for i, p in enumerate(forecast_prices)
-            ]
+            band = np.exp(1.96 * vol * np.sqrt(np.arange(1, len(forecast_prices) + 1)))
+            upper = np.round(forecast_prices * band, 2)
+            lower = np.round(forecast_prices / band, 2)
 
             result: dict[str, Any] = {
                 "status": "ok",
@@ -101,15 +95,15 @@ def register(mcp: FastMCP) -> None:
                     "model": model,
                     "current_price": round(last_price, 2),
                     "horizon_days": horizon_days,
-                    "forecast": forecast_prices,
-                    "upper_bound": upper,
-                    "lower_bound": lower,
+                    "forecast": forecast_prices.tolist(),
+                    "upper_bound": upper.tolist(),
+                    "lower_bound": lower.tolist(),
                     "arima_order": arima_result.get("order"),
                     "aic": arima_result.get("aic"),
                 },
             }
             cache.set(cache_key, "quant_models", result)
-            return json.dumps(result, default=str)
+            return dumps(result)
         except Exception as e:
             logger.warning("price_forecast_error", ticker=ticker, error=str(e))
-            return json.dumps({"status": "error", "error": str(e)})
+            return error_json(str(e), status=True)
@@ -2,26 +2,50 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 import numpy as np
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache, get_yf
+from zaza.utils.history import closes_array
+from zaza.utils.jsonio import dumps, error_json
 from zaza.utils.models import compute_half_life, compute_hurst_exponent
 
 logger = structlog.get_logger(__name__)
 
 MIN_DATA_POINTS = 60
 
+# Relative variance floor below which a window is treated as constant
+_VAR_EPS = 1e-12
+
+
+def _trailing_z_scores(closes: np.ndarray, windows: tuple[int, ...]) -> dict[str, float]:
+    """Z-score of the last close against each trailing window, from running sums.
+
+    Prices are centered on the last close, so each window's mean and sample
+    variance come from prefix sums of the reversed series. Windows longer than
+    the series or with zero variance are omitted.
+    """
+    x = (closes - closes[-1])[::-1]
+    csum = np.cumsum(x)
+    csum2 = np.cumsum(x * x)
+    z_scores: dict[str, float] = {}
+    for window in windows:
+        if len(closes) < window:
+            continue
+        mean = csum[window - 1] / window
+        var = (csum2[window - 1] - window * mean * mean) / (window - 1)
+        if var > _VAR_EPS * csum2[window - 1] / window:
+            z_scores[f"{window}d"] = round(float(-mean / np.sqrt(var)), 4)
+    return z_scores
+
 
 def register(mcp: FastMCP) -> None:
     """Register mean reversion tool."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    cache = get_cache()
+    yf = get_yf()
 
     @mcp.tool()
     async def get_mean_reversion(ticker: str) -> str:
@@ -33,48 +57,33 @@ def register(mcp: FastMCP) -> None:
         cache_key = cache.make_key("mean_reversion", ticker=ticker)
         cached = cache.get(cache_key, "quant_models")
         if cached is not None:
-            return json.dumps(cached, default=str)
+            return dumps(cached)
 
         try:
             history = yf.get_history(ticker, period="1y")
             if not history or len(history) < MIN_DATA_POINTS:
-                return json.dumps(
-                    {
-                        "status": "error",
-                        "error": (
-                            f"Insufficient data for {ticker}"
-                            f" (need >= {MIN_DATA_POINTS},"
-                            f" got {len(history) if history else 0})"
-                        ),
-                    }
+                return error_json(
+                    f"Insufficient data for {ticker}"
+                    f" (need >= {MIN_DATA_POINTS},"
+                    f" got {len(history) if history else 0})",
+                    status=True,
                 )
 
-            closes = np.array(
-                [r["Close"] for r in history if r.get("Close") is not None],
-                dtype=float,
-            )
+            closes = closes_array(history)
             if len(closes) < MIN_DATA_POINTS:
-                return json.dumps(
-                    {"status": "error", "error": "Insufficient valid price data"}
-                )
+                return error_json("Insufficient valid price data", status=True)
 
             # Compute Hurst exponent on log returns
-            log_returns = np.diff(np.log(closes))
+            log_prices = np.log(closes)
+            log_returns = np.diff(log_prices)
             hurst = compute_hurst_exponent(log_returns)
 
             # Compute half-life of mean reversion
-            half_life = compute_half_life(closes)
+            half_life = compute_half_life(closes, log_prices=log_prices)
 
             # Compute z-scores at various windows
             current = float(closes[-1])
-            z_scores: dict[str, float] = {}
-            for window in [20, 50, 100, 200]:
-                if len(closes) >= window:
-                    window_data = closes[-window:]
-                    mean = float(np.mean(window_data))
-                    std = float(np.std(window_data, ddof=1))
-                    if std > 0:
-                        z_scores[f"{window}d"] = round((current - mean) / std, 4)
+            z_scores = _trailing_z_scores(closes, (20, 50, 100, 200))
 
             # Classify mean reversion tendency
             if hurst < 0.4:
@@ -113,7 +122,7 @@ def register(mcp: FastMCP) -> None:
                 },
             }
             cache.set(cache_key, "quant_models", result)
-            return json.dumps(result, default=str)
+            return dumps(result)
         except Exception as e:
             logger.warning("mean_reversion_error", ticker=ticker, error=str(e))
-            return json.dumps({"status": "error", "error": str(e)})
+            return error_json(str(e), status=True)
@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
 from typing import Any
 
 import numpy as np
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache, get_yf
+from zaza.utils.history import closes_array, daily_log_returns
+from zaza.utils.jsonio import dumps, error_json
 from zaza.utils.models import monte_carlo_gbm
 
 logger = structlog.get_logger(__name__)
@@ -20,8 +21,8 @@ MIN_DATA_POINTS = 30
 
 def register(mcp: FastMCP) -> None:
     """Register Monte Carlo simulation tool."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    cache = get_cache()
+    yf = get_yf()
 
     @mcp.tool()
     async def get_monte_carlo_simulation(
@@ -42,38 +43,30 @@ def register(mcp: FastMCP) -> None:
         )
         cached = cache.get(cache_key, "quant_models")
         if cached is not None:
-            return json.dumps(cached, default=str)
+            return dumps(cached)
 
         try:
             history = yf.get_history(ticker, period="1y")
             if not history or len(history) < MIN_DATA_POINTS:
-                return json.dumps(
-                    {
-                        "status": "error",
-                        "error": (
-                            f"Insufficient data for Monte Carlo"
-                            f" (need >= {MIN_DATA_POINTS},"
-                            f" got {len(history) if history else 0})"
-                        ),
-                    }
+                return error_json(
+                    f"Insufficient data for Monte Carlo"
+                    f" (need >= {MIN_DATA_POINTS},"
+                    f" got {len(history) if history else 0})",
+                    status=True,
                 )
 
-            closes = np.array(
-                [r["Close"] for r in history if r.get("Close") is not None],
-                dtype=float,
-            )
+            closes = closes_array(history)
             if len(closes) < MIN_DATA_POINTS:
-                return json.dumps(
-                    {"status": "error", "error": "Insufficient valid price data"}
-                )
+                return error_json("Insufficient valid price data", status=True)
 
-            returns = np.diff(np.log(closes))
+            returns = daily_log_returns(closes)
             mu = float(np.mean(returns)) * 252  # Annualized drift
             sigma = float(np.std(returns)) * np.sqrt(252)  # Annualized vol
             current_price = float(closes[-1])
 
-            # Use a deterministic seed based on ticker hash for reproducibility
-            seed = hash(ticker) % (2**31)
+            # Deterministic per-ticker seed; hash() is salted per process, so a
+            # content digest keeps simulations reproducible across restarts
+            seed = int.from_bytes(hashlib.blake2b(ticker.encode(), digest_size=8).digest())
             mc_result = monte_carlo_gbm(
                 price=current_price,
                 mu=mu,
@@ -96,7 +89,7 @@ def register(mcp: FastMCP) -> None:
                 },
             }
             cache.set(cache_key, "quant_models", result)
-            return json.dumps(result, default=str)
+            return dumps(result)
         except Exception as e:
             logger.warning("monte_carlo_error", ticker=ticker, error=str(e))
-            return json.dumps({"status": "error", "error": str(e)})
+            return error_json(str(e), status=True)
@@ -2,19 +2,21 @@
 
 from __future__ import annotations
 
-import json
+import math
 from typing import Any
 
 import numpy as np
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache, get_yf
+from zaza.utils.history import closes_array, daily_log_returns
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
 MIN_DATA_POINTS = 60
+_SQRT_252 = math.sqrt(252)
 
 
 def _detect_regime(
@@ -29,12 +31,13 @@ def _detect_regime(
     long_window = min(60, len(returns))
 
     recent_returns = returns[-short_window:]
-    recent_vol = float(np.std(recent_returns, ddof=1) * np.sqrt(252))
-    long_vol = float(np.std(returns[-long_window:], ddof=1) * np.sqrt(252))
+    long_returns = returns[-long_window:]
+    recent_vol = float(recent_returns.std(ddof=1)) * _SQRT_252
+    long_vol = float(long_returns.std(ddof=1)) * _SQRT_252
 
     # Mean return (annualized)
-    mean_return_short = float(np.mean(recent_returns) * 252)
-    mean_return_long = float(np.mean(returns[-long_window:]) * 252)
+    mean_return_short = float(recent_returns.mean()) * 252
+    mean_return_long = float(long_returns.mean()) * 252
 
     # Trend via simple moving average comparison
     sma_20 = float(np.mean(closes[-20:])) if len(closes) >= 20 else float(closes[-1])
@@ -81,8 +84,8 @@ def _detect_regime(
 
 def register(mcp: FastMCP) -> None:
     """Register regime detection tool."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    cache = get_cache()
+    yf = get_yf()
 
     @mcp.tool()
     async def get_regime_detection(ticker: str) -> str:
@@ -97,32 +100,23 @@ def register(mcp: FastMCP) -> None:
         cache_key = cache.make_key("regime", ticker=ticker)
         cached = cache.get(cache_key, "quant_models")
         if cached is not None:
-            return json.dumps(cached, default=str)
+            return dumps(cached)
 
         try:
             history = yf.get_history(ticker, period="6mo")
             if not history or len(history) < MIN_DATA_POINTS:
-                return json.dumps(
-                    {
-                        "status": "error",
-                        "error": (
-                            f"Insufficient data for {ticker}"
-                            f" (need >= {MIN_DATA_POINTS},"
-                            f" got {len(history) if history else 0})"
-                        ),
-                    }
+                return error_json(
+                    f"Insufficient data for {ticker}"
+                    f" (need >= {MIN_DATA_POINTS},"
+                    f" got {len(history) if history else 0})",
+                    status=True,
                 )
 
-            closes = np.array(
-                [r["Close"] for r in history if r.get("Close") is not None],
-                dtype=float,
-            )
+            closes = closes_array(history)
             if len(closes) < MIN_DATA_POINTS:
-                return json.dumps(
-                    {"status": "error", "error": "Insufficient valid price data"}
-                )
+                return error_json("Insufficient valid price data", status=True)
 
-            returns = np.diff(np.log(closes))
+            returns = daily_log_returns(closes)
             regime, confidence, metrics = _detect_regime(returns, closes)
 
             result: dict[str, Any] = {
@@ -136,7 +130,7 @@ def register(mcp: FastMCP) -> None:
                 },
             }
             cache.set(cache_key, "quant_models", result)
-            return json.dumps(result, default=str)
+            return dumps(result)
         except Exception as e:
             logger.warning("regime_detection_error", ticker=ticker, error=str(e))
-            return json.dumps({"status": "error", "error": str(e)})
+            return error_json(str(e), status=True)
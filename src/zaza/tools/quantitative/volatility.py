@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
 from typing import Any
 
 import numpy as np
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache, get_yf
+from zaza.utils.history import closes_array, daily_log_returns
+from zaza.utils.jsonio import dumps, error_json
 from zaza.utils.models import fit_garch
 
 logger = structlog.get_logger(__name__)
@@ -20,8 +21,8 @@ MIN_DATA_POINTS = 252
 
 def register(mcp: FastMCP) -> None:
     """Register volatility forecast tool."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    cache = get_cache()
+    yf = get_yf()
 
     @mcp.tool()
     async def get_volatility_forecast(ticker: str, horizon_days: int = 30) -> str:
@@ -36,36 +37,40 @@ def register(mcp: FastMCP) -> None:
         )
         cached = cache.get(cache_key, "quant_models")
         if cached is not None:
-            return json.dumps(cached, default=str)
+            return dumps(cached)
 
         try:
             history = yf.get_history(ticker, period="2y")
             if not history or len(history) < MIN_DATA_POINTS:
-                return json.dumps(
-                    {
-                        "status": "error",
-                        "error": (
-                            f"Insufficient data for GARCH"
-                            f" (need >= {MIN_DATA_POINTS} data points,"
-                            f" got {len(history) if history else 0})"
-                        ),
-                    }
+                return error_json(
+                    f"Insufficient data for GARCH"
+                    f" (need >= {MIN_DATA_POINTS} data points,"
+                    f" got {len(history) if history else 0})",
+                    status=True,
                 )
 
-            closes = np.array(
-                [r["Close"] for r in history if r.get("Close") is not None],
-                dtype=float,
-            )
+            closes = closes_array(history)
             if len(closes) < MIN_DATA_POINTS:
-                return json.dumps(
-                    {"status": "error", "error": "Insufficient valid price data for GARCH"}
-                )
+                return error_json("Insufficient valid price data for GARCH", status=True)
 
-            returns = np.diff(np.log(closes))
-            garch_result = fit_garch(returns)
+            returns = daily_log_returns(closes)
+
+            # The fit does not depend on horizon_days, so every horizon requested
+            # on the same price history shares one cached GARCH fit
+            fit_key = cache.make_key(
+                "garch_fit",
+                returns=hashlib.blake2b(returns.tobytes(), digest_size=16).hexdigest(),
+            )
+            cached_fit = cache.get(fit_key, "quant_models")
+            if isinstance(cached_fit, dict):
+                garch_result = cached_fit
+            else:
+                garch_result = fit_garch(returns)
+                if "error" not in garch_result:
+                    cache.set(fit_key, "quant_models", garch_result)
 
             if "error" in garch_result:
-                return json.dumps({"status": "error", "error": garch_result["error"]})
+                return error_json(garch_result["error"], status=True)
 
             # Current realized volatility for comparison
             realized_vol_30d = round(float(np.std(returns[-30:]) * np.sqrt(252)), 4)
@@ -85,7 +90,7 @@ def register(mcp: FastMCP) -> None:
                 },
             }
             cache.set(cache_key, "quant_models", result)
-            return json.dumps(result, default=str)
+            return dumps(result)
         except Exception as e:
             logger.warning("volatility_forecast_error", ticker=ticker, error=str(e))
-            return json.dumps({"status": "error", "error": str(e)})
+            return error_json(str(e), status=True)
@@ -9,7 +9,6 @@ Tools:
 from __future__ import annotations
 
 import asyncio
-import json
 import re
 from typing import Any
 
@@ -17,8 +16,8 @@ import structlog
 import yfinance as yf
 from mcp.server.fastmcp import FastMCP
 
+from zaza.api.shared import get_cache, get_yf
 from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
 from zaza.config import (
     MARKET_EXCHANGE_MAP,
     SCREENER_DEFAULT_MARKET,
@@ -34,11 +33,15 @@ from zaza.utils.indicators import (
     compute_sma,
     ohlcv_to_dataframe,
 )
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
 # Regex to validate ticker: alphanumeric, dots, hyphens; max 10 chars
-_TICKER_PATTERN = re.compile(r"^[A-Za-z0-9.\-]{1,10}$")
+_TICKER_PATTERN = re.compile(r"[A-Za-z0-9.\-]{1,10}")
+
+# Scan type names as listed in the unknown-scan-type error
+_SCAN_TYPE_NAMES = tuple(SCAN_TYPES)
 
 
 def _resolve_exchange(market: str) -> str:
@@ -90,8 +93,8 @@ async def _score_symbol(
 
 def register(mcp: FastMCP) -> None:
     """Register screener tools with the MCP server."""
-    cache = FileCache()
-    yf_client = YFinanceClient(cache)
+    cache = get_cache()
+    yf_client = get_yf()
 
     @mcp.tool()
     async def screen_stocks(
@@ -111,20 +114,18 @@ def register(mcp: FastMCP) -> None:
         try:
             # Validate scan type
             scan_lower = scan_type.lower()
-            if scan_lower not in SCAN_TYPES:
-                return json.dumps(
-                    {
-                        "error": f"Unknown scan type '{scan_type}'. "
-                        f"Available: {list(SCAN_TYPES.keys())}"
-                    },
-                    default=str,
+            config = SCAN_TYPES.get(scan_lower)
+            if config is None:
+                return error_json(
+                    f"Unknown scan type '{scan_type}'. "
+                    f"Available: {list(_SCAN_TYPE_NAMES)}"
                 )
 
             # Validate market
             try:
                 exchange_code = _resolve_exchange(market)
             except ValueError as e:
-                return json.dumps({"error": str(e)}, default=str)
+                return error_json(str(e))
 
             # Check cache
             cache_key = cache.make_key(
@@ -132,9 +133,7 @@ def register(mcp: FastMCP) -> None:
             )
             cached = cache.get(cache_key, "screener_results")
             if cached is not None:
-                return json.dumps(cached, default=str)
-
-            config = SCAN_TYPES[scan_lower]
+                return dumps(cached)
 
             # Phase 1: Build query and paginate through all yfinance results
             query = config.build_query(exchange_code)
@@ -174,7 +173,7 @@ def register(mcp: FastMCP) -> None:
                     "total_results": 0,
                     "results": [],
                 }
-                return json.dumps(result, default=str)
+                return dumps(result)
 
             # Phase 2: Score each candidate with TA indicators
             semaphore = asyncio.Semaphore(SCREENER_TA_CONCURRENCY)
@@ -209,11 +208,11 @@ def register(mcp: FastMCP) -> None:
             # Cache results
             cache.set(cache_key, "screener_results", result)
 
-            return json.dumps(result, default=str)
+            return dumps(result)
 
         except Exception as e:
             logger.warning("screen_stocks_error", scan_type=scan_type, error=str(e))
-            return json.dumps({"error": str(e)}, default=str)
+            return error_json(str(e))
 
     @mcp.tool()
     async def get_screening_strategies() -> str:
@@ -226,7 +225,7 @@ def register(mcp: FastMCP) -> None:
             {"name": cfg.name, "description": cfg.description}
             for cfg in SCAN_TYPES.values()
         ]
-        return json.dumps({"strategies": strategies}, default=str)
+        return dumps({"strategies": strategies})
 
     @mcp.tool()
     async def get_buy_sell_levels(
@@ -248,34 +247,25 @@ def register(mcp: FastMCP) -> None:
         """
         try:
             # Validate ticker
-            if not _TICKER_PATTERN.match(ticker):
-                return json.dumps(
-                    {"error": f"Invalid ticker format: '{ticker}'"},
-                    default=str,
-                )
+            if not _TICKER_PATTERN.fullmatch(ticker):
+                return error_json(f"Invalid ticker format: '{ticker}'")
 
             # Validate market
             try:
                 _resolve_exchange(market)
             except ValueError as e:
-                return json.dumps({"error": str(e)}, default=str)
+                return error_json(str(e))
 
             # Fetch history
             records = await asyncio.to_thread(
                 yf_client.get_history, ticker.upper(), period="1y"
             )
             if not records:
-                return json.dumps(
-                    {"error": f"No price history found for {ticker.upper()}"},
-                    default=str,
-                )
+                return error_json(f"No price history found for {ticker.upper()}")
 
             df = ohlcv_to_dataframe(records)
             if len(df) < 5:
-                return json.dumps(
-                    {"error": f"Insufficient price history for {ticker.upper()}"},
-                    default=str,
-                )
+                return error_json(f"Insufficient price history for {ticker.upper()}")
 
             # Compute levels
             pivots = compute_pivot_points(df)
@@ -318,10 +308,10 @@ def register(mcp: FastMCP) -> None:
                 },
             }
 
-            return json.dumps(result, default=str)
+            return dumps(result)
 
         except Exception as e:
             logger.warning(
                 "buy_sell_levels_error", ticker=ticker, error=str(e)
             )
-            return json.dumps({"error": str(e)}, default=str)
+            return error_json(str(e))
@@ -11,8 +11,7 @@ from __future__ import annotations
 
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_cache, get_yf
 from zaza.tools.sentiment.insider import register as register_insider
 from zaza.tools.sentiment.market import register as register_market
 from zaza.tools.sentiment.news import register as register_news
@@ -21,8 +20,8 @@ from zaza.tools.sentiment.social import register as register_social
 
 def register_sentiment_tools(mcp: FastMCP) -> None:
     """Register all 4 sentiment tools on the MCP server."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    cache = get_cache()
+    yf = get_yf()
 
     register_news(mcp, yf, cache)
     register_social(mcp, cache)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 from typing import Any
 
 import structlog
@@ -10,6 +10,7 @@ from mcp.server.fastmcp import FastMCP
 
 from zaza.api.yfinance_client import YFinanceClient
 from zaza.cache.store import FileCache
+from zaza.utils.jsonio import dumps, error_json
 from zaza.utils.sentiment import classify_insider_activity
 
 logger = structlog.get_logger(__name__)
@@ -33,9 +34,9 @@ def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
             cache_key = cache.make_key("insider_sentiment", ticker=ticker_upper, months=months)
             cached = cache.get(cache_key, "insider_sentiment")
             if cached is not None:
-                return json.dumps(cached, default=str)
+                return dumps(cached)
 
-            transactions = yf.get_insider_transactions(ticker_upper)
+            transactions = await asyncio.to_thread(yf.get_insider_transactions, ticker_upper)
             analysis = classify_insider_activity(transactions)
 
             result: dict[str, Any] = {
@@ -46,7 +47,7 @@ def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
                 "transaction_count": len(transactions),
             }
             cache.set(cache_key, "insider_sentiment", result)
-            return json.dumps(result, default=str)
+            return dumps(result)
         except Exception as e:
             logger.warning("get_insider_sentiment_error", ticker=ticker, error=str(e))
-            return json.dumps({"error": f"Failed to get insider sentiment for {ticker}: {e}"})
+            return error_json(f"Failed to get insider sentiment for {ticker}: {e}")
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 import httpx
@@ -10,10 +9,26 @@ import structlog
 from mcp.server.fastmcp import FastMCP
 
 from zaza.cache.store import FileCache
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
 FEAR_GREED_URL = "https://production.dataviz.cnn.io/index/fearandgreed/graphdata"
+FEAR_GREED_LIMITS = httpx.Limits(max_keepalive_connections=8, keepalive_expiry=300)
+
+_http: httpx.AsyncClient | None = None
+
+
+def _client() -> httpx.AsyncClient:
+    """Return the module's pooled HTTP session, opening it on first use."""
+    global _http
+    if _http is None or _http.is_closed:
+        _http = httpx.AsyncClient(
+            timeout=15.0,
+            limits=FEAR_GREED_LIMITS,
+            headers={"User-Agent": "Mozilla/5.0 Zaza/1.0"},
+        )
+    return _http
 
 
 def register(mcp: FastMCP, cache: FileCache) -> None:
@@ -31,15 +46,11 @@ def register(mcp: FastMCP, cache: FileCache) -> None:
             cache_key = cache.make_key("fear_greed")
             cached = cache.get(cache_key, "fear_greed")
             if cached is not None:
-                return json.dumps(cached, default=str)
+                return dumps(cached)
 
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                resp = await client.get(
-                    FEAR_GREED_URL,
-                    headers={"User-Agent": "Mozilla/5.0 Zaza/1.0"},
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await _client().get(FEAR_GREED_URL)
+            resp.raise_for_status()
+            data = resp.json()
 
             fg = data.get("fear_and_greed", {})
             result: dict[str, Any] = {
@@ -53,7 +64,7 @@ def register(mcp: FastMCP, cache: FileCache) -> None:
             }
 
             cache.set(cache_key, "fear_greed", result)
-            return json.dumps(result, default=str)
+            return dumps(result)
         except Exception as e:
             logger.warning("get_fear_greed_index_error", error=str(e))
-            return json.dumps({"error": f"Failed to get Fear & Greed Index: {e}"})
+            return error_json(f"Failed to get Fear & Greed Index: {e}")
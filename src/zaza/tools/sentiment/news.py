@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 from typing import Any
 
 import structlog
@@ -10,6 +10,7 @@ from mcp.server.fastmcp import FastMCP
 
 from zaza.api.yfinance_client import YFinanceClient
 from zaza.cache.store import FileCache
+from zaza.utils.jsonio import dumps, error_json
 from zaza.utils.sentiment import aggregate_sentiment, score_headline
 
 logger = structlog.get_logger(__name__)
@@ -33,9 +34,11 @@ def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
             cache_key = cache.make_key("news_sentiment", ticker=ticker_upper, days=days)
             cached = cache.get(cache_key, "news_sentiment")
             if cached is not None:
-                return json.dumps(cached, default=str)
+                return dumps(cached)
 
-            news = yf.get_news(ticker_upper)
+            # yfinance is blocking; run it off the event loop so other tool
+            # calls (e.g. the rest of a sentiment fan-out) can proceed
+            news = await asyncio.to_thread(yf.get_news, ticker_upper)
             if not news:
                 result: dict[str, Any] = {
                     "ticker": ticker_upper,
@@ -47,7 +50,7 @@ def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
                     },
                     "articles": [],
                 }
-                return json.dumps(result, default=str)
+                return dumps(result)
 
             # Score each headline
             articles: list[dict[str, Any]] = []
@@ -72,7 +75,7 @@ def register(mcp: FastMCP, yf: YFinanceClient, cache: FileCache) -> None:
                 "articles": articles,
             }
             cache.set(cache_key, "news_sentiment", result)
-            return json.dumps(result, default=str)
+            return dumps(result)
         except Exception as e:
             logger.warning("get_news_sentiment_error", ticker=ticker, error=str(e))
-            return json.dumps({"error": f"Failed to get news sentiment for {ticker}: {e}"})
+            return error_json(f"Failed to get news sentiment for {ticker}: {e}")
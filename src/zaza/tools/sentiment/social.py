@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 from typing import Any
 
 import structlog
@@ -16,11 +16,26 @@ from zaza.config import (
     get_reddit_client_secret,
     has_reddit_credentials,
 )
+from zaza.utils.jsonio import dumps, error_json
 from zaza.utils.sentiment import aggregate_sentiment, score_social_post
 
 logger = structlog.get_logger(__name__)
 
 
+def _get_reddit_posts(ticker: str, cache: FileCache) -> list[dict[str, Any]] | None:
+    """Fetch recent Reddit mentions, or None when Reddit is not configured.
+
+    PRAW is synchronous, so this runs in a worker thread.
+    """
+    if not has_reddit_credentials():
+        return None
+    client_id = get_reddit_client_id()
+    client_secret = get_reddit_client_secret()
+    if not (client_id and client_secret):
+        return None
+    return RedditClient(client_id, client_secret, cache).get_ticker_mentions(ticker)
+
+
 def register(mcp: FastMCP, cache: FileCache) -> None:
     """Register social sentiment tool on the MCP server."""
 
@@ -38,7 +53,15 @@ def register(mcp: FastMCP, cache: FileCache) -> None:
             cache_key = cache.make_key("social_sentiment", ticker=ticker_upper)
             cached = cache.get(cache_key, "social_sentiment")
             if cached is not None:
-                return json.dumps(cached, default=str)
+                return dumps(cached)
+
+            # Reddit (blocking PRAW, in a thread) and StockTwits are fetched
+            # concurrently; each source degrades independently on failure
+            reddit_result, st_result = await asyncio.gather(
+                asyncio.to_thread(_get_reddit_posts, ticker_upper, cache),
+                StockTwitsClient(cache).get_ticker_stream(ticker_upper),
+                return_exceptions=True,
+            )
 
             all_scores: list[dict[str, Any]] = []
 
@@ -48,32 +71,30 @@ def register(mcp: FastMCP, cache: FileCache) -> None:
                 "post_count": 0,
                 "posts": [],
             }
-            if has_reddit_credentials():
-                try:
-                    client_id = get_reddit_client_id()
-                    client_secret = get_reddit_client_secret()
-                    if client_id and client_secret:
-                        reddit_client = RedditClient(client_id, client_secret, cache)
-                        posts = reddit_client.get_ticker_mentions(ticker_upper)
-                        scored_posts = []
-                        for post in posts:
-                            text = f"{post.get('title', '')} {post.get('selftext', '')}"
-                            sentiment_data = score_social_post(text)
-                            all_scores.append(sentiment_data)
-                            scored_posts.append({
-                                "subreddit": post.get("subreddit", ""),
-                                "title": post.get("title", ""),
-                                "score": post.get("score", 0),
-                                **sentiment_data,
-                            })
-                        reddit_data = {
-                            "available": True,
-                            "post_count": len(posts),
-                            "posts": scored_posts[:10],  # top 10
-                        }
-                except Exception as e:
-                    logger.warning("reddit_sentiment_error", ticker=ticker, error=str(e))
-                    reddit_data["error"] = str(e)
+            try:
+                if isinstance(reddit_result, BaseException):
+                    raise reddit_result
+                if reddit_result is not None:
+                    posts = reddit_result
+                    scored_posts = []
+                    for post in posts:
+                        text = f"{post.get('title', '')} {post.get('selftext', '')}"
+                        sentiment_data = score_social_post(text)
+                        all_scores.append(sentiment_data)
+                        scored_posts.append({
+                            "subreddit": post.get("subreddit", ""),
+                            "title": post.get("title", ""),
+                            "score": post.get("score", 0),
+                            **sentiment_data,
+                        })
+                    reddit_data = {
+                        "available": True,
+                        "post_count": len(posts),
+                        "posts": scored_posts[:10],  # top 10
+                    }
+            except Exception as e:
+                logger.warning("reddit_sentiment_error", ticker=ticker, error=str(e))
+                reddit_data["error"] = str(e)
 
             # StockTwits (always available, no API key needed)
             st_data: dict[str, Any] = {
@@ -81,8 +102,8 @@ def register(mcp: FastMCP, cache: FileCache) -> None:
                 "messages": [],
             }
             try:
-                st_client = StockTwitsClient(cache)
-                st_result = await st_client.get_ticker_stream(ticker_upper)
+                if isinstance(st_result, BaseException):
+                    raise st_result
                 messages = st_result.get("messages", [])
                 scored_messages = []
                 for msg in messages:
@@ -112,7 +133,7 @@ def register(mcp: FastMCP, cache: FileCache) -> None:
                 "stocktwits": st_data,
             }
             cache.set(cache_key, "social_sentiment", result)
-            return json.dumps(result, default=str)
+            return dumps(result)
         except Exception as e:
             logger.warning("get_social_sentiment_error", ticker=ticker, error=str(e))
-            return json.dumps({"error": f"Failed to get social sentiment for {ticker}: {e}"})
+            return error_json(f"Failed to get social sentiment for {ticker}: {e}")
@@ -2,27 +2,25 @@
 
 from __future__ import annotations
 
-import json
-
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
+from zaza.api.shared import get_yf
 from zaza.utils.indicators import (
+    cached_ohlcv_dataframe,
     compute_macd,
     compute_rsi,
     compute_stochastic,
-    ohlcv_to_dataframe,
+    tally_signals,
 )
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
 
 def register(mcp: FastMCP) -> None:
     """Register momentum indicators tool with the MCP server."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    yf = get_yf()
 
     @mcp.tool()
     async def get_momentum_indicators(
@@ -40,34 +38,19 @@ def register(mcp: FastMCP) -> None:
         try:
             history = yf.get_history(ticker, period=period)
             if not history:
-                return json.dumps(
-                    {"error": f"No price history available for {ticker}"},
-                    default=str,
-                )
+                return error_json(f"No price history available for {ticker}")
 
-            df = ohlcv_to_dataframe(history)
+            df = cached_ohlcv_dataframe(ticker, period, history)
             rsi_data = compute_rsi(df)
             macd_data = compute_macd(df)
             stoch_data = compute_stochastic(df)
 
             # Build overall momentum assessment
-            bullish_count = 0
-            bearish_count = 0
-            for indicator_data in [rsi_data, macd_data, stoch_data]:
-                sig = indicator_data.get("signal", "")
-                if "bullish" in sig or sig == "oversold":
-                    bullish_count += 1
-                elif "bearish" in sig or sig == "overbought":
-                    bearish_count += 1
-
-            if bullish_count > bearish_count:
-                overall = "bullish"
-            elif bearish_count > bullish_count:
-                overall = "bearish"
-            else:
-                overall = "neutral"
+            overall = tally_signals(
+                d.get("signal", "") for d in (rsi_data, macd_data, stoch_data)
+            )
 
-            return json.dumps({
+            return dumps({
                 "status": "ok",
                 "ticker": ticker.upper(),
                 "period": period,
@@ -77,8 +60,8 @@ def register(mcp: FastMCP) -> None:
                     "stochastic": stoch_data,
                     "overall_momentum": overall,
                 },
-            }, default=str)
+            })
 
         except Exception as e:
             logger.warning("get_momentum_error", ticker=ticker, error=str(e))
-            return json.dumps({"error": str(e)}, default=str)
+            return error_json(str(e))
@@ -2,24 +2,29 @@
 
 from __future__ import annotations
 
-import json
-
 import numpy as np
 import structlog
 import ta
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
-from zaza.utils.indicators import compute_cmf, compute_mfi, ohlcv_to_dataframe
+from zaza.api.shared import get_yf
+from zaza.utils.indicators import (
+    cached_ohlcv_dataframe,
+    compute_cmf,
+    compute_mfi,
+    tally_signals,
+)
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
+# Overall money flow label for each tally_signals vote
+_FLOW_BY_VOTE = {"bullish": "inflow", "bearish": "outflow", "neutral": "neutral"}
+
 
 def register(mcp: FastMCP) -> None:
     """Register money flow tool with the MCP server."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    yf = get_yf()
 
     @mcp.tool()
     async def get_money_flow(
@@ -38,12 +43,9 @@ def register(mcp: FastMCP) -> None:
         try:
             history = yf.get_history(ticker, period=period)
             if not history:
-                return json.dumps(
-                    {"error": f"No price history available for {ticker}"},
-                    default=str,
-                )
+                return error_json(f"No price history available for {ticker}")
 
-            df = ohlcv_to_dataframe(history)
+            df = cached_ohlcv_dataframe(ticker, period, history)
             cmf_value = compute_cmf(df)
             mfi_data = compute_mfi(df)
 
@@ -61,33 +63,18 @@ def register(mcp: FastMCP) -> None:
             else:
                 cmf_signal = "insufficient_data"
 
-            # Overall money flow assessment
-            bullish = 0
-            bearish = 0
+            # Overall money flow assessment; CMF votes on its sign
+            cmf_vote = ""
             if cmf_value is not None and cmf_value > 0:
-                bullish += 1
+                cmf_vote = "bullish"
             elif cmf_value is not None and cmf_value < 0:
-                bearish += 1
-
-            mfi_sig = mfi_data.get("signal", "")
-            if mfi_sig == "oversold":
-                bullish += 1
-            elif mfi_sig == "overbought":
-                bearish += 1
-
-            if williams_r.get("signal") == "oversold":
-                bullish += 1
-            elif williams_r.get("signal") == "overbought":
-                bearish += 1
-
-            if bullish > bearish:
-                overall = "inflow"
-            elif bearish > bullish:
-                overall = "outflow"
-            else:
-                overall = "neutral"
+                cmf_vote = "bearish"
+            vote = tally_signals(
+                (cmf_vote, mfi_data.get("signal", ""), williams_r.get("signal", ""))
+            )
+            overall = _FLOW_BY_VOTE[vote]
 
-            return json.dumps({
+            return dumps({
                 "status": "ok",
                 "ticker": ticker.upper(),
                 "period": period,
@@ -100,11 +87,11 @@ def register(mcp: FastMCP) -> None:
                     "williams_r": williams_r,
                     "overall_flow": overall,
                 },
-            }, default=str)
+            })
 
         except Exception as e:
             logger.warning("get_money_flow_error", ticker=ticker, error=str(e))
-            return json.dumps({"error": str(e)}, default=str)
+            return error_json(str(e))
 
 
 def _compute_williams_r(df: object, period: int = 14) -> dict:
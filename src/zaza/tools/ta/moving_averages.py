@@ -2,22 +2,19 @@
 
 from __future__ import annotations
 
-import json
-
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
-from zaza.utils.indicators import compute_ema, compute_sma, ohlcv_to_dataframe
+from zaza.api.shared import get_yf
+from zaza.utils.indicators import cached_ohlcv_dataframe, compute_ema, compute_sma
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
 
 def register(mcp: FastMCP) -> None:
     """Register moving averages tool with the MCP server."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    yf = get_yf()
 
     @mcp.tool()
     async def get_moving_averages(
@@ -35,12 +32,9 @@ def register(mcp: FastMCP) -> None:
         try:
             history = yf.get_history(ticker, period=period)
             if not history:
-                return json.dumps(
-                    {"error": f"No price history available for {ticker}"},
-                    default=str,
-                )
+                return error_json(f"No price history available for {ticker}")
 
-            df = ohlcv_to_dataframe(history)
+            df = cached_ohlcv_dataframe(ticker, period, history)
             sma_data = compute_sma(df, [20, 50, 200])
             ema_data = compute_ema(df, [12, 26])
 
@@ -68,8 +62,8 @@ def register(mcp: FastMCP) -> None:
 
             result["data"]["summary"] = "; ".join(signals) if signals else "insufficient data"
 
-            return json.dumps(result, default=str)
+            return dumps(result)
 
         except Exception as e:
             logger.warning("get_moving_averages_error", ticker=ticker, error=str(e))
-            return json.dumps({"error": str(e)}, default=str)
+            return error_json(str(e))
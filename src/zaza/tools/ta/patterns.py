@@ -2,23 +2,22 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
+import numpy as np
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
-from zaza.utils.indicators import ohlcv_to_dataframe
+from zaza.api.shared import get_yf
+from zaza.utils.indicators import cached_ohlcv_dataframe
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
 
 def register(mcp: FastMCP) -> None:
     """Register candlestick pattern detection tool with the MCP server."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    yf = get_yf()
 
     @mcp.tool()
     async def get_price_patterns(
@@ -37,15 +36,12 @@ def register(mcp: FastMCP) -> None:
         try:
             history = yf.get_history(ticker, period=period)
             if not history:
-                return json.dumps(
-                    {"error": f"No price history available for {ticker}"},
-                    default=str,
-                )
+                return error_json(f"No price history available for {ticker}")
 
-            df = ohlcv_to_dataframe(history)
+            df = cached_ohlcv_dataframe(ticker, period, history)
             patterns = _detect_patterns(df)
 
-            return json.dumps({
+            return dumps({
                 "status": "ok",
                 "ticker": ticker.upper(),
                 "period": period,
@@ -54,18 +50,19 @@ def register(mcp: FastMCP) -> None:
                     "patterns_found": len(patterns),
                     "current_price": float(df["Close"].iloc[-1]),
                 },
-            }, default=str)
+            })
 
         except Exception as e:
             logger.warning("get_price_patterns_error", ticker=ticker, error=str(e))
-            return json.dumps({"error": str(e)}, default=str)
+            return error_json(str(e))
 
 
 def _detect_patterns(df: Any) -> list[dict[str, Any]]:
     """Detect candlestick patterns in OHLCV data.
 
     Scans the last 10 trading days for common single-candle and
-    two-candle patterns.
+    two-candle patterns. The candle measurements and pattern conditions
+    are evaluated as array masks; dicts are built only for the hits.
 
     Returns:
         List of detected patterns with name, type, date, and description.
@@ -79,34 +76,54 @@ def _detect_patterns(df: Any) -> list[dict[str, Any]]:
     lows = df["Low"].values
     closes = df["Close"].values
 
-    # Scan last 10 candles (or all if fewer)
-    scan_range = min(10, len(df) - 1)
-
-    for i in range(len(df) - scan_range, len(df)):
-        o, h, lo, c = opens[i], highs[i], lows[i], closes[i]
-        body = abs(c - o)
-        total_range = h - lo
-        if total_range == 0:
-            continue
-
-        body_ratio = body / total_range
-        upper_shadow = h - max(o, c)
-        lower_shadow = min(o, c) - lo
-
+    # Scan last 10 candles (or all if fewer); each has a previous candle
+    start = len(df) - min(10, len(df) - 1)
+    o, h, lo, c = opens[start:], highs[start:], lows[start:], closes[start:]
+    prev_o, prev_c = opens[start - 1:-1], closes[start - 1:-1]
+
+    body = np.abs(c - o)
+    total_range = h - lo
+    # Candles with no range are skipped entirely
+    valid = total_range != 0
+    body_ratio = np.divide(body, total_range, out=np.ones_like(body), where=valid)
+    upper_shadow = h - np.maximum(o, c)
+    lower_shadow = np.minimum(o, c) - lo
+
+    # Doji: very small body relative to range
+    doji = valid & (body_ratio < 0.1)
+    # Hammer: small body at top, long lower shadow (bullish reversal)
+    small_body = valid & ~doji & (body_ratio < 0.35)
+    hammer = small_body & (lower_shadow > body * 2) & (upper_shadow < body * 0.5)
+    # Inverted Hammer: small body at bottom, long upper shadow
+    inverted_hammer = (
+        small_body & ~hammer & (upper_shadow > body * 2) & (lower_shadow < body * 0.5)
+    )
+
+    prev_body = np.abs(prev_c - prev_o)
+    # Bullish engulfing: previous red candle fully engulfed by current green
+    bullish_engulfing = (
+        valid & (prev_c < prev_o) & (c > o)
+        & (o <= prev_c) & (c >= prev_o) & (body > prev_body)
+    )
+    # Bearish engulfing: previous green candle fully engulfed by current red
+    bearish_engulfing = (
+        valid & ~bullish_engulfing & (prev_c > prev_o) & (c < o)
+        & (o >= prev_c) & (c <= prev_o) & (body > prev_body)
+    )
+
+    hits = doji | hammer | inverted_hammer | bullish_engulfing | bearish_engulfing
+    for j in np.flatnonzero(hits):
+        i = start + j
         date_str = str(df.index[i]) if hasattr(df.index[i], 'strftime') else str(i)
 
-        # Doji: very small body relative to range
-        if body_ratio < 0.1:
+        if doji[j]:
             patterns.append({
                 "pattern": "doji",
                 "type": "neutral",
                 "date": date_str,
                 "description": "Indecision pattern - body is very small relative to range",
             })
-
-        # Hammer: small body at top, long lower shadow (bullish reversal)
-        elif (body_ratio < 0.35 and lower_shadow > body * 2
-              and upper_shadow < body * 0.5):
+        elif hammer[j]:
             patterns.append({
                 "pattern": "hammer",
                 "type": "bullish",
@@ -116,42 +133,27 @@ def _detect_patterns(df: Any) -> list[dict[str, Any]]:
                     " with small body at top"
                 ),
             })
-
-        # Inverted Hammer: small body at bottom, long upper shadow
-        elif (body_ratio < 0.35 and upper_shadow > body * 2
-              and lower_shadow < body * 0.5):
+        elif inverted_hammer[j]:
             patterns.append({
                 "pattern": "inverted_hammer",
-                "type": "bearish" if c < o else "bullish",
+                "type": "bearish" if c[j] < o[j] else "bullish",
                 "date": date_str,
                 "description": "Long upper shadow with small body at bottom",
             })
 
-        # Bullish/Bearish engulfing (requires previous candle)
-        if i > 0:
-            prev_o, prev_c = opens[i - 1], closes[i - 1]
-            prev_body = abs(prev_c - prev_o)
-
-            # Bullish engulfing: previous red candle fully engulfed by current green
-            if (prev_c < prev_o and c > o  # prev red, current green
-                    and o <= prev_c and c >= prev_o
-                    and body > prev_body):
-                patterns.append({
-                    "pattern": "bullish_engulfing",
-                    "type": "bullish",
-                    "date": date_str,
-                    "description": "Current green candle fully engulfs previous red candle",
-                })
-
-            # Bearish engulfing: previous green candle fully engulfed by current red
-            elif (prev_c > prev_o and c < o  # prev green, current red
-                  and o >= prev_c and c <= prev_o
-                  and body > prev_body):
-                patterns.append({
-                    "pattern": "bearish_engulfing",
-                    "type": "bearish",
-                    "date": date_str,
-                    "description": "Current red candle fully engulfs previous green candle",
-                })
+        if bullish_engulfing[j]:
+            patterns.append({
+                "pattern": "bullish_engulfing",
+                "type": "bullish",
+                "date": date_str,
+                "description": "Current green candle fully engulfs previous red candle",
+            })
+        elif bearish_engulfing[j]:
+            patterns.append({
+                "pattern": "bearish_engulfing",
+                "type": "bearish",
+                "date": date_str,
+                "description": "Current red candle fully engulfs previous green candle",
+            })
 
     return patterns
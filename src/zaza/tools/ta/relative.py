@@ -2,16 +2,16 @@
 
 from __future__ import annotations
 
-import json
+import math
 from typing import Any
 
 import numpy as np
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
-from zaza.utils.indicators import ohlcv_to_dataframe
+from zaza.api.shared import get_yf
+from zaza.utils.indicators import cached_ohlcv_dataframe
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
@@ -30,10 +30,44 @@ SECTOR_ETFS: dict[str, str] = {
 }
 
 
+def _close_returns(df: Any) -> np.ndarray:
+    """Return the simple daily returns of ``df["Close"]`` as an array, skipping NaNs.
+
+    Equivalent to ``df["Close"].pct_change().dropna().values`` (pandas 2.x,
+    which forward-fills missing closes first) without building the
+    intermediate Series. Leading NaN closes have nothing to fill from and
+    their returns are dropped.
+    """
+    closes = df["Close"].to_numpy(dtype=float)
+    positions = np.arange(len(closes))
+    closes = closes[np.maximum.accumulate(np.where(np.isnan(closes), 0, positions))]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = closes[1:] / closes[:-1] - 1
+    valid: np.ndarray = returns[~np.isnan(returns)]
+    return valid
+
+
+def _beta_corr(tr: np.ndarray, sr: np.ndarray) -> tuple[float | None, float]:
+    """Return (beta of ``tr`` against ``sr``, correlation) for aligned return arrays.
+
+    Both series are centred once and the covariance terms taken as dot
+    products; the ddof normalisation cancels in both ratios. Beta is None
+    when ``sr`` has no variance and the correlation is NaN when either does.
+    """
+    dx = tr - tr.mean()
+    dy = sr - sr.mean()
+    sxy = float(dx @ dy)
+    sxx = float(dx @ dx)
+    syy = float(dy @ dy)
+    beta = sxy / syy if syy != 0 else None
+    if sxx == 0 or syy == 0:
+        return beta, float("nan")
+    return beta, max(-1.0, min(1.0, sxy / math.sqrt(sxx * syy)))
+
+
 def register(mcp: FastMCP) -> None:
     """Register relative performance tool with the MCP server."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    yf = get_yf()
 
     @mcp.tool()
     async def get_relative_performance(
@@ -53,10 +87,7 @@ def register(mcp: FastMCP) -> None:
             # Fetch ticker history
             history = yf.get_history(ticker, period=period)
             if not history:
-                return json.dumps(
-                    {"error": f"No price history available for {ticker}"},
-                    default=str,
-                )
+                return error_json(f"No price history available for {ticker}")
 
             # Fetch SPY history
             spy_history = yf.get_history("SPY", period=period)
@@ -70,8 +101,8 @@ def register(mcp: FastMCP) -> None:
                 sector_history = yf.get_history(sector_etf, period=period)
 
             # Compute returns
-            df_ticker = ohlcv_to_dataframe(history)
-            ticker_returns = df_ticker["Close"].pct_change().dropna()
+            df_ticker = cached_ohlcv_dataframe(ticker, period, history)
+            ticker_returns = _close_returns(df_ticker)
             ticker_total = float(
                 (df_ticker["Close"].iloc[-1] / df_ticker["Close"].iloc[0] - 1) * 100
             )
@@ -87,21 +118,19 @@ def register(mcp: FastMCP) -> None:
 
             # VS SPY
             if spy_history:
-                df_spy = ohlcv_to_dataframe(spy_history)
-                spy_returns = df_spy["Close"].pct_change().dropna()
+                df_spy = cached_ohlcv_dataframe("SPY", period, spy_history)
+                spy_returns = _close_returns(df_spy)
                 spy_total = float(
                     (df_spy["Close"].iloc[-1] / df_spy["Close"].iloc[0] - 1) * 100
                 )
 
                 # Align return series
                 min_len = min(len(ticker_returns), len(spy_returns))
-                tr = ticker_returns.values[-min_len:]
-                sr = spy_returns.values[-min_len:]
+                tr = ticker_returns[-min_len:]
+                sr = spy_returns[-min_len:]
 
-                correlation = float(np.corrcoef(tr, sr)[0, 1])
                 # Beta = Cov(ticker, spy) / Var(spy)
-                cov = np.cov(tr, sr)
-                beta = float(cov[0, 1] / cov[1, 1]) if cov[1, 1] != 0 else None
+                beta, correlation = _beta_corr(tr, sr)
 
                 result["data"]["vs_spy"] = {
                     "ticker_return": round(ticker_total, 2),
@@ -113,15 +142,15 @@ def register(mcp: FastMCP) -> None:
 
             # VS Sector ETF
             if sector_history and sector_etf:
-                df_sector = ohlcv_to_dataframe(sector_history)
+                df_sector = cached_ohlcv_dataframe(sector_etf, period, sector_history)
                 sector_total = float(
                     (df_sector["Close"].iloc[-1] / df_sector["Close"].iloc[0] - 1) * 100
                 )
-                sector_returns = df_sector["Close"].pct_change().dropna()
+                sector_returns = _close_returns(df_sector)
                 min_len_s = min(len(ticker_returns), len(sector_returns))
-                tr_s = ticker_returns.values[-min_len_s:]
-                sr_s = sector_returns.values[-min_len_s:]
-                sector_corr = float(np.corrcoef(tr_s, sr_s)[0, 1])
+                tr_s = ticker_returns[-min_len_s:]
+                sr_s = sector_returns[-min_len_s:]
+                _, sector_corr = _beta_corr(tr_s, sr_s)
 
                 result["data"]["vs_sector"] = {
                     "sector": sector,
@@ -131,8 +160,8 @@ def register(mcp: FastMCP) -> None:
                     "correlation": round(sector_corr, 4),
                 }
 
-            return json.dumps(result, default=str)
+            return dumps(result)
 
         except Exception as e:
             logger.warning("get_relative_performance_error", ticker=ticker, error=str(e))
-            return json.dumps({"error": str(e)}, default=str)
+            return error_json(str(e))
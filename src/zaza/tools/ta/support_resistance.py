@@ -2,26 +2,21 @@
 
 from __future__ import annotations
 
-import json
-
+import numpy as np
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
-from zaza.utils.indicators import (
-    compute_fibonacci_levels,
-    compute_pivot_points,
-    ohlcv_to_dataframe,
-)
+from zaza.api.shared import get_yf
+from zaza.utils.history import column_array
+from zaza.utils.indicators import compute_fibonacci_levels, compute_pivot_levels
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
 
 def register(mcp: FastMCP) -> None:
     """Register support/resistance tool with the MCP server."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    yf = get_yf()
 
     @mcp.tool()
     async def get_support_resistance(
@@ -39,20 +34,21 @@ def register(mcp: FastMCP) -> None:
         try:
             history = yf.get_history(ticker, period=period)
             if not history:
-                return json.dumps(
-                    {"error": f"No price history available for {ticker}"},
-                    default=str,
-                )
+                return error_json(f"No price history available for {ticker}")
 
-            df = ohlcv_to_dataframe(history)
-            current_price = float(df["Close"].iloc[-1])
+            # Only the last bar and the period extremes are needed, so the
+            # records are read as arrays without building a DataFrame
+            highs = column_array(history, "High")
+            lows = column_array(history, "Low")
+            closes = column_array(history, "Close")
+            current_price = float(closes[-1])
 
             # Pivot points
-            pivot_data = compute_pivot_points(df)
+            pivot_data = compute_pivot_levels(float(highs[-1]), float(lows[-1]), current_price)
 
             # Fibonacci levels based on period high/low
-            high_52w = float(df["High"].max())
-            low_52w = float(df["Low"].min())
+            high_52w = float(np.nanmax(highs))
+            low_52w = float(np.nanmin(lows))
             fib_data = compute_fibonacci_levels(high_52w, low_52w)
 
             # Determine position relative to support/resistance
@@ -65,7 +61,7 @@ def register(mcp: FastMCP) -> None:
             else:
                 position = "below_s1"
 
-            return json.dumps({
+            return dumps({
                 "status": "ok",
                 "ticker": ticker.upper(),
                 "period": period,
@@ -85,8 +81,8 @@ def register(mcp: FastMCP) -> None:
                     },
                     "position": position,
                 },
-            }, default=str)
+            })
 
         except Exception as e:
             logger.warning("get_support_resistance_error", ticker=ticker, error=str(e))
-            return json.dumps({"error": str(e)}, default=str)
+            return error_json(str(e))
@@ -2,22 +2,19 @@
 
 from __future__ import annotations
 
-import json
-
 import structlog
 from mcp.server.fastmcp import FastMCP
 
-from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
-from zaza.utils.indicators import compute_atr, compute_bollinger, ohlcv_to_dataframe
+from zaza.api.shared import get_yf
+from zaza.utils.indicators import cached_ohlcv_dataframe, compute_atr, compute_bollinger
+from zaza.utils.jsonio import dumps, error_json
 
 logger = structlog.get_logger(__name__)
 
 
 def register(mcp: FastMCP) -> None:
     """Register volatility indicators tool with the MCP server."""
-    cache = FileCache()
-    yf = YFinanceClient(cache)
+    yf = get_yf()
 
     @mcp.tool()
     async def get_volatility_indicators(
@@ -35,12 +32,9 @@ def register(mcp: FastMCP) -> None:
         try:
             history = yf.get_history(ticker, period=period)
             if not history:
-                return json.dumps(
-                    {"error": f"No price history available for {ticker}"},
-                    default=str,
-                )
+                return error_json(f"No price history available for {ticker}")
 
-            df = ohlcv_to_dataframe(history)
+            df = cached_ohlcv_dataframe(ticker, period, history)
             bollinger_data = compute_bollinger(df)
             atr_value = compute_atr(df)
             current_price = float(df["Close"].iloc[-1])
@@ -60,7 +54,7 @@ def register(mcp: FastMCP) -> None:
             else:
                 vol_signal = "insufficient_data"
 
-            return json.dumps({
+            return dumps({
                 "status": "ok",
                 "ticker": ticker.upper(),
                 "period": period,
@@ -73,8 +67,8 @@ def register(mcp: FastMCP) -> None:
                     "current_price": current_price,
                     "volatility_signal": vol_signal,
                 },
-            }, default=str)
+            })
 
         except Exception as e:
             logger.warning("get_volatility_error", ticker=ticker, error=str(e))
-            return json.dumps({"error": str(e)}, default=str)
+            return error_json(str(e))
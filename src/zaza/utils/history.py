@@ -0,0 +1,42 @@
+"""Helpers for OHLCV history records returned by YFinanceClient.get_history."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+
+def closes_array(history: list[dict[str, Any]]) -> np.ndarray:
+    """Return the non-null ``Close`` values of ``history`` as a float64 array.
+
+    Values are streamed straight into the array without building an
+    intermediate list.
+    """
+    return np.fromiter(
+        (c for r in history if (c := r.get("Close")) is not None), dtype=np.float64
+    )
+
+
+def column_array(history: list[dict[str, Any]], key: str) -> np.ndarray:
+    """Return ``key`` from every record of ``history`` as a float64 array.
+
+    Unlike :func:`closes_array` the result stays aligned with ``history``:
+    missing or null values become NaN.
+    """
+    return np.fromiter(
+        (np.nan if (v := r.get(key)) is None else v for r in history),
+        dtype=np.float64,
+        count=len(history),
+    )
+
+
+def daily_log_returns(closes: np.ndarray) -> np.ndarray:
+    """Return the log returns between consecutive ``closes`` (one shorter than the input).
+
+    Takes the log of the price ratios in place, so only one temporary the size
+    of the result is allocated.
+    """
+    returns: np.ndarray = closes[1:] / closes[:-1]
+    np.log(returns, out=returns)
+    return returns
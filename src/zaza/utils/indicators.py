@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
 from typing import Any
 
 import numpy as np
@@ -11,6 +14,15 @@ import ta
 
 logger = structlog.get_logger(__name__)
 
+# Parsed DataFrames kept for recently requested (ticker, period) histories
+_DF_CACHE_ENTRIES = 64
+_df_cache: OrderedDict[tuple[Any, ...], pd.DataFrame] = OrderedDict()
+_df_cache_lock = threading.Lock()
+
+# Indicator signals that count as a bullish / bearish vote in tally_signals
+BULLISH_SIGNALS = frozenset({"bullish", "bullish_crossover", "oversold"})
+BEARISH_SIGNALS = frozenset({"bearish", "bearish_crossover", "overbought"})
+
 
 def ohlcv_to_dataframe(data: list[dict[str, Any]]) -> pd.DataFrame:
     """Convert OHLCV list of dicts to a DataFrame with standard column names."""
@@ -36,6 +48,36 @@ def ohlcv_to_dataframe(data: list[dict[str, Any]]) -> pd.DataFrame:
     return df
 
 
+def cached_ohlcv_dataframe(
+    ticker: str, period: str, history: list[dict[str, Any]]
+) -> pd.DataFrame:
+    """Return ``ohlcv_to_dataframe(history)``, reusing the frame built for the same history.
+
+    Frames are keyed by ticker, period, row count and the first and last
+    records, so a refreshed history (new bar or updated last close) is parsed
+    again. The returned frame is shared between callers and must not be
+    modified in place.
+    """
+    key = (
+        ticker.upper(),
+        period,
+        len(history),
+        tuple(history[0].items()),
+        tuple(history[-1].items()),
+    )
+    with _df_cache_lock:
+        df = _df_cache.get(key)
+        if df is not None:
+            _df_cache.move_to_end(key)
+            return df
+    df = ohlcv_to_dataframe(history)
+    with _df_cache_lock:
+        _df_cache[key] = df
+        if len(_df_cache) > _DF_CACHE_ENTRIES:
+            _df_cache.popitem(last=False)
+    return df
+
+
 def compute_sma(df: pd.DataFrame, periods: list[int] | None = None) -> dict[str, Any]:
     """Compute Simple Moving Averages."""
     periods = periods or [20, 50, 200]
@@ -225,6 +267,25 @@ def compute_mfi(df: pd.DataFrame, period: int = 14) -> dict[str, Any]:
     return {"mfi": round(float(val), 2), "signal": signal}
 
 
+def tally_signals(signals: Iterable[str]) -> str:
+    """Majority vote over indicator signals: 'bullish', 'bearish' or 'neutral'.
+
+    Signals outside BULLISH_SIGNALS and BEARISH_SIGNALS (e.g. 'neutral',
+    'approaching_oversold', 'insufficient_data') do not vote.
+    """
+    score = 0
+    for signal in signals:
+        if signal in BULLISH_SIGNALS:
+            score += 1
+        elif signal in BEARISH_SIGNALS:
+            score -= 1
+    if score > 0:
+        return "bullish"
+    if score < 0:
+        return "bearish"
+    return "neutral"
+
+
 def compute_fibonacci_levels(high: float, low: float) -> dict[str, float]:
     """Compute Fibonacci retracement levels."""
     diff = high - low
@@ -241,9 +302,13 @@ def compute_fibonacci_levels(high: float, low: float) -> dict[str, float]:
 
 def compute_pivot_points(df: pd.DataFrame) -> dict[str, float]:
     """Compute standard pivot points with support/resistance."""
-    h = float(df["High"].iloc[-1])
-    low = float(df["Low"].iloc[-1])
-    c = float(df["Close"].iloc[-1])
+    return compute_pivot_levels(
+        float(df["High"].iloc[-1]), float(df["Low"].iloc[-1]), float(df["Close"].iloc[-1])
+    )
+
+
+def compute_pivot_levels(h: float, low: float, c: float) -> dict[str, float]:
+    """Compute standard pivot points from the last bar's high, low and close."""
     pivot = (h + low + c) / 3
     return {
         "pivot": round(pivot, 2),
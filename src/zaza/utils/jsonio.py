@@ -0,0 +1,36 @@
+"""Fast JSON encoding for MCP tool responses."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+
+# NumPy scalars/arrays are encoded natively and non-string dict keys are
+# stringified. Datetimes are passed through to ``default=str`` so their text
+# form matches what ``json.dumps(obj, default=str)`` produced.
+_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+)
+
+
+def dumps(obj: Any) -> str:
+    """Serialize a tool result to a JSON string using orjson.
+
+    Replaces ``json.dumps(obj, default=str)`` with one difference in output:
+    NaN and +/-infinity become ``null`` rather than the non-standard
+    ``NaN``/``Infinity`` tokens, so the result is always valid JSON.
+    """
+    return orjson.dumps(obj, default=str, option=_OPTIONS).decode()
+
+
+def error_json(message: str, *, status: bool = False) -> str:
+    """Serialize an error response, encoding only the message string.
+
+    Produces ``{"error": message}``, or ``{"status": "error", "error": message}``
+    when ``status`` is set, without building and encoding a dict.
+    """
+    prefix = '{"status":"error","error":' if status else '{"error":'
+    return prefix + orjson.dumps(message).decode() + "}"
@@ -90,20 +90,21 @@ def monte_carlo_gbm(
     n_sims: int = 10000,
     seed: int | None = None,
 ) -> dict[str, Any]:
-    """Run Geometric Brownian Motion Monte Carlo simulation."""
+    """Run Geometric Brownian Motion Monte Carlo simulation.
+
+    Only terminal prices are reported, so each path is tracked as a running
+    sum of its normal shocks rather than as a full (n_sims, days) matrix.
+    """
     rng = np.random.default_rng(seed)
     dt = 1 / 252
-    paths = np.zeros((n_sims, days + 1))
-    paths[:, 0] = price
-    for t in range(1, days + 1):
-        z = rng.standard_normal(n_sims)
-        paths[:, t] = paths[:, t - 1] * np.exp(
-            (mu - 0.5 * sigma**2) * dt + sigma * np.sqrt(dt) * z
-        )
-    final = paths[:, -1]
-    percentiles = {
-        f"p{p}": round(float(np.percentile(final, p)), 2) for p in [5, 25, 50, 75, 95]
-    }
+    shock_sum = np.zeros(n_sims)
+    for _ in range(days):
+        shock_sum += rng.standard_normal(n_sims)
+    final = price * np.exp((mu - 0.5 * sigma**2) * dt * days + sigma * np.sqrt(dt) * shock_sum)
+
+    levels = [5, 25, 50, 75, 95]
+    values = np.percentile(final, levels)
+    percentiles = {f"p{p}": round(float(v), 2) for p, v in zip(levels, values)}
     prob_up_5 = float(np.mean(final > price * 1.05))
     prob_down_5 = float(np.mean(final < price * 0.95))
     return {
@@ -111,7 +112,7 @@ def monte_carlo_gbm(
         "prob_up_5pct": round(prob_up_5, 4),
         "prob_down_5pct": round(prob_down_5, 4),
         "mean_price": round(float(np.mean(final)), 2),
-        "median_price": round(float(np.median(final)), 2),
+        "median_price": percentiles["p50"],
     }
 
 
@@ -144,11 +145,17 @@ def compute_hurst_exponent(prices: np.ndarray) -> float:
     return round(float(np.clip(slope, 0, 1)), 4)
 
 
-def compute_half_life(prices: np.ndarray) -> float | None:
-    """Compute Ornstein-Uhlenbeck half-life of mean reversion."""
+def compute_half_life(
+    prices: np.ndarray, log_prices: np.ndarray | None = None
+) -> float | None:
+    """Compute Ornstein-Uhlenbeck half-life of mean reversion.
+
+    Callers that already hold ``np.log(prices)`` can pass it as ``log_prices``.
+    """
     if len(prices) < 20:
         return None
-    log_prices = np.log(prices)
+    if log_prices is None:
+        log_prices = np.log(prices)
     lag = log_prices[:-1]
     diff = np.diff(log_prices)
     lag_centered = lag - np.mean(lag)
@@ -184,21 +191,36 @@ def _max_drawdown(returns: np.ndarray) -> float:
     return float(np.max(drawdown)) if len(drawdown) > 0 else 0.0
 
 
+def compute_var_cvar(
+    returns: np.ndarray, confidences: tuple[float, ...] = (0.95, 0.99)
+) -> dict[float, tuple[dict[str, float], float]]:
+    """Compute VaR and CVaR at several confidence levels from a single sort.
+
+    Returns ``{confidence: (var, cvar)}`` with each pair matching what
+    :func:`compute_var` and :func:`compute_cvar` return for that level.
+    """
+    sorted_returns = np.sort(returns)
+    n = len(sorted_returns)
+    parametric_var = round(float(np.mean(returns) - np.std(returns) * 1.645), 6)
+    result: dict[float, tuple[dict[str, float], float]] = {}
+    for confidence in confidences:
+        idx = int(n * (1 - confidence))
+        historical_var = float(sorted_returns[idx]) if idx < n else 0.0
+        tail = sorted_returns[: idx + 1]
+        cvar = round(float(np.mean(tail)), 6) if len(tail) > 0 else 0.0
+        var = {
+            "historical_var": round(historical_var, 6),
+            "parametric_var": parametric_var,
+        }
+        result[confidence] = (var, cvar)
+    return result
+
+
 def compute_var(returns: np.ndarray, confidence: float = 0.95) -> dict[str, float]:
     """Compute Value at Risk."""
-    sorted_returns = np.sort(returns)
-    idx = int(len(sorted_returns) * (1 - confidence))
-    historical_var = float(sorted_returns[idx]) if idx < len(sorted_returns) else 0.0
-    parametric_var = float(np.mean(returns) - np.std(returns) * 1.645)
-    return {
-        "historical_var": round(historical_var, 6),
-        "parametric_var": round(parametric_var, 6),
-    }
+    return compute_var_cvar(returns, (confidence,))[confidence][0]
 
 
 def compute_cvar(returns: np.ndarray, confidence: float = 0.95) -> float:
     """Compute Conditional VaR (Expected Shortfall)."""
-    sorted_returns = np.sort(returns)
-    idx = int(len(sorted_returns) * (1 - confidence))
-    tail = sorted_returns[: idx + 1]
-    return round(float(np.mean(tail)), 6) if len(tail) > 0 else 0.0
+    return compute_var_cvar(returns, (confidence,))[confidence][1]
@@ -9,6 +9,7 @@ old prediction files.
 from __future__ import annotations
 
 import os
+import re
 import shutil
 import tempfile
 from dataclasses import asdict, dataclass
@@ -19,12 +20,15 @@ from typing import Any
 import orjson
 import structlog
 
+from zaza.api.shared import get_yf
 from zaza.api.yfinance_client import YFinanceClient
-from zaza.cache.store import FileCache
 from zaza.config import PREDICTIONS_DIR
 
 logger = structlog.get_logger(__name__)
 
+# Uppercase ticker symbol; use with fullmatch so a trailing newline is rejected
+TICKER_RE = re.compile(r"[A-Z]{1,10}")
+
 
 def _atomic_write(target_path: Path, data: bytes) -> None:
     """Write data to target_path atomically via temp-file-then-rename.
@@ -236,7 +240,7 @@ def score_predictions(
             if target_dt <= today:
                 # Need to fetch actual price
                 if yf_client is None:
-                    yf_client = YFinanceClient(cache=FileCache())
+                    yf_client = get_yf()
 
                 ticker_sym = data.get("ticker", "")
                 quote = yf_client.get_quote(ticker_sym)
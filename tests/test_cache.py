@@ -93,3 +93,76 @@ def test_cache_stores_lists(cache):
     cache.set("test_list", "prices", data)
     result = cache.get("test_list", "prices")
     assert result == data
+
+
+def test_set_and_get_raw(cache):
+    payload = '{"status": "ok",\n"data": [1, 2]}'
+    cache.set_raw("raw_key", "dark_pool", payload)
+    assert cache.get_raw("raw_key", "dark_pool") == payload
+    assert cache.get("raw_key", "dark_pool") is None  # raw and dict entries are separate
+
+
+def test_raw_cache_expiry(cache):
+    cache.set_raw("raw_key", "prices", "{}")
+    path = cache._raw_path("raw_key")
+    _, _, payload = path.read_text().partition("\n")
+    header = json.dumps({"cached_at": time.time() - 7200, "category": "prices"})
+    path.write_text(f"{header}\n{payload}")
+    assert cache.get_raw("raw_key", "prices") is None
+    assert not path.exists()
+
+
+def test_raw_corrupt_header_handling(cache):
+    path = cache._raw_path("corrupt_key")
+    path.write_text("not a header\n{}")
+    assert cache.get_raw("corrupt_key", "prices") is None
+    assert not path.exists()
+
+
+def test_invalidate_and_clear_include_raw_entries(cache):
+    cache.set_raw("key1", "prices", "{}")
+    cache.set_raw("key2", "fundamentals", "[]")
+    cache.set("key3", "prices", {"a": 1})
+    assert cache.clear("prices") == 2
+    assert cache.get_raw("key2", "fundamentals") == "[]"
+    cache.invalidate("key2")
+    assert cache.get_raw("key2", "fundamentals") is None
+
+
+def test_memory_tier_serves_repeat_reads(cache):
+    cache.set("hot_key", "prices", {"a": 1})
+    cache.set_raw("hot_raw", "prices", '{"b": 2}')
+    assert cache.get("hot_key", "prices") == {"a": 1}
+    assert cache.get_raw("hot_raw", "prices") == '{"b": 2}'
+    # Second reads are served from memory even if the files vanish underneath
+    cache._path("hot_key").unlink()
+    cache._raw_path("hot_raw").unlink()
+    assert cache.get("hot_key", "prices") == {"a": 1}
+    assert cache.get_raw("hot_raw", "prices") == '{"b": 2}'
+
+
+def test_memory_tier_returns_fresh_objects(cache):
+    cache.set("hot_key", "prices", {"a": [1]})
+    cache.get("hot_key", "prices")["a"].append(2)
+    assert cache.get("hot_key", "prices") == {"a": [1]}
+
+
+def test_memory_tier_respects_writes_and_invalidation(cache):
+    cache.set("hot_key", "prices", {"a": 1})
+    cache.get("hot_key", "prices")
+    cache.set("hot_key", "prices", {"a": 2})
+    assert cache.get("hot_key", "prices") == {"a": 2}
+    cache.invalidate("hot_key")
+    assert cache.get("hot_key", "prices") is None
+    cache.set("hot_key", "prices", {"a": 3})
+    cache.get("hot_key", "prices")
+    cache.clear("prices")
+    assert cache.get("hot_key", "prices") is None
+
+
+def test_memory_tier_is_bounded(cache, monkeypatch):
+    monkeypatch.setattr("zaza.cache.store._MEMORY_ENTRIES", 2)
+    for i in range(3):
+        cache.set_raw(f"k{i}", "prices", str(i))
+        cache.get_raw(f"k{i}", "prices")
+    assert list(cache._memory) == ["k1.raw", "k2.raw"]
@@ -4,6 +4,8 @@ import importlib
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 import zaza.config as config_module
 from zaza.config import (
     CACHE_DIR,
@@ -121,3 +123,37 @@ def test_market_exchange_map_has_expected_markets() -> None:
     assert "NYSE" in MARKET_EXCHANGE_MAP
     assert "AMEX" in MARKET_EXCHANGE_MAP
     assert MARKET_EXCHANGE_MAP["NASDAQ"] == "NMS"
+
+
+def test_io_threads_env_override(monkeypatch: object) -> None:
+    """ZAZA_IO_THREADS uses env var when set."""
+    monkeypatch.setenv("ZAZA_IO_THREADS", "8")  # type: ignore[union-attr]
+    importlib.reload(config_module)
+    assert config_module.ZAZA_IO_THREADS == 8
+    # Clean up
+    monkeypatch.delenv("ZAZA_IO_THREADS", raising=False)  # type: ignore[union-attr]
+    importlib.reload(config_module)
+
+
+def test_io_threads_rejects_invalid_values(monkeypatch: object) -> None:
+    """ZAZA_IO_THREADS must be an integer of at least 1."""
+    for value in ("many", "0", "-4"):
+        monkeypatch.setenv("ZAZA_IO_THREADS", value)  # type: ignore[union-attr]
+        with pytest.raises(ValueError, match="ZAZA_IO_THREADS"):
+            importlib.reload(config_module)
+    # Clean up
+    monkeypatch.delenv("ZAZA_IO_THREADS", raising=False)  # type: ignore[union-attr]
+    importlib.reload(config_module)
+
+
+def test_warmup_env_flag(monkeypatch: object) -> None:
+    """ZAZA_WARMUP is off by default and enabled by ZAZA_WARMUP=1."""
+    monkeypatch.delenv("ZAZA_WARMUP", raising=False)  # type: ignore[union-attr]
+    importlib.reload(config_module)
+    assert config_module.ZAZA_WARMUP is False
+    monkeypatch.setenv("ZAZA_WARMUP", "1")  # type: ignore[union-attr]
+    importlib.reload(config_module)
+    assert config_module.ZAZA_WARMUP is True
+    # Clean up
+    monkeypatch.delenv("ZAZA_WARMUP", raising=False)  # type: ignore[union-attr]
+    importlib.reload(config_module)
@@ -0,0 +1,52 @@
+"""Tests for the orjson-backed tool response encoder."""
+
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+from zaza.utils.jsonio import dumps, error_json
+
+
+def test_dumps_matches_stdlib_for_primitives():
+    obj = {"ticker": "AAPL", "price": 189.5, "volume": 1000, "ok": True, "note": None}
+    assert json.loads(dumps(obj)) == obj
+
+
+def test_dumps_serializes_numpy_natively():
+    obj = {"mean": np.float64(1.5), "count": np.int64(3), "values": np.array([1.0, 2.0])}
+    assert json.loads(dumps(obj)) == {"mean": 1.5, "count": 3, "values": [1.0, 2.0]}
+
+
+def test_dumps_keeps_str_format_for_datetimes():
+    ts = pd.Timestamp("2024-01-02")
+    obj = {"ts": ts, "dt": datetime(2024, 1, 2, 9, 30), "d": date(2024, 1, 2)}
+    assert json.loads(dumps(obj)) == {
+        "ts": str(ts),
+        "dt": "2024-01-02 09:30:00",
+        "d": "2024-01-02",
+    }
+
+
+def test_dumps_stringifies_non_str_keys():
+    assert json.loads(dumps({1: "a", 2.5: "b"})) == {"1": "a", "2.5": "b"}
+
+
+def test_dumps_emits_null_for_nan():
+    assert json.loads(dumps({"x": float("nan")})) == {"x": None}
+
+
+def test_dumps_emits_null_for_infinity():
+    assert dumps([float("inf"), float("-inf")]) == "[null,null]"
+
+
+def test_error_json_matches_dict_encoding():
+    message = 'Ticker "X\\Y" not found\n'
+    assert json.loads(error_json(message)) == {"error": message}
+    assert json.loads(error_json(message, status=True)) == {
+        "status": "error",
+        "error": message,
+    }
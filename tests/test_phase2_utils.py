@@ -76,6 +76,23 @@ async def test_fred_error_returns_empty(cache):
     assert result == []
 
 
+@respx.mock
+@pytest.mark.asyncio
+async def test_fred_reuses_one_http_client(cache):
+    from zaza.api.fred_client import FRED_BASE, FredClient
+
+    client = FredClient("test-key", cache)
+    respx.get(f"{FRED_BASE}/series/observations").mock(
+        return_value=httpx.Response(200, json={"observations": []})
+    )
+    await client.get_series("DFF")
+    http = client._http
+    await client.get_series("DGS10")
+    assert http is not None and client._http is http
+    await client.aclose()
+    assert http.is_closed
+
+
 @respx.mock
 @pytest.mark.asyncio
 async def test_fred_release_dates_sends_date_range(cache):
@@ -134,6 +151,37 @@ async def test_fred_release_dates_deduplicates_by_release_id(cache):
     assert sorted(ids) == ["10", "50", "99"]
 
 
+# --- History Helper Tests ---
+
+
+def test_closes_array_skips_missing_closes():
+    from zaza.utils.history import closes_array
+
+    history = [{"Close": 100.0}, {"Close": None}, {"Open": 1.0}, {"Close": 0.0}, {"Close": 101.5}]
+    result = closes_array(history)
+    assert result.dtype == np.float64
+    assert result.tolist() == [100.0, 0.0, 101.5]
+    assert closes_array([]).size == 0
+
+
+def test_column_array_keeps_alignment():
+    from zaza.utils.history import column_array
+
+    history = [{"High": 10.0}, {"High": None}, {"Low": 1.0}, {"High": 12.5}]
+    result = column_array(history, "High")
+    assert result.dtype == np.float64
+    np.testing.assert_array_equal(result, [10.0, np.nan, np.nan, 12.5])
+    assert column_array([], "High").size == 0
+
+
+def test_daily_log_returns():
+    from zaza.utils.history import daily_log_returns
+
+    closes = np.array([100.0, 110.0, 99.0])
+    np.testing.assert_allclose(daily_log_returns(closes), np.diff(np.log(closes)))
+    assert daily_log_returns(np.array([100.0])).size == 0
+
+
 # --- TA Indicator Tests ---
 
 
@@ -146,6 +194,32 @@ def test_ohlcv_to_dataframe():
     assert df["Close"].iloc[0] == 102
 
 
+def test_cached_ohlcv_dataframe_reuses_frame_until_history_changes():
+    from zaza.utils.indicators import cached_ohlcv_dataframe
+
+    history = [
+        {"Date": "2024-01-02", "Open": 100, "High": 105, "Low": 95, "Close": 102, "Volume": 1},
+        {"Date": "2024-01-03", "Open": 102, "High": 106, "Low": 99, "Close": 104, "Volume": 2},
+    ]
+    df = cached_ohlcv_dataframe("aapl", "1mo", history)
+    assert cached_ohlcv_dataframe("AAPL", "1mo", [dict(r) for r in history]) is df
+    assert cached_ohlcv_dataframe("AAPL", "3mo", history) is not df
+
+    updated = [history[0], {**history[1], "Close": 105}]
+    refreshed = cached_ohlcv_dataframe("AAPL", "1mo", updated)
+    assert refreshed is not df
+    assert refreshed["Close"].iloc[-1] == 105
+
+
+def test_tally_signals():
+    from zaza.utils.indicators import tally_signals
+
+    assert tally_signals(["bullish_crossover", "oversold", "overbought"]) == "bullish"
+    assert tally_signals(["bearish", "neutral", "approaching_oversold"]) == "bearish"
+    assert tally_signals(["bullish", "bearish_crossover", "insufficient_data"]) == "neutral"
+    assert tally_signals([]) == "neutral"
+
+
 def test_compute_sma(sample_ohlcv):
     from zaza.utils.indicators import compute_sma
 
@@ -219,6 +293,13 @@ def test_compute_pivot_points(sample_ohlcv):
     assert result["r1"] > result["pivot"] > result["s1"]
 
 
+def test_compute_pivot_levels():
+    from zaza.utils.indicators import compute_pivot_levels
+
+    result = compute_pivot_levels(110.0, 90.0, 100.0)
+    assert result == {"pivot": 100.0, "r1": 110.0, "r2": 120.0, "s1": 90.0, "s2": 80.0}
+
+
 # --- Quant Model Tests ---
 
 
@@ -284,6 +365,28 @@ def test_cvar():
     assert result < 0
 
 
+def test_var_cvar_batch_matches_sort_and_index_reference():
+    from zaza.utils.models import compute_cvar, compute_var, compute_var_cvar
+
+    rng = np.random.default_rng(42)
+    returns = rng.normal(0.001, 0.02, 252)
+    result = compute_var_cvar(returns, confidences=(0.95, 0.99))
+    parametric = round(float(np.mean(returns) - np.std(returns) * 1.645), 6)
+    for confidence in (0.95, 0.99):
+        # Reference: the original per-level sort-and-index computation.
+        sorted_returns = np.sort(returns)
+        idx = int(len(sorted_returns) * (1 - confidence))
+        expected_var = {
+            "historical_var": round(float(sorted_returns[idx]), 6),
+            "parametric_var": parametric,
+        }
+        expected_cvar = round(float(np.mean(sorted_returns[: idx + 1])), 6)
+        assert result[confidence] == (expected_var, expected_cvar)
+        assert compute_var(returns, confidence=confidence) == expected_var
+        assert compute_cvar(returns, confidence=confidence) == expected_cvar
+    assert result[0.99][1] <= result[0.95][1]
+
+
 # --- Sentiment Tests ---
 
 
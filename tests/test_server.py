@@ -1,5 +1,6 @@
 """Tests for MCP server entry point."""
 
+import asyncio
 import subprocess
 import sys
 
@@ -29,3 +30,30 @@ def test_server_import():
     from zaza.server import main
 
     assert callable(main)
+
+
+def test_warm_up_model_imports_skips_missing_modules(monkeypatch):
+    """Missing model libraries are skipped rather than raised."""
+    from zaza import server
+
+    monkeypatch.setattr(server, "WARMUP_MODULES", ("json", "zaza_no_such_module"))
+    assert server.warm_up_model_imports() == 1
+
+
+async def test_warmup_failure_is_logged(monkeypatch):
+    """An unexpected error in the background warm-up is logged, not dropped."""
+    from unittest.mock import MagicMock
+
+    from zaza import server
+
+    def _boom() -> int:
+        raise RuntimeError("boom")
+
+    mock_logger = MagicMock()
+    monkeypatch.setattr(server, "logger", mock_logger)
+    future = asyncio.get_running_loop().run_in_executor(None, _boom)
+    future.add_done_callback(server._log_warmup_failure)
+    await asyncio.wait([future])
+    await asyncio.sleep(0)
+    mock_logger.error.assert_called_once()
+    assert mock_logger.error.call_args.args[0] == "warmup_failed"
@@ -0,0 +1,31 @@
+"""Tests for the process-wide shared API clients."""
+
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from zaza.api import shared
+from zaza.api.yfinance_client import YFinanceClient
+from zaza.cache.store import FileCache
+
+
+@pytest.fixture(autouse=True)
+def fresh_singletons(tmp_path) -> Iterator[None]:
+    shared.get_cache.cache_clear()
+    shared.get_yf.cache_clear()
+    with patch("zaza.api.shared.FileCache", lambda: FileCache(cache_dir=tmp_path)):
+        yield
+    shared.get_cache.cache_clear()
+    shared.get_yf.cache_clear()
+
+
+def test_get_cache_returns_same_instance() -> None:
+    assert shared.get_cache() is shared.get_cache()
+
+
+def test_get_yf_returns_same_instance_backed_by_shared_cache() -> None:
+    yf = shared.get_yf()
+    assert isinstance(yf, YFinanceClient)
+    assert yf is shared.get_yf()
+    assert yf.cache is shared.get_cache()
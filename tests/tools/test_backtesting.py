@@ -101,8 +101,8 @@ class TestSignalBacktest:
         mcp = FastMCP("test")
 
         # Patches must wrap the register() call so the closure captures mocks
-        with patch("zaza.tools.backtesting.signals.FileCache", return_value=mock_cache):
-            with patch("zaza.tools.backtesting.signals.YFinanceClient") as MockYF:
+        with patch("zaza.tools.backtesting.signals.get_cache", return_value=mock_cache):
+            with patch("zaza.tools.backtesting.signals.get_yf") as MockYF:
                 mock_yf = MockYF.return_value
                 mock_yf.get_history.return_value = ohlcv_data
 
@@ -130,8 +130,8 @@ class TestSignalBacktest:
 
         mcp = FastMCP("test")
 
-        with patch("zaza.tools.backtesting.signals.FileCache", return_value=mock_cache):
-            with patch("zaza.tools.backtesting.signals.YFinanceClient"):
+        with patch("zaza.tools.backtesting.signals.get_cache", return_value=mock_cache):
+            with patch("zaza.tools.backtesting.signals.get_yf"):
                 register(mcp)
 
                 tool = mcp._tool_manager.get_tool("get_signal_backtest")
@@ -153,8 +153,8 @@ class TestSignalBacktest:
 
         mcp = FastMCP("test")
 
-        with patch("zaza.tools.backtesting.signals.FileCache", return_value=mock_cache):
-            with patch("zaza.tools.backtesting.signals.YFinanceClient") as MockYF:
+        with patch("zaza.tools.backtesting.signals.get_cache", return_value=mock_cache):
+            with patch("zaza.tools.backtesting.signals.get_yf") as MockYF:
                 mock_yf = MockYF.return_value
                 mock_yf.get_history.return_value = ohlcv_with_rsi_dip
 
@@ -183,8 +183,8 @@ class TestSignalBacktest:
 
         mcp = FastMCP("test")
 
-        with patch("zaza.tools.backtesting.signals.FileCache", return_value=mock_cache):
-            with patch("zaza.tools.backtesting.signals.YFinanceClient") as MockYF:
+        with patch("zaza.tools.backtesting.signals.get_cache", return_value=mock_cache):
+            with patch("zaza.tools.backtesting.signals.get_yf") as MockYF:
                 mock_yf = MockYF.return_value
                 mock_yf.get_history.return_value = ohlcv_data
 
@@ -210,8 +210,8 @@ class TestSignalBacktest:
 
         mcp = FastMCP("test")
 
-        with patch("zaza.tools.backtesting.signals.FileCache", return_value=mock_cache):
-            with patch("zaza.tools.backtesting.signals.YFinanceClient") as MockYF:
+        with patch("zaza.tools.backtesting.signals.get_cache", return_value=mock_cache):
+            with patch("zaza.tools.backtesting.signals.get_yf") as MockYF:
                 mock_yf = MockYF.return_value
                 mock_yf.get_history.return_value = []
 
@@ -252,8 +252,8 @@ class TestStrategySimulation:
 
         mcp = FastMCP("test")
 
-        with patch("zaza.tools.backtesting.simulation.FileCache", return_value=mock_cache):
-            with patch("zaza.tools.backtesting.simulation.YFinanceClient") as MockYF:
+        with patch("zaza.tools.backtesting.simulation.get_cache", return_value=mock_cache):
+            with patch("zaza.tools.backtesting.simulation.get_yf") as MockYF:
                 mock_yf = MockYF.return_value
                 mock_yf.get_history.return_value = ohlcv_data
 
@@ -284,8 +284,8 @@ class TestStrategySimulation:
 
         mcp = FastMCP("test")
 
-        with patch("zaza.tools.backtesting.simulation.FileCache", return_value=mock_cache):
-            with patch("zaza.tools.backtesting.simulation.YFinanceClient") as MockYF:
+        with patch("zaza.tools.backtesting.simulation.get_cache", return_value=mock_cache):
+            with patch("zaza.tools.backtesting.simulation.get_yf") as MockYF:
                 mock_yf = MockYF.return_value
                 mock_yf.get_history.return_value = ohlcv_data
 
@@ -315,8 +315,8 @@ class TestStrategySimulation:
 
         mcp = FastMCP("test")
 
-        with patch("zaza.tools.backtesting.simulation.FileCache", return_value=mock_cache):
-            with patch("zaza.tools.backtesting.simulation.YFinanceClient"):
+        with patch("zaza.tools.backtesting.simulation.get_cache", return_value=mock_cache):
+            with patch("zaza.tools.backtesting.simulation.get_yf"):
                 register(mcp)
 
                 tool = mcp._tool_manager.get_tool("get_strategy_simulation")
@@ -450,8 +450,8 @@ class TestRiskMetrics:
 
         mcp = FastMCP("test")
 
-        with patch("zaza.tools.backtesting.risk.FileCache", return_value=mock_cache):
-            with patch("zaza.tools.backtesting.risk.YFinanceClient") as MockYF:
+        with patch("zaza.tools.backtesting.risk.get_cache", return_value=mock_cache):
+            with patch("zaza.tools.backtesting.risk.get_yf") as MockYF:
                 mock_yf = MockYF.return_value
                 mock_yf.get_history.side_effect = [ohlcv_data, benchmark_data]
 
@@ -483,8 +483,8 @@ class TestRiskMetrics:
 
         mcp = FastMCP("test")
 
-        with patch("zaza.tools.backtesting.risk.FileCache", return_value=mock_cache):
-            with patch("zaza.tools.backtesting.risk.YFinanceClient") as MockYF:
+        with patch("zaza.tools.backtesting.risk.get_cache", return_value=mock_cache):
+            with patch("zaza.tools.backtesting.risk.get_yf") as MockYF:
                 mock_yf = MockYF.return_value
                 mock_yf.get_history.return_value = []
 
@@ -512,8 +512,8 @@ class TestRiskMetrics:
 
         mcp = FastMCP("test")
 
-        with patch("zaza.tools.backtesting.risk.FileCache", return_value=mock_cache):
-            with patch("zaza.tools.backtesting.risk.YFinanceClient") as MockYF:
+        with patch("zaza.tools.backtesting.risk.get_cache", return_value=mock_cache):
+            with patch("zaza.tools.backtesting.risk.get_yf") as MockYF:
                 mock_yf = MockYF.return_value
                 mock_yf.get_history.side_effect = [ohlcv_data, benchmark_data]
 
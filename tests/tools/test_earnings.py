@@ -51,8 +51,8 @@ class TestEarningsHistory:
     @pytest.mark.asyncio
     async def test_returns_quarterly_earnings(self, mock_mcp, tmp_cache):
         """get_earnings_history returns per-quarter EPS beat/miss."""
-        with patch("zaza.tools.earnings.history.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.earnings.history.YFinanceClient") as MockYF:
+        with patch("zaza.tools.earnings.history.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.earnings.history.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_earnings.return_value = {
                     "earnings_history": [
@@ -99,8 +99,8 @@ class TestEarningsHistory:
     @pytest.mark.asyncio
     async def test_respects_limit_parameter(self, mock_mcp, tmp_cache):
         """Limits the number of quarters returned."""
-        with patch("zaza.tools.earnings.history.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.earnings.history.YFinanceClient") as MockYF:
+        with patch("zaza.tools.earnings.history.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.earnings.history.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_earnings.return_value = {
                     "earnings_history": [
@@ -125,8 +125,8 @@ class TestEarningsHistory:
     @pytest.mark.asyncio
     async def test_handles_empty_earnings(self, mock_mcp, tmp_cache):
         """Returns error when no earnings data available."""
-        with patch("zaza.tools.earnings.history.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.earnings.history.YFinanceClient") as MockYF:
+        with patch("zaza.tools.earnings.history.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.earnings.history.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_earnings.return_value = {
                     "earnings_history": [],
@@ -151,8 +151,8 @@ class TestEarningsCalendar:
     @pytest.mark.asyncio
     async def test_returns_next_earnings_date(self, mock_mcp, tmp_cache):
         """get_earnings_calendar returns next earnings date and estimates."""
-        with patch("zaza.tools.earnings.calendar.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.earnings.calendar.YFinanceClient") as MockYF:
+        with patch("zaza.tools.earnings.calendar.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.earnings.calendar.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_earnings.return_value = {
                     "earnings_history": [],
@@ -175,8 +175,8 @@ class TestEarningsCalendar:
     @pytest.mark.asyncio
     async def test_handles_no_calendar_data(self, mock_mcp, tmp_cache):
         """Returns error when no calendar data available."""
-        with patch("zaza.tools.earnings.calendar.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.earnings.calendar.YFinanceClient") as MockYF:
+        with patch("zaza.tools.earnings.calendar.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.earnings.calendar.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_earnings.return_value = {
                     "earnings_history": [],
@@ -201,8 +201,8 @@ class TestEventCalendar:
     @pytest.mark.asyncio
     async def test_returns_upcoming_events(self, mock_mcp, tmp_cache):
         """get_event_calendar returns dividends, splits, earnings dates."""
-        with patch("zaza.tools.earnings.events.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.earnings.events.YFinanceClient") as MockYF:
+        with patch("zaza.tools.earnings.events.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.earnings.events.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_quote.return_value = {
                     "regularMarketPrice": 150.0,
@@ -234,8 +234,8 @@ class TestEventCalendar:
     @pytest.mark.asyncio
     async def test_handles_no_events(self, mock_mcp, tmp_cache):
         """Returns ok with empty events list when no events available."""
-        with patch("zaza.tools.earnings.events.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.earnings.events.YFinanceClient") as MockYF:
+        with patch("zaza.tools.earnings.events.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.earnings.events.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_quote.return_value = {"regularMarketPrice": 50.0}
                 client.get_earnings.return_value = {
@@ -262,8 +262,8 @@ class TestBuybackData:
     @pytest.mark.asyncio
     async def test_returns_buyback_info(self, mock_mcp, tmp_cache):
         """get_buyback_data returns buyback metrics from quote."""
-        with patch("zaza.tools.earnings.buybacks.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.earnings.buybacks.YFinanceClient") as MockYF:
+        with patch("zaza.tools.earnings.buybacks.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.earnings.buybacks.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_quote.return_value = {
                     "regularMarketPrice": 150.0,
@@ -297,8 +297,8 @@ class TestBuybackData:
     @pytest.mark.asyncio
     async def test_handles_no_buyback_data(self, mock_mcp, tmp_cache):
         """Returns error when no buyback data available."""
-        with patch("zaza.tools.earnings.buybacks.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.earnings.buybacks.YFinanceClient") as MockYF:
+        with patch("zaza.tools.earnings.buybacks.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.earnings.buybacks.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_quote.return_value = {}
                 client.get_financials.return_value = {
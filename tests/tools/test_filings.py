@@ -66,7 +66,7 @@ def _capture_tools_with_mock_edgar(mock_edgar):
     mcp.tool = capture_tool
 
     with patch("zaza.tools.finance.filings.EdgarClient", return_value=mock_edgar):
-        with patch("zaza.tools.finance.filings.FileCache"):
+        with patch("zaza.tools.finance.filings.get_cache"):
             from zaza.tools.finance.filings import register
             register(mcp)
 
@@ -246,3 +246,56 @@ async def test_get_filing_items_error_handling(cache):
     result = json.loads(result_str)
 
     assert "error" in result
+
+
+# ---------------------------------------------------------------------------
+# _parse_filing_items tests
+# ---------------------------------------------------------------------------
+
+
+SAMPLE_FILING_TEXT = """<DOCUMENT>
+<TYPE>10-K
+<TEXT>
+Item 1. Business
+Apple Computer, Inc. designs, manufactures and markets personal computers.
+<PAGE>
+Item 7. Management's Discussion and Analysis
+Net sales increased during fiscal 1998.
+</TEXT>
+</DOCUMENT>
+"""
+
+
+def test_parse_filing_items_plain_text_skips_html_parser():
+    """Plain-text SGML filings are parsed by regex without invoking BeautifulSoup."""
+    from zaza.tools.finance.filings import _parse_filing_items
+
+    with patch("zaza.tools.finance.filings.BeautifulSoup") as mock_soup:
+        items = _parse_filing_items(SAMPLE_FILING_TEXT)
+
+    mock_soup.assert_not_called()
+    assert [item["item"] for item in items] == [
+        "Item 1. Business",
+        "Item 7. Management's Discussion and Analysis",
+    ]
+    assert "personal computers" in items[0]["content"]
+
+
+def test_parse_filing_items_html_uses_parser():
+    """HTML filings are still stripped of markup before section extraction."""
+    from zaza.tools.finance.filings import _parse_filing_items
+
+    items = _parse_filing_items(SAMPLE_FILING_HTML)
+
+    assert items[0]["item"] == "Item 1. Business"
+    assert "<p>" not in items[0]["content"]
+
+
+def test_find_item_headers_matches_only_line_starts():
+    """Item headers are recognised only at line starts, in any letter case."""
+    from zaza.tools.finance.filings import _find_item_headers
+
+    text = "Preamble mentions Item 5 inline\nITEM 1A. Risk Factors\nbody\nitem 7. MD&A\n"
+    headers = [m.group(1) for m in _find_item_headers(text)]
+
+    assert headers == ["ITEM 1A. Risk Factors", "item 7. MD&A"]
@@ -385,6 +385,44 @@ class TestGetPrices:
             "AAPL", period="6mo", start="2024-01-01", end="2024-06-30",
         )
 
+    def test_columns_format(self, cache):
+        """get_prices with output_format='columns' returns one list per OHLCV field."""
+        mock_instance = MagicMock()
+        mock_instance.get_history.return_value = _sample_history()
+
+        from zaza.tools.finance.prices import _make_prices
+
+        parsed = json.loads(_make_prices(mock_instance, "AAPL", output_format="columns"))
+        assert "records" not in parsed
+        assert parsed["record_count"] == 2
+        columns = parsed["columns"]
+        assert set(columns) == set(_sample_history()[0])
+        assert all(len(values) == 2 for values in columns.values())
+
+    def test_invalid_format(self, cache):
+        """get_prices rejects unknown formats without fetching data."""
+        mock_instance = MagicMock()
+
+        from zaza.tools.finance.prices import _make_prices
+
+        parsed = json.loads(_make_prices(mock_instance, "AAPL", output_format="parquet"))
+        assert "error" in parsed
+        mock_instance.get_history.assert_not_called()
+
+    def test_columns_use_union_of_row_keys(self):
+        """Fields missing from the first row still get a column, padded with None."""
+        from zaza.tools.finance.prices import _records_to_columns
+
+        records = [
+            {"Date": "2024-01-02", "Close": 185.5},
+            {"Date": "2024-01-03", "Close": 186.0, "Dividends": 0.24},
+        ]
+        assert _records_to_columns(records) == {
+            "Date": ["2024-01-02", "2024-01-03"],
+            "Close": [185.5, 186.0],
+            "Dividends": [None, 0.24],
+        }
+
 
 # ---------------------------------------------------------------------------
 # get_company_facts (tool)
@@ -580,6 +618,34 @@ class TestGetIncomeStatements:
         assert stmt["total_revenue"] == 394_000_000_000
         assert stmt["net_income"] == 97_000_000_000
 
+    def test_columns_format(self, cache):
+        """get_income_statements with output_format='columns' returns one list per field."""
+        mock_instance = MagicMock()
+        mock_instance.get_financials.return_value = _sample_financials()
+
+        from zaza.tools.finance.statements import _make_income_statements
+
+        result = _make_income_statements(
+            mock_instance, "AAPL", "annual", 5, output_format="columns",
+        )
+        parsed = json.loads(result)
+        assert parsed["statement_count"] == 1
+        columns = parsed["statements"]
+        assert columns["total_revenue"] == [394_000_000_000]
+        assert columns["net_income"] == [97_000_000_000]
+
+    def test_invalid_format(self, cache):
+        """get_income_statements rejects unknown output formats without fetching."""
+        mock_instance = MagicMock()
+
+        from zaza.tools.finance.statements import _make_income_statements
+
+        result = _make_income_statements(
+            mock_instance, "AAPL", "annual", 5, output_format="split",
+        )
+        assert "error" in json.loads(result)
+        mock_instance.get_financials.assert_not_called()
+
     @patch("zaza.tools.finance.statements.YFinanceClient")
     def test_empty_returns_error(self, MockYFClient, cache):
         """get_income_statements returns error when no data available."""
@@ -779,6 +845,22 @@ class TestGetAllFinancialStatements:
         parsed = json.loads(result)
         assert "error" in parsed
 
+    def test_statement_tools_share_one_fetch(self, cache):
+        """Back-to-back statement tools for one ticker reuse a single get_financials call."""
+        mock_instance = MagicMock()
+        mock_instance.get_financials.return_value = _sample_financials()
+
+        from zaza.tools.finance import statements
+
+        statements._make_income_statements(mock_instance, "AAPL", "annual", 5)
+        statements._make_balance_sheets(mock_instance, "AAPL", "annual", 5)
+        statements._make_cash_flow_statements(mock_instance, "AAPL", "annual", 5)
+        statements._make_all_financial_statements(mock_instance, "AAPL", "annual", 5)
+        mock_instance.get_financials.assert_called_once_with("AAPL", period="annual")
+
+        statements._make_income_statements(mock_instance, "AAPL", "quarterly", 5)
+        assert mock_instance.get_financials.call_count == 2
+
 
 # ---------------------------------------------------------------------------
 # get_key_ratios_snapshot
@@ -897,6 +979,21 @@ class TestGetKeyRatios:
         # Should not crash, ratios should be None
         assert parsed["ratios"][0]["gross_margin"] is None
 
+    def test_aligns_to_income_periods(self, cache):
+        """Missing balance/cash flow rows yield None; extra rows are ignored."""
+        mock_instance = MagicMock()
+        financials = _sample_financials()
+        financials["balance_sheet"] = []
+        financials["cash_flow"] = financials["cash_flow"] * 3
+        mock_instance.get_financials.return_value = financials
+
+        from zaza.tools.finance.ratios import _make_key_ratios
+
+        parsed = json.loads(_make_key_ratios(mock_instance, "AAPL", "annual", 5))
+        assert parsed["ratio_count"] == len(financials["income_statement"])
+        assert parsed["ratios"][0]["return_on_equity"] is None
+        assert parsed["ratios"][0]["current_ratio"] is None
+
 
 # ---------------------------------------------------------------------------
 # get_analyst_estimates
@@ -1035,3 +1132,25 @@ class TestFinanceRegister:
 
         # Verify tool() was called 13 times (13 MCP tools)
         assert mock_mcp.tool.call_count == 13
+
+    @pytest.mark.asyncio
+    async def test_tools_run_blocking_work_in_thread(self):
+        """Finance tools hand their blocking yfinance work to asyncio.to_thread."""
+        tools: dict = {}
+        mock_mcp = MagicMock()
+        mock_mcp.tool.return_value = lambda fn: tools.setdefault(fn.__name__, fn)
+
+        with patch("zaza.tools.finance.prices.get_yf"):
+            from zaza.tools.finance.prices import _make_price_snapshot, register
+
+            register(mock_mcp)
+
+        with patch(
+            "zaza.tools.finance.prices.asyncio.to_thread",
+            new=AsyncMock(return_value='{"ticker": "AAPL"}'),
+        ) as mock_to_thread:
+            result = await tools["get_price_snapshot"]("AAPL")
+
+        assert json.loads(result) == {"ticker": "AAPL"}
+        mock_to_thread.assert_awaited_once()
+        assert mock_to_thread.await_args.args[0] is _make_price_snapshot
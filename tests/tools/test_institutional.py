@@ -51,8 +51,8 @@ class TestShortInterest:
     @pytest.mark.asyncio
     async def test_returns_short_interest_data(self, mock_mcp, tmp_cache):
         """get_short_interest returns short metrics and squeeze score."""
-        with patch("zaza.tools.institutional.short_interest.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.institutional.short_interest.YFinanceClient") as MockYF:
+        with patch("zaza.tools.institutional.short_interest.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.institutional.short_interest.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_quote.return_value = {
                     "regularMarketPrice": 150.0,
@@ -76,8 +76,8 @@ class TestShortInterest:
     @pytest.mark.asyncio
     async def test_high_short_interest_squeeze_score(self, mock_mcp, tmp_cache):
         """High short interest produces high squeeze score."""
-        with patch("zaza.tools.institutional.short_interest.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.institutional.short_interest.YFinanceClient") as MockYF:
+        with patch("zaza.tools.institutional.short_interest.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.institutional.short_interest.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_quote.return_value = {
                     "regularMarketPrice": 10.0,
@@ -95,11 +95,27 @@ class TestShortInterest:
         data = result["data"]
         assert data["squeeze_score"] > 5  # High squeeze potential
 
+    @pytest.mark.parametrize(
+        ("args", "expected"),
+        [
+            ((0.0, 0.0, 0.0, 0.0), 0.0),
+            ((0.05, 2.0, 1_000.0, 1_000.0), 3.0),  # each factor exactly at its first tier
+            ((0.299, 6.99, 1_000.0, 4_999.0), 7.0),  # just below the top tiers
+            ((0.30, 7.0, 1_000.0, 5_000.0), 10.0),
+            ((0.50, 20.0, 0.0, 5_000.0), 7.0),  # no volume: coverage factor skipped
+        ],
+    )
+    def test_squeeze_score_tiers(self, args, expected):
+        """Squeeze score awards one point per threshold met in each factor."""
+        from zaza.tools.institutional.short_interest import _compute_squeeze_score
+
+        assert _compute_squeeze_score(*args) == expected
+
     @pytest.mark.asyncio
     async def test_handles_missing_data(self, mock_mcp, tmp_cache):
         """Returns error when quote data is empty."""
-        with patch("zaza.tools.institutional.short_interest.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.institutional.short_interest.YFinanceClient") as MockYF:
+        with patch("zaza.tools.institutional.short_interest.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.institutional.short_interest.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_quote.return_value = {}
                 register_short_interest(mock_mcp)
@@ -121,8 +137,8 @@ class TestInstitutionalHoldings:
     @pytest.mark.asyncio
     async def test_returns_top_holders(self, mock_mcp, tmp_cache):
         """get_institutional_holdings returns top 10 holders."""
-        with patch("zaza.tools.institutional.holdings.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.institutional.holdings.YFinanceClient") as MockYF:
+        with patch("zaza.tools.institutional.holdings.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.institutional.holdings.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_institutional_holders.return_value = {
                     "institutional_holders": [
@@ -163,8 +179,8 @@ class TestInstitutionalHoldings:
     @pytest.mark.asyncio
     async def test_handles_empty_holders(self, mock_mcp, tmp_cache):
         """Returns error when no holder data available."""
-        with patch("zaza.tools.institutional.holdings.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.institutional.holdings.YFinanceClient") as MockYF:
+        with patch("zaza.tools.institutional.holdings.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.institutional.holdings.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_institutional_holders.return_value = {
                     "institutional_holders": [],
@@ -189,8 +205,8 @@ class TestFundFlows:
     @pytest.mark.asyncio
     async def test_returns_flow_proxy_data(self, mock_mcp, tmp_cache):
         """get_fund_flows returns sector ETF volume/price trend proxy."""
-        with patch("zaza.tools.institutional.flows.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.institutional.flows.YFinanceClient") as MockYF:
+        with patch("zaza.tools.institutional.flows.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.institutional.flows.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_quote.return_value = {
                     "regularMarketPrice": 150.0,
@@ -219,8 +235,8 @@ class TestFundFlows:
     @pytest.mark.asyncio
     async def test_handles_unknown_sector(self, mock_mcp, tmp_cache):
         """Handles tickers with no sector mapping."""
-        with patch("zaza.tools.institutional.flows.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.institutional.flows.YFinanceClient") as MockYF:
+        with patch("zaza.tools.institutional.flows.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.institutional.flows.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_quote.return_value = {
                     "regularMarketPrice": 50.0,
@@ -237,6 +253,67 @@ class TestFundFlows:
         # Should still return ok with whatever data is available
         assert result["status"] in ("ok", "error")
 
+    @pytest.mark.asyncio
+    async def test_fetches_sector_etf_and_ticker_history(self, mock_mcp, tmp_cache):
+        """get_fund_flows fetches both the sector ETF and the ticker history."""
+        with patch("zaza.tools.institutional.flows.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.institutional.flows.get_yf") as MockYF:
+                client = MockYF.return_value
+                client.get_quote.return_value = {"sector": "Energy"}
+                client.get_history.return_value = [
+                    {"Close": 50.0, "Volume": 10000000},
+                    {"Close": 51.0, "Volume": 12000000},
+                ]
+                register_flows(mock_mcp)
+
+                fn = mock_mcp._registered_tools["get_fund_flows"]
+                result = json.loads(await fn(ticker="XOM"))
+
+        assert result["data"]["sector_etf"] == "XLE"
+        fetched = sorted(c.args[0] for c in client.get_history.call_args_list)
+        assert fetched == ["XLE", "XOM"]
+
+    @pytest.mark.parametrize(
+        ("sector", "etf"),
+        [
+            ("Technology", "XLK"),
+            ("financial services ", "XLF"),
+            ("  ENERGY", "XLE"),
+            ("Unknown Sector", "SPY"),
+            (None, "SPY"),
+        ],
+    )
+    def test_sector_etf_normalizes_names(self, sector, etf):
+        """Sector lookup ignores case and surrounding whitespace."""
+        from zaza.tools.institutional.flows import _sector_etf
+
+        assert _sector_etf(sector) == etf
+
+    def test_analyze_flow_skips_missing_values(self):
+        """_analyze_flow ignores rows missing Close or Volume."""
+        from zaza.tools.institutional.flows import _analyze_flow
+
+        history = [
+            {"Close": None, "Volume": 10_000_000},
+            {"Close": 100.0, "Volume": None},
+            {"Volume": 20_000_000},
+            {"Close": 110.0, "Volume": 30_000_000},
+        ]
+        assert _analyze_flow(history) == {
+            "flow_signal": "strong_inflow",
+            "trend": "up",
+            "price_change_pct": 10.0,
+            "volume_change_pct": 150.0,
+            "recent_avg_volume": 25_000_000,
+        }
+
+    def test_analyze_flow_insufficient_data(self):
+        """_analyze_flow reports insufficient data when no valid closes exist."""
+        from zaza.tools.institutional.flows import _analyze_flow
+
+        history = [{"Close": None, "Volume": 1_000}, {"Close": 0, "Volume": 2_000}]
+        assert _analyze_flow(history)["flow_signal"] == "insufficient_data"
+
 
 # ---------------------------------------------------------------------------
 # Dark Pool Activity
@@ -249,8 +326,8 @@ class TestDarkPoolActivity:
     @pytest.mark.asyncio
     async def test_returns_dark_pool_estimate(self, mock_mcp, tmp_cache):
         """get_dark_pool_activity returns off-exchange % estimate."""
-        with patch("zaza.tools.institutional.dark_pool.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.institutional.dark_pool.YFinanceClient") as MockYF:
+        with patch("zaza.tools.institutional.dark_pool.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.institutional.dark_pool.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_quote.return_value = {
                     "regularMarketPrice": 150.0,
@@ -272,11 +349,23 @@ class TestDarkPoolActivity:
         data = result["data"]
         assert "estimated_off_exchange_pct" in data
 
+    def test_volume_stats(self):
+        """_volume_stats reports mean, extremes and population std."""
+        from zaza.tools.institutional.dark_pool import _volume_stats
+
+        stats = _volume_stats([40_000_000.0, 42_000_000.0, 50_000_000.0])
+        assert stats == {
+            "avg_volume_1mo": 44_000_000,
+            "max_volume_1mo": 50_000_000,
+            "min_volume_1mo": 40_000_000,
+            "volume_std": 4_320_493,
+        }
+
     @pytest.mark.asyncio
     async def test_handles_missing_volume_data(self, mock_mcp, tmp_cache):
         """Returns error when volume data is missing."""
-        with patch("zaza.tools.institutional.dark_pool.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.institutional.dark_pool.YFinanceClient") as MockYF:
+        with patch("zaza.tools.institutional.dark_pool.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.institutional.dark_pool.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_quote.return_value = {}
                 client.get_history.return_value = []
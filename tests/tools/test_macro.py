@@ -59,8 +59,8 @@ class TestTreasuryYields:
     @pytest.mark.asyncio
     async def test_returns_yields_and_curve_shape(self, mock_mcp, tmp_cache):
         """get_treasury_yields returns yields and curve classification."""
-        with patch("zaza.tools.macro.rates.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.macro.rates.YFinanceClient") as MockYF:
+        with patch("zaza.tools.macro.rates.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.macro.rates.get_yf") as MockYF:
                 client = MockYF.return_value
                 # Normal curve: 3mo < 5Y < 10Y < 30Y
                 def quote_side_effect(ticker):
@@ -88,8 +88,8 @@ class TestTreasuryYields:
     @pytest.mark.asyncio
     async def test_inverted_curve(self, mock_mcp, tmp_cache):
         """Detects inverted yield curve when 3mo > 10Y."""
-        with patch("zaza.tools.macro.rates.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.macro.rates.YFinanceClient") as MockYF:
+        with patch("zaza.tools.macro.rates.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.macro.rates.get_yf") as MockYF:
                 client = MockYF.return_value
 
                 def quote_side_effect(ticker):
@@ -112,8 +112,8 @@ class TestTreasuryYields:
     @pytest.mark.asyncio
     async def test_handles_empty_data(self, mock_mcp, tmp_cache):
         """Returns error when yfinance returns empty data."""
-        with patch("zaza.tools.macro.rates.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.macro.rates.YFinanceClient") as MockYF:
+        with patch("zaza.tools.macro.rates.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.macro.rates.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_quote.return_value = {}
                 register_rates(mock_mcp)
@@ -135,8 +135,8 @@ class TestMarketIndices:
     @pytest.mark.asyncio
     async def test_returns_indices_with_vix_interpretation(self, mock_mcp, tmp_cache):
         """get_market_indices returns values with VIX interpretation."""
-        with patch("zaza.tools.macro.indices.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.macro.indices.YFinanceClient") as MockYF:
+        with patch("zaza.tools.macro.indices.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.macro.indices.get_yf") as MockYF:
                 client = MockYF.return_value
 
                 def quote_side_effect(ticker):
@@ -173,13 +173,15 @@ class TestMarketIndices:
         assert result["status"] == "ok"
         indices = result["data"]["indices"]
         assert indices["VIX"]["value"] == 13.0
+        assert list(indices) == ["VIX", "SP500", "Dow_Jones", "Nasdaq", "US_Dollar"]
+        assert indices["US_Dollar"]["value"] == 104.5
         assert result["data"]["vix_interpretation"] == "low"
 
     @pytest.mark.asyncio
     async def test_high_vix_interpretation(self, mock_mcp, tmp_cache):
         """VIX above 30 is classified as high."""
-        with patch("zaza.tools.macro.indices.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.macro.indices.YFinanceClient") as MockYF:
+        with patch("zaza.tools.macro.indices.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.macro.indices.get_yf") as MockYF:
                 client = MockYF.return_value
 
                 def quote_side_effect(ticker):
@@ -218,8 +220,8 @@ class TestMarketIndices:
     @pytest.mark.asyncio
     async def test_handles_empty_data(self, mock_mcp, tmp_cache):
         """Returns error on empty data."""
-        with patch("zaza.tools.macro.indices.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.macro.indices.YFinanceClient") as MockYF:
+        with patch("zaza.tools.macro.indices.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.macro.indices.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_quote.return_value = {}
                 register_indices(mock_mcp)
@@ -241,8 +243,8 @@ class TestCommodityPrices:
     @pytest.mark.asyncio
     async def test_returns_commodity_prices_and_changes(self, mock_mcp, tmp_cache):
         """get_commodity_prices returns prices and weekly/monthly % change."""
-        with patch("zaza.tools.macro.commodities.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.macro.commodities.YFinanceClient") as MockYF:
+        with patch("zaza.tools.macro.commodities.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.macro.commodities.get_yf") as MockYF:
                 client = MockYF.return_value
 
                 def quote_side_effect(ticker):
@@ -293,8 +295,8 @@ class TestCommodityPrices:
     @pytest.mark.asyncio
     async def test_handles_empty_data(self, mock_mcp, tmp_cache):
         """Returns error on empty data."""
-        with patch("zaza.tools.macro.commodities.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.macro.commodities.YFinanceClient") as MockYF:
+        with patch("zaza.tools.macro.commodities.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.macro.commodities.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_quote.return_value = {}
                 client.get_history.return_value = []
@@ -317,7 +319,7 @@ class TestEconomicCalendar:
     @pytest.mark.asyncio
     async def test_returns_events_with_fred(self, mock_mcp, tmp_cache):
         """get_economic_calendar returns events from FRED when key is available."""
-        with patch("zaza.tools.macro.calendar.FileCache", return_value=tmp_cache):
+        with patch("zaza.tools.macro.calendar.get_cache", return_value=tmp_cache):
             with patch("zaza.tools.macro.calendar.has_fred_key", return_value=True):
                 with patch("zaza.tools.macro.calendar.get_fred_api_key", return_value="test_key"):
                     with patch("zaza.tools.macro.calendar.FredClient") as MockFred:
@@ -337,7 +339,7 @@ class TestEconomicCalendar:
     @pytest.mark.asyncio
     async def test_degrades_gracefully_without_fred_key(self, mock_mcp, tmp_cache):
         """Returns placeholder message when FRED key is absent."""
-        with patch("zaza.tools.macro.calendar.FileCache", return_value=tmp_cache):
+        with patch("zaza.tools.macro.calendar.get_cache", return_value=tmp_cache):
             with patch("zaza.tools.macro.calendar.has_fred_key", return_value=False):
                 register_calendar(mock_mcp)
 
@@ -352,7 +354,7 @@ class TestEconomicCalendar:
     @pytest.mark.asyncio
     async def test_handles_fred_error(self, mock_mcp, tmp_cache):
         """Returns error when FRED API fails."""
-        with patch("zaza.tools.macro.calendar.FileCache", return_value=tmp_cache):
+        with patch("zaza.tools.macro.calendar.get_cache", return_value=tmp_cache):
             with patch("zaza.tools.macro.calendar.has_fred_key", return_value=True):
                 with patch("zaza.tools.macro.calendar.get_fred_api_key", return_value="test_key"):
                     with patch("zaza.tools.macro.calendar.FredClient") as MockFred:
@@ -379,8 +381,8 @@ class TestIntermarketCorrelations:
         """get_intermarket_correlations returns correlation matrix."""
         import numpy as np
 
-        with patch("zaza.tools.macro.correlations.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.macro.correlations.YFinanceClient") as MockYF:
+        with patch("zaza.tools.macro.correlations.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.macro.correlations.get_yf") as MockYF:
                 client = MockYF.return_value
                 # Generate correlated price data
                 rng = np.random.default_rng(42)
@@ -411,8 +413,8 @@ class TestIntermarketCorrelations:
     @pytest.mark.asyncio
     async def test_handles_insufficient_data(self, mock_mcp, tmp_cache):
         """Returns error when insufficient data for correlations."""
-        with patch("zaza.tools.macro.correlations.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.macro.correlations.YFinanceClient") as MockYF:
+        with patch("zaza.tools.macro.correlations.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.macro.correlations.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_history.return_value = []
                 register_correlations(mock_mcp)
@@ -421,3 +423,69 @@ class TestIntermarketCorrelations:
                 result = json.loads(await fn(ticker="AAPL"))
 
         assert result["status"] == "error"
+
+    @pytest.mark.asyncio
+    async def test_benchmark_returns_shared_across_tickers(self, mock_mcp, tmp_cache):
+        """Benchmark histories are fetched once and reused for later tickers."""
+        import numpy as np
+
+        with patch("zaza.tools.macro.correlations.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.macro.correlations.get_yf") as MockYF:
+                client = MockYF.return_value
+
+                def history_side_effect(ticker, period="6mo"):
+                    rng = np.random.default_rng(hash(ticker) % 2**31)
+                    prices = np.cumsum(rng.standard_normal(100)) + 100
+                    return [{"Close": float(p)} for p in prices]
+
+                client.get_history.side_effect = history_side_effect
+                register_correlations(mock_mcp)
+
+                fn = mock_mcp._registered_tools["get_intermarket_correlations"]
+                first = json.loads(await fn(ticker="AAPL"))
+                second = json.loads(await fn(ticker="MSFT"))
+
+        assert first["status"] == "ok"
+        assert second["status"] == "ok"
+        fetched = [c.args[0] for c in client.get_history.call_args_list]
+        assert fetched.count("^GSPC") == 1
+        assert fetched.count("AAPL") == 1
+        assert fetched.count("MSFT") == 1
+
+
+class TestRollingCorrs:
+    """Tests for the running-sum correlation helper."""
+
+    def test_matches_corrcoef_per_window(self):
+        import numpy as np
+
+        from zaza.tools.macro.correlations import _rolling_corrs
+
+        rng = np.random.default_rng(7)
+        a = rng.standard_normal(120) * 0.02
+        b = 0.6 * a + rng.standard_normal(120) * 0.01
+        result = _rolling_corrs(a, b)
+        for w in (30, 60, 90):
+            expected = float(np.corrcoef(a[-w:], b[-w:])[0, 1])
+            assert result[f"{w}d"] == pytest.approx(expected, abs=1e-4)
+
+    def test_short_or_constant_series_yield_none(self):
+        import numpy as np
+
+        from zaza.tools.macro.correlations import _rolling_corrs
+
+        rng = np.random.default_rng(7)
+        a = rng.standard_normal(45)
+        assert _rolling_corrs(a, a) == {"30d": 1.0, "60d": None, "90d": None}
+        assert _rolling_corrs(np.full(90, 0.01), a[:40])["30d"] is None
+
+
+@pytest.mark.parametrize(
+    ("vix", "label"),
+    [(14.99, "low"), (15.0, "moderate"), (20.0, "elevated"), (29.99, "elevated"), (30.0, "high")],
+)
+def test_interpret_vix_bands(vix, label):
+    """VIX band edges are inclusive on the lower bound of each band."""
+    from zaza.tools.macro.indices import _interpret_vix
+
+    assert _interpret_vix(vix) == label
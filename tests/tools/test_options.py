@@ -229,6 +229,10 @@ class TestGetImpliedVolatility:
         result = json.loads(await tools["get_implied_volatility"]("AAPL"))
         # Skew = OTM put IV (avg 0.40) - OTM call IV (avg 0.25) > 0
         assert result["iv_skew"] > 0
+        assert result["atm_strike"] == 100
+        assert result["atm_iv"] == 0.3
+        assert result["otm_put_iv_avg"] == 0.4
+        assert result["otm_call_iv_avg"] == 0.25
 
 
 # ===========================================================================
@@ -273,6 +277,30 @@ class TestGetOptionsFlow:
         assert result["unusual_activity"] == []
 
 
+class TestFindUnusualActivity:
+    """_find_unusual_activity filter tests."""
+
+    def test_filters_on_volume_and_ratio(self) -> None:
+        from zaza.tools.options.flow import _find_unusual_activity
+
+        contracts = [
+            {"strike": 90, "volume": 600, "openInterest": 100, "lastPrice": 1.5},
+            {"strike": 95, "volume": 40, "openInterest": 0, "lastPrice": 1.0},  # low volume
+            {"strike": 100, "volume": 200, "openInterest": 100, "lastPrice": 2.0},  # ratio 2
+            {"strike": 105, "volume": 80, "openInterest": None, "lastPrice": 0.5},  # no OI
+            {"strike": 110, "volume": None, "openInterest": 10},
+            {"strike": 115, "volume": float("nan"), "openInterest": 10},
+        ]
+        result = _find_unusual_activity(contracts, "put", "2025-03-21")
+        assert [u["strike"] for u in result] == [90, 105]
+        assert result[0]["vol_oi_ratio"] == 6.0
+        assert result[0]["notional"] == 90000.0
+        assert result[1]["vol_oi_ratio"] == float("inf")
+        assert result[1]["openInterest"] == 0
+        assert result[0]["expiration"] == "2025-03-21"
+        assert _find_unusual_activity([], "call", "2025-03-21") == []
+
+
 class TestGetPutCallRatio:
     """get_put_call_ratio tool tests."""
 
@@ -291,6 +319,17 @@ class TestGetPutCallRatio:
         # Put volume < call volume in our synthetic data
         assert isinstance(result["pc_volume_ratio"], float)
 
+    def test_volume_oi_totals_skip_missing_values(self) -> None:
+        from zaza.tools.options.flow import _volume_oi_totals
+
+        contracts = [
+            {"volume": 10, "openInterest": 100},
+            {"volume": None, "openInterest": float("nan")},
+            {"openInterest": 5},
+        ]
+        assert _volume_oi_totals(contracts) == (10, 105)
+        assert _volume_oi_totals([]) == (0, 0)
+
     async def test_put_call_ratio_no_data(self, mock_yf: MagicMock, mock_cache: MagicMock) -> None:
         mock_yf.get_options_expirations.return_value = []
         from zaza.tools.options.flow import register
@@ -362,6 +401,63 @@ class TestGetMaxPain:
         # With massive OI at 100 for both calls and puts, max pain should be 100
         assert result["max_pain_strike"] == 100
 
+    def test_max_pain_matches_brute_force(self) -> None:
+        """Running-sum max pain agrees with direct evaluation at every strike."""
+        import random
+
+        from zaza.tools.options.arrays import chain_to_arrays
+        from zaza.tools.options.levels import _calculate_max_pain
+
+        rng = random.Random(3)
+        for _ in range(50):
+            calls = [
+                {"strike": rng.randrange(80, 121, 5), "openInterest": rng.randint(0, 500)}
+                for _ in range(rng.randint(1, 15))
+            ]
+            puts = [
+                {"strike": rng.randrange(80, 121, 5), "openInterest": rng.randint(0, 500)}
+                for _ in range(rng.randint(1, 15))
+            ]
+            strikes = sorted({c["strike"] for c in calls + puts})
+            pain = [
+                sum(max(0, k - c["strike"]) * c["openInterest"] for c in calls)
+                + sum(max(0, p["strike"] - k) * p["openInterest"] for p in puts)
+                for k in strikes
+            ]
+            chain = chain_to_arrays({"calls": calls, "puts": puts})
+            assert _calculate_max_pain(chain) == strikes[pain.index(min(pain))]
+
+    def test_max_pain_missing_oi_counts_as_zero(self) -> None:
+        from zaza.tools.options.arrays import chain_to_arrays
+        from zaza.tools.options.levels import _calculate_max_pain
+
+        calls = [{"strike": s, "openInterest": 100} for s in (90, 95, 100, 105, 110)]
+        puts = [{"strike": s, "openInterest": 100} for s in (90, 95, 100, 105, 110)]
+        calls.append({"strike": 120, "openInterest": None})
+        assert _calculate_max_pain(chain_to_arrays({"calls": calls, "puts": puts})) == 100
+        assert _calculate_max_pain(chain_to_arrays({})) == 0.0
+
+    def test_oi_distribution_groups_by_strike(self) -> None:
+        from zaza.tools.options.arrays import chain_to_arrays
+        from zaza.tools.options.levels import _get_oi_distribution
+
+        calls = [{"strike": 100, "openInterest": 5}, {"strike": 95, "openInterest": 2},
+                 {"strike": 100, "openInterest": 1}]
+        puts = [{"strike": 105, "openInterest": 7}, {"strike": 100, "openInterest": None},
+                {"strike": 97.5, "openInterest": 3}]
+        dist = _get_oi_distribution(
+            chain_to_arrays({"calls": calls, "puts": puts}), [*calls, *puts]
+        )
+        assert dist == [
+            {"strike": 95, "call_oi": 2, "put_oi": 0, "total_oi": 2},
+            {"strike": 97.5, "call_oi": 0, "put_oi": 3, "total_oi": 3},
+            {"strike": 100, "call_oi": 6, "put_oi": 0, "total_oi": 6},
+            {"strike": 105, "call_oi": 0, "put_oi": 7, "total_oi": 7},
+        ]
+        # Strikes keep the type they were given in (int here, not 100.0)
+        assert json.dumps([row["strike"] for row in dist]) == "[95, 97.5, 100, 105]"
+        assert _get_oi_distribution(chain_to_arrays({}), []) == []
+
     async def test_max_pain_defaults_to_nearest_expiry(
         self, mock_yf: MagicMock, mock_cache: MagicMock
     ) -> None:
@@ -430,6 +526,28 @@ class TestGetGammaExposure:
         # flip point should be a number or None
         assert flip is None or isinstance(flip, (int, float))
 
+    def test_gamma_exposure_by_strike_aggregates_and_skips_invalid(self) -> None:
+        import math
+
+        from zaza.tools.options.arrays import chain_to_arrays
+        from zaza.tools.options.levels import _gamma_exposure_by_strike
+
+        calls = [
+            {"strike": 100, "impliedVolatility": 0.3, "openInterest": 10},
+            {"strike": 105, "impliedVolatility": 0.0, "openInterest": 10},  # no IV
+        ]
+        puts = [
+            {"strike": 100, "impliedVolatility": 0.3, "openInterest": 4},
+            {"strike": 95, "impliedVolatility": 0.3, "openInterest": None},  # no OI
+        ]
+        chain = chain_to_arrays({"calls": calls, "puts": puts})
+        strikes, gex = _gamma_exposure_by_strike(chain, spot=100.0)
+        assert strikes.tolist() == [95.0, 100.0, 105.0]
+        t = 30 / 365
+        d1 = 0.5 * 0.3 * 0.3 * t / (0.3 * math.sqrt(t))
+        gamma = math.exp(-0.5 * d1 * d1) / math.sqrt(2 * math.pi) / (100 * 0.3 * math.sqrt(t))
+        assert gex.tolist() == pytest.approx([0.0, gamma * 6 * 100 * 100, 0.0])
+
 
 # ===========================================================================
 # __init__.py register_options_tools tests
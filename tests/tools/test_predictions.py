@@ -194,6 +194,7 @@ class TestGetPrediction:
         "A" * 11,        # too long
         "aa bb",         # spaces
         "AAPL!",         # special chars
+        "AAPL\n",        # trailing newline
         "",              # empty string
     ])
     async def test_rejects_invalid_ticker_format(self, bad_ticker: str) -> None:
@@ -14,6 +14,7 @@ import pytest
 from zaza.cache.store import FileCache
 from zaza.tools.quantitative.distribution import register as register_distribution
 from zaza.tools.quantitative.forecast import register as register_forecast
+from zaza.tools.quantitative.mean_reversion import _trailing_z_scores
 from zaza.tools.quantitative.mean_reversion import register as register_mean_reversion
 from zaza.tools.quantitative.monte_carlo import register as register_monte_carlo
 from zaza.tools.quantitative.regime import register as register_regime
@@ -69,8 +70,8 @@ class TestPriceForecast:
     @pytest.mark.asyncio
     async def test_arima_forecast_returns_predictions(self, mock_mcp, tmp_cache, price_history):
         """get_price_forecast returns forecast with confidence intervals."""
-        with patch("zaza.tools.quantitative.forecast.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.quantitative.forecast.YFinanceClient") as MockYF:
+        with patch("zaza.tools.quantitative.forecast.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.quantitative.forecast.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_history.return_value = price_history
                 register_forecast(mock_mcp)
@@ -82,11 +83,32 @@ class TestPriceForecast:
         assert "forecast" in result["data"]
         assert len(result["data"]["forecast"]) > 0
 
+    @pytest.mark.asyncio
+    async def test_arima_fit_reused_across_horizons(self, mock_mcp, tmp_cache, price_history):
+        """A second horizon on the same history reuses the cached ARIMA fit."""
+        fit = {"order": [1, 0, 1], "aic": -100.0, "forecast": [0.001] * 30}
+        with patch("zaza.tools.quantitative.forecast.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.quantitative.forecast.get_yf") as MockYF:
+                with patch(
+                    "zaza.tools.quantitative.forecast.fit_arima", return_value=fit
+                ) as mock_fit:
+                    client = MockYF.return_value
+                    client.get_history.return_value = price_history
+                    register_forecast(mock_mcp)
+
+                    fn = mock_mcp._registered_tools["get_price_forecast"]
+                    short = json.loads(await fn(ticker="AAPL", horizon_days=5))
+                    full = json.loads(await fn(ticker="AAPL", horizon_days=30))
+
+        assert mock_fit.call_count == 1
+        assert len(short["data"]["forecast"]) == 5
+        assert full["data"]["forecast"][:5] == short["data"]["forecast"]
+
     @pytest.mark.asyncio
     async def test_insufficient_data_returns_error(self, mock_mcp, tmp_cache):
         """Returns error when insufficient price data."""
-        with patch("zaza.tools.quantitative.forecast.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.quantitative.forecast.YFinanceClient") as MockYF:
+        with patch("zaza.tools.quantitative.forecast.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.quantitative.forecast.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_history.return_value = [{"Close": 100.0, "Date": "2025-01-01"}]
                 register_forecast(mock_mcp)
@@ -108,8 +130,8 @@ class TestVolatilityForecast:
     @pytest.mark.asyncio
     async def test_garch_forecast_returns_volatility(self, mock_mcp, tmp_cache, price_history):
         """get_volatility_forecast returns GARCH vol forecast."""
-        with patch("zaza.tools.quantitative.volatility.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.quantitative.volatility.YFinanceClient") as MockYF:
+        with patch("zaza.tools.quantitative.volatility.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.quantitative.volatility.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_history.return_value = price_history
                 register_volatility(mock_mcp)
@@ -120,6 +142,32 @@ class TestVolatilityForecast:
         assert result["status"] == "ok"
         assert "annualized_vol" in result["data"] or "forecasted_vol" in result["data"]
 
+    @pytest.mark.asyncio
+    async def test_garch_fit_reused_across_horizons(self, mock_mcp, tmp_cache, price_history):
+        """A second horizon on the same history reuses the cached GARCH fit."""
+        fit = {
+            "params": {"omega": 0.01, "alpha[1]": 0.1, "beta[1]": 0.85},
+            "aic": 1000.0,
+            "forecasted_vol_30d": [0.01] * 30,
+            "annualized_vol": 0.1587,
+        }
+        with patch("zaza.tools.quantitative.volatility.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.quantitative.volatility.get_yf") as MockYF:
+                with patch(
+                    "zaza.tools.quantitative.volatility.fit_garch", return_value=fit
+                ) as mock_fit:
+                    client = MockYF.return_value
+                    client.get_history.return_value = price_history
+                    register_volatility(mock_mcp)
+
+                    fn = mock_mcp._registered_tools["get_volatility_forecast"]
+                    short = json.loads(await fn(ticker="AAPL", horizon_days=5))
+                    full = json.loads(await fn(ticker="AAPL", horizon_days=30))
+
+        assert mock_fit.call_count == 1
+        assert len(short["data"]["forecasted_vol"]) == 5
+        assert len(full["data"]["forecasted_vol"]) == 30
+
     @pytest.mark.asyncio
     async def test_insufficient_data_returns_error(self, mock_mcp, tmp_cache):
         """Returns error when insufficient price data for GARCH."""
@@ -127,8 +175,8 @@ class TestVolatilityForecast:
             {"Close": float(100 + i * 0.5), "Date": f"2025-01-{i+1:02d}"}
             for i in range(50)
         ]
-        with patch("zaza.tools.quantitative.volatility.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.quantitative.volatility.YFinanceClient") as MockYF:
+        with patch("zaza.tools.quantitative.volatility.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.quantitative.volatility.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_history.return_value = short_history
                 register_volatility(mock_mcp)
@@ -150,8 +198,8 @@ class TestMonteCarloSimulation:
     @pytest.mark.asyncio
     async def test_simulation_returns_percentiles(self, mock_mcp, tmp_cache, price_history):
         """get_monte_carlo_simulation returns percentiles and probabilities."""
-        with patch("zaza.tools.quantitative.monte_carlo.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.quantitative.monte_carlo.YFinanceClient") as MockYF:
+        with patch("zaza.tools.quantitative.monte_carlo.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.quantitative.monte_carlo.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_history.return_value = price_history
                 register_monte_carlo(mock_mcp)
@@ -169,8 +217,8 @@ class TestMonteCarloSimulation:
         """Results are reproducible when using same seed (via underlying model)."""
         results = []
         for _ in range(2):
-            with patch("zaza.tools.quantitative.monte_carlo.FileCache", return_value=tmp_cache):
-                with patch("zaza.tools.quantitative.monte_carlo.YFinanceClient") as MockYF:
+            with patch("zaza.tools.quantitative.monte_carlo.get_cache", return_value=tmp_cache):
+                with patch("zaza.tools.quantitative.monte_carlo.get_yf") as MockYF:
                     client = MockYF.return_value
                     client.get_history.return_value = price_history
                     register_monte_carlo(mock_mcp)
@@ -184,8 +232,8 @@ class TestMonteCarloSimulation:
     @pytest.mark.asyncio
     async def test_empty_data_returns_error(self, mock_mcp, tmp_cache):
         """Returns error on empty price data."""
-        with patch("zaza.tools.quantitative.monte_carlo.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.quantitative.monte_carlo.YFinanceClient") as MockYF:
+        with patch("zaza.tools.quantitative.monte_carlo.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.quantitative.monte_carlo.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_history.return_value = []
                 register_monte_carlo(mock_mcp)
@@ -207,8 +255,8 @@ class TestReturnDistribution:
     @pytest.mark.asyncio
     async def test_returns_distribution_stats(self, mock_mcp, tmp_cache, price_history):
         """get_return_distribution returns stats, VaR, CVaR."""
-        with patch("zaza.tools.quantitative.distribution.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.quantitative.distribution.YFinanceClient") as MockYF:
+        with patch("zaza.tools.quantitative.distribution.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.quantitative.distribution.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_history.return_value = price_history
                 register_distribution(mock_mcp)
@@ -226,8 +274,8 @@ class TestReturnDistribution:
     @pytest.mark.asyncio
     async def test_empty_data_returns_error(self, mock_mcp, tmp_cache):
         """Returns error on empty price data."""
-        with patch("zaza.tools.quantitative.distribution.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.quantitative.distribution.YFinanceClient") as MockYF:
+        with patch("zaza.tools.quantitative.distribution.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.quantitative.distribution.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_history.return_value = []
                 register_distribution(mock_mcp)
@@ -249,8 +297,8 @@ class TestMeanReversion:
     @pytest.mark.asyncio
     async def test_returns_hurst_and_half_life(self, mock_mcp, tmp_cache, price_history):
         """get_mean_reversion returns Hurst exponent and half-life."""
-        with patch("zaza.tools.quantitative.mean_reversion.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.quantitative.mean_reversion.YFinanceClient") as MockYF:
+        with patch("zaza.tools.quantitative.mean_reversion.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.quantitative.mean_reversion.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_history.return_value = price_history
                 register_mean_reversion(mock_mcp)
@@ -267,8 +315,8 @@ class TestMeanReversion:
     @pytest.mark.asyncio
     async def test_empty_data_returns_error(self, mock_mcp, tmp_cache):
         """Returns error on empty price data."""
-        with patch("zaza.tools.quantitative.mean_reversion.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.quantitative.mean_reversion.YFinanceClient") as MockYF:
+        with patch("zaza.tools.quantitative.mean_reversion.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.quantitative.mean_reversion.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_history.return_value = []
                 register_mean_reversion(mock_mcp)
@@ -278,6 +326,18 @@ class TestMeanReversion:
 
         assert result["status"] == "error"
 
+    def test_trailing_z_scores_match_direct_computation(self):
+        """Running-sum z-scores match per-window mean/std and skip flat or short windows."""
+        closes = 150.0 + np.cumsum(np.random.default_rng(7).normal(0, 1, 120))
+        z = _trailing_z_scores(closes, (20, 50, 100, 200))
+
+        assert set(z) == {"20d", "50d", "100d"}
+        for key, window in (("20d", 20), ("50d", 50), ("100d", 100)):
+            tail = closes[-window:]
+            expected = (closes[-1] - tail.mean()) / tail.std(ddof=1)
+            assert z[key] == pytest.approx(expected, abs=1e-4)
+        assert _trailing_z_scores(np.full(60, 42.0), (20,)) == {}
+
 
 # ---------------------------------------------------------------------------
 # Regime Detection
@@ -290,8 +350,8 @@ class TestRegimeDetection:
     @pytest.mark.asyncio
     async def test_returns_regime_classification(self, mock_mcp, tmp_cache, price_history):
         """get_regime_detection returns regime and confidence."""
-        with patch("zaza.tools.quantitative.regime.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.quantitative.regime.YFinanceClient") as MockYF:
+        with patch("zaza.tools.quantitative.regime.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.quantitative.regime.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_history.return_value = price_history
                 register_regime(mock_mcp)
@@ -308,8 +368,8 @@ class TestRegimeDetection:
     @pytest.mark.asyncio
     async def test_empty_data_returns_error(self, mock_mcp, tmp_cache):
         """Returns error on empty price data."""
-        with patch("zaza.tools.quantitative.regime.FileCache", return_value=tmp_cache):
-            with patch("zaza.tools.quantitative.regime.YFinanceClient") as MockYF:
+        with patch("zaza.tools.quantitative.regime.get_cache", return_value=tmp_cache):
+            with patch("zaza.tools.quantitative.regime.get_yf") as MockYF:
                 client = MockYF.return_value
                 client.get_history.return_value = []
                 register_regime(mock_mcp)
@@ -152,6 +152,7 @@ class TestSavePrediction:
             "A" * 11,
             "aa bb",
             "AAPL!",
+            "AAPL\n",
             "",
         ],
     )
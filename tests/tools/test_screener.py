@@ -24,10 +24,10 @@ import pytest
 def _mock_file_cache() -> Any:
     """Prevent all tests from writing to the real ~/.zaza/cache/ directory.
 
-    This autouse fixture patches FileCache so that register() never
+    This autouse fixture patches get_cache so that register() never
     creates real cache files on disk during tests.
     """
-    with patch("zaza.tools.screener.screener.FileCache") as MockCache:
+    with patch("zaza.tools.screener.screener.get_cache") as MockCache:
         mock_cache = MagicMock()
         mock_cache.get.return_value = None
         mock_cache.make_key.return_value = "test_cache_key"
@@ -106,7 +106,7 @@ class TestScreenStocks:
 
         with (
             patch("zaza.tools.screener.screener.yf") as mock_yf,
-            patch("zaza.tools.screener.screener.YFinanceClient") as MockYFClient,
+            patch("zaza.tools.screener.screener.get_yf") as MockYFClient,
         ):
             mock_yf.screen.return_value = screen_resp
             mock_client = MagicMock()
@@ -168,8 +168,8 @@ class TestScreenStocks:
 
         with (
             patch("zaza.tools.screener.screener.yf") as mock_yf,
-            patch("zaza.tools.screener.screener.YFinanceClient") as MockYFClient,
-            patch("zaza.tools.screener.screener.FileCache") as MockCache,
+            patch("zaza.tools.screener.screener.get_yf") as MockYFClient,
+            patch("zaza.tools.screener.screener.get_cache") as MockCache,
         ):
             mock_yf.screen.return_value = {"quotes": [], "total": 0}
             mock_client = MagicMock()
@@ -198,8 +198,8 @@ class TestScreenStocks:
 
         with (
             patch("zaza.tools.screener.screener.yf") as mock_yf,
-            patch("zaza.tools.screener.screener.YFinanceClient") as MockYFClient,
-            patch("zaza.tools.screener.screener.FileCache") as MockCache,
+            patch("zaza.tools.screener.screener.get_yf") as MockYFClient,
+            patch("zaza.tools.screener.screener.get_cache") as MockCache,
         ):
             mock_yf.screen.side_effect = Exception("API rate limit exceeded")
             mock_client = MagicMock()
@@ -233,7 +233,7 @@ class TestScreenStocks:
 
         with (
             patch("zaza.tools.screener.screener.yf") as mock_yf,
-            patch("zaza.tools.screener.screener.YFinanceClient") as MockYFClient,
+            patch("zaza.tools.screener.screener.get_yf") as MockYFClient,
         ):
             mock_yf.screen.return_value = screen_resp
             mock_client = MagicMock()
@@ -269,7 +269,7 @@ class TestScreenStocks:
         for st in scan_types:
             with (
                 patch("zaza.tools.screener.screener.yf") as mock_yf,
-                patch("zaza.tools.screener.screener.YFinanceClient") as MockYFClient,
+                patch("zaza.tools.screener.screener.get_yf") as MockYFClient,
             ):
                 mock_yf.screen.return_value = screen_resp
                 mock_client = MagicMock()
@@ -307,7 +307,7 @@ class TestScreenStocks:
 
         with (
             patch("zaza.tools.screener.screener.yf") as mock_yf,
-            patch("zaza.tools.screener.screener.YFinanceClient") as MockYFClient,
+            patch("zaza.tools.screener.screener.get_yf") as MockYFClient,
         ):
             mock_yf.screen.side_effect = [
                 {"quotes": page1, "total": 600},
@@ -345,8 +345,8 @@ class TestScreenStocks:
 
         with (
             patch("zaza.tools.screener.screener.yf") as mock_yf,
-            patch("zaza.tools.screener.screener.YFinanceClient") as MockYFClient,
-            patch("zaza.tools.screener.screener.FileCache") as MockCache,
+            patch("zaza.tools.screener.screener.get_yf") as MockYFClient,
+            patch("zaza.tools.screener.screener.get_cache") as MockCache,
         ):
             mock_cache = MagicMock()
             mock_cache.get.return_value = cached_data
@@ -382,7 +382,7 @@ class TestScreenStocks:
 
         with (
             patch("zaza.tools.screener.screener.yf") as mock_yf,
-            patch("zaza.tools.screener.screener.YFinanceClient") as MockYFClient,
+            patch("zaza.tools.screener.screener.get_yf") as MockYFClient,
         ):
             mock_yf.screen.return_value = screen_resp
             mock_client = MagicMock()
@@ -486,7 +486,7 @@ class TestBuySellLevels:
 
         history_records = _make_history_records()
 
-        with patch("zaza.tools.screener.screener.YFinanceClient") as MockYFClient:
+        with patch("zaza.tools.screener.screener.get_yf") as MockYFClient:
             mock_client = MagicMock()
             mock_client.get_history.return_value = history_records
             MockYFClient.return_value = mock_client
@@ -548,7 +548,7 @@ class TestBuySellLevels:
 
         from zaza.tools.screener.screener import register
 
-        with patch("zaza.tools.screener.screener.YFinanceClient") as MockYFClient:
+        with patch("zaza.tools.screener.screener.get_yf") as MockYFClient:
             mock_client = MagicMock()
             mock_client.get_history.return_value = []
             MockYFClient.return_value = mock_client
@@ -572,8 +572,8 @@ class TestBuySellLevels:
         history_records = _make_history_records()
 
         with (
-            patch("zaza.tools.screener.screener.YFinanceClient") as MockYFClient,
-            patch("zaza.tools.screener.screener.FileCache") as MockCache,
+            patch("zaza.tools.screener.screener.get_yf") as MockYFClient,
+            patch("zaza.tools.screener.screener.get_cache") as MockCache,
         ):
             mock_client = MagicMock()
             mock_client.get_history.return_value = history_records
@@ -784,8 +784,8 @@ class TestPeriodIsOneYear:
         history_records = _make_history_records(250)
 
         with (
-            patch("zaza.tools.screener.screener.YFinanceClient") as MockYFClient,
-            patch("zaza.tools.screener.screener.FileCache") as MockCache,
+            patch("zaza.tools.screener.screener.get_yf") as MockYFClient,
+            patch("zaza.tools.screener.screener.get_cache") as MockCache,
         ):
             mock_client = MagicMock()
             mock_client.get_history.return_value = history_records
@@ -901,8 +901,8 @@ class TestBuySellLevelsEdgeCases:
         short_records = _make_history_records(3)
 
         with (
-            patch("zaza.tools.screener.screener.YFinanceClient") as MockYFClient,
-            patch("zaza.tools.screener.screener.FileCache") as MockCache,
+            patch("zaza.tools.screener.screener.get_yf") as MockYFClient,
+            patch("zaza.tools.screener.screener.get_cache") as MockCache,
         ):
             mock_client = MagicMock()
             mock_client.get_history.return_value = short_records
@@ -938,8 +938,8 @@ class TestBuySellLevelsFixed:
         history_records = _make_history_records(100)
 
         with (
-            patch("zaza.tools.screener.screener.YFinanceClient") as MockYFClient,
-            patch("zaza.tools.screener.screener.FileCache") as MockCache,
+            patch("zaza.tools.screener.screener.get_yf") as MockYFClient,
+            patch("zaza.tools.screener.screener.get_cache") as MockCache,
         ):
             mock_client = MagicMock()
             mock_client.get_history.return_value = history_records
@@ -981,8 +981,8 @@ class TestBuySellZoneInversionProtection:
         history_records = _make_history_records(100)
 
         with (
-            patch("zaza.tools.screener.screener.YFinanceClient") as MockYFClient,
-            patch("zaza.tools.screener.screener.FileCache") as MockCache,
+            patch("zaza.tools.screener.screener.get_yf") as MockYFClient,
+            patch("zaza.tools.screener.screener.get_cache") as MockCache,
         ):
             mock_client = MagicMock()
             mock_client.get_history.return_value = history_records
@@ -1013,8 +1013,8 @@ class TestBuySellZoneInversionProtection:
         history_records = _make_history_records(100)
 
         with (
-            patch("zaza.tools.screener.screener.YFinanceClient") as MockYFClient,
-            patch("zaza.tools.screener.screener.FileCache") as MockCache,
+            patch("zaza.tools.screener.screener.get_yf") as MockYFClient,
+            patch("zaza.tools.screener.screener.get_cache") as MockCache,
         ):
             mock_client = MagicMock()
             mock_client.get_history.return_value = history_records
@@ -1150,12 +1150,12 @@ class TestFileCacheMocking:
 
     @pytest.mark.asyncio
     async def test_register_with_mocked_cache_does_not_touch_disk(self) -> None:
-        """register() must use the mocked FileCache, not create real cache files."""
+        """register() must use the mocked cache, not create real cache files."""
         from mcp.server.fastmcp import FastMCP
 
         with (
-            patch("zaza.tools.screener.screener.FileCache") as MockCache,
-            patch("zaza.tools.screener.screener.YFinanceClient") as MockYFClient,
+            patch("zaza.tools.screener.screener.get_cache") as MockCache,
+            patch("zaza.tools.screener.screener.get_yf") as MockYFClient,
         ):
             mock_cache = MagicMock()
             MockCache.return_value = mock_cache
@@ -1166,7 +1166,7 @@ class TestFileCacheMocking:
             from zaza.tools.screener.screener import register
             register(mcp)
 
-        # FileCache was called exactly once (in register)
+        # get_cache was called exactly once (in register)
         MockCache.assert_called_once()
 
 
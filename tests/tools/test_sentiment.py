@@ -286,6 +286,38 @@ class TestGetSocialSentiment:
         call_args = mock_cache.set.call_args
         assert call_args[0][1] == "social_sentiment"
 
+    @patch("zaza.tools.sentiment.social.get_reddit_client_secret", return_value="fake_secret")
+    @patch("zaza.tools.sentiment.social.get_reddit_client_id", return_value="fake_id")
+    @patch("zaza.tools.sentiment.social.has_reddit_credentials", return_value=True)
+    @patch("zaza.tools.sentiment.social.RedditClient")
+    @patch("zaza.tools.sentiment.social.StockTwitsClient")
+    async def test_reddit_failure_keeps_stocktwits(
+        self,
+        MockStockTwits: MagicMock,
+        MockReddit: MagicMock,
+        mock_has_creds: MagicMock,
+        mock_get_id: MagicMock,
+        mock_get_secret: MagicMock,
+        mock_cache: MagicMock,
+    ) -> None:
+        """A Reddit error is reported per source while StockTwits still scores."""
+        MockReddit.side_effect = RuntimeError("praw unavailable")
+
+        st_instance = MagicMock()
+        st_instance.get_ticker_stream = AsyncMock(return_value=FAKE_STOCKTWITS)
+        MockStockTwits.return_value = st_instance
+
+        from zaza.tools.sentiment.social import register
+        mcp = MagicMock()
+        tools: dict[str, Any] = {}
+        mcp.tool.return_value = lambda fn: tools.update({fn.__name__: fn}) or fn
+        register(mcp, mock_cache)
+
+        result = json.loads(await tools["get_social_sentiment"]("AAPL"))
+        assert result["reddit"]["available"] is False
+        assert result["reddit"]["error"] == "praw unavailable"
+        assert result["stocktwits"]["message_count"] == 3
+
 
 # ===========================================================================
 # insider.py tests
@@ -344,6 +376,14 @@ class TestGetInsiderSentiment:
 class TestGetFearGreedIndex:
     """get_fear_greed_index tool tests."""
 
+    @pytest.fixture(autouse=True)
+    def _reset_http_client(self) -> Any:
+        import zaza.tools.sentiment.market as market
+
+        market._http = None
+        yield
+        market._http = None
+
     @patch("zaza.tools.sentiment.market.httpx.AsyncClient")
     async def test_returns_fear_greed_data(
         self, MockClient: MagicMock, mock_cache: MagicMock
@@ -355,8 +395,6 @@ class TestGetFearGreedIndex:
 
         mock_client = AsyncMock()
         mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
         MockClient.return_value = mock_client
 
         from zaza.tools.sentiment.market import register
@@ -382,8 +420,6 @@ class TestGetFearGreedIndex:
 
         mock_client = AsyncMock()
         mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
         MockClient.return_value = mock_client
 
         from zaza.tools.sentiment.market import register
@@ -404,8 +440,6 @@ class TestGetFearGreedIndex:
     ) -> None:
         mock_client = AsyncMock()
         mock_client.get = AsyncMock(side_effect=Exception("Connection refused"))
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
         MockClient.return_value = mock_client
 
         from zaza.tools.sentiment.market import register
@@ -428,8 +462,6 @@ class TestGetFearGreedIndex:
 
         mock_client = AsyncMock()
         mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
         MockClient.return_value = mock_client
 
         from zaza.tools.sentiment.market import register
@@ -443,6 +475,30 @@ class TestGetFearGreedIndex:
         call_args = mock_cache.set.call_args
         assert call_args[0][1] == "fear_greed"
 
+    @patch("zaza.tools.sentiment.market.httpx.AsyncClient")
+    async def test_fear_greed_reuses_http_client(
+        self, MockClient: MagicMock, mock_cache: MagicMock
+    ) -> None:
+        mock_response = MagicMock()
+        mock_response.json.return_value = FAKE_FEAR_GREED_RESPONSE
+        mock_response.raise_for_status = MagicMock()
+
+        mock_client = MagicMock()
+        mock_client.is_closed = False
+        mock_client.get = AsyncMock(return_value=mock_response)
+        MockClient.return_value = mock_client
+
+        from zaza.tools.sentiment.market import register
+        mcp = MagicMock()
+        tools: dict[str, Any] = {}
+        mcp.tool.return_value = lambda fn: tools.update({fn.__name__: fn}) or fn
+        register(mcp, mock_cache)
+
+        await tools["get_fear_greed_index"]()
+        await tools["get_fear_greed_index"]()
+        assert mock_client.get.await_count == 2
+        MockClient.assert_called_once()
+
 
 # ===========================================================================
 # __init__.py register_sentiment_tools tests
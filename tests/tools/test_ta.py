@@ -41,7 +41,7 @@ def _make_short_ohlcv_records(n: int = 10) -> list[dict]:
 
 
 def _capture_tools_with_mock_yf(register_module_path: str, mock_yf):
-    """Register TA tools with a mocked YFinanceClient, returning tool functions."""
+    """Register TA tools with a mocked shared yfinance client, returning tool functions."""
     mcp = MagicMock()
     tool_funcs = {}
 
@@ -53,12 +53,11 @@ def _capture_tools_with_mock_yf(register_module_path: str, mock_yf):
 
     mcp.tool = capture_tool
 
-    with patch(f"{register_module_path}.YFinanceClient", return_value=mock_yf):
-        with patch(f"{register_module_path}.FileCache"):
-            # Force re-import to pick up the mocked dependencies
-            import importlib
-            mod = importlib.import_module(register_module_path)
-            mod.register(mcp)
+    with patch(f"{register_module_path}.get_yf", return_value=mock_yf):
+        # Force re-import to pick up the mocked dependencies
+        import importlib
+        mod = importlib.import_module(register_module_path)
+        mod.register(mcp)
 
     return tool_funcs
 
@@ -426,6 +425,29 @@ async def test_patterns_empty_history():
     assert "error" in result
 
 
+def test_detect_patterns_classifies_candles():
+    """_detect_patterns flags doji, engulfing and flat candles as expected."""
+    from zaza.tools.ta.patterns import _detect_patterns
+
+    df = pd.DataFrame(
+        {
+            # green, red engulfing, green engulfing, doji, flat (skipped)
+            "Open": [100.0, 101.0, 98.5, 102.0, 102.0],
+            "High": [101.0, 101.5, 104.0, 104.0, 102.0],
+            "Low": [99.0, 98.0, 97.5, 100.0, 102.0],
+            "Close": [100.5, 98.5, 102.0, 102.1, 102.0],
+        },
+        index=pd.date_range("2024-01-01", periods=5, freq="B"),
+    )
+
+    found = [(p["pattern"], p["date"][:10]) for p in _detect_patterns(df)]
+    assert found == [
+        ("bearish_engulfing", "2024-01-02"),
+        ("bullish_engulfing", "2024-01-03"),
+        ("doji", "2024-01-04"),
+    ]
+
+
 # ---------------------------------------------------------------------------
 # get_money_flow tests
 # ---------------------------------------------------------------------------
@@ -534,3 +556,31 @@ async def test_relative_performance_empty_history():
     result = json.loads(result_str)
 
     assert "error" in result
+
+
+def test_beta_corr_matches_numpy():
+    """_beta_corr agrees with np.cov / np.corrcoef and handles flat series."""
+    from zaza.tools.ta.relative import _beta_corr
+
+    rng = np.random.default_rng(7)
+    sr = rng.normal(0, 0.01, 120)
+    tr = 1.3 * sr + rng.normal(0, 0.005, 120)
+
+    beta, corr = _beta_corr(tr, sr)
+    cov = np.cov(tr, sr)
+    assert beta == pytest.approx(cov[0, 1] / cov[1, 1], rel=1e-12)
+    assert corr == pytest.approx(np.corrcoef(tr, sr)[0, 1], rel=1e-12)
+
+    beta_flat, corr_flat = _beta_corr(tr, np.zeros(120))
+    assert beta_flat is None
+    assert np.isnan(corr_flat)
+
+
+def test_close_returns_matches_pct_change():
+    """_close_returns forward-fills missing closes like pandas 2.x pct_change()."""
+    from zaza.tools.ta.relative import _close_returns
+
+    df = pd.DataFrame({"Close": [np.nan, 100.0, 102.0, np.nan, 101.0, 99.5, 103.0]})
+    expected = df["Close"].ffill().pct_change().dropna().to_numpy()
+    assert len(expected) == 5
+    np.testing.assert_array_equal(_close_returns(df), expected)